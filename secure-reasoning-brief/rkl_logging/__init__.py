@@ -37,6 +37,7 @@ __author__ = "Resonant Knowledge Lab"
 from .structured_logger import StructuredLogger
 from .utils.hashing import sha256_text, sha256_dict, sha256_file
 from .schemas import SCHEMAS, validate_record
+from .records import LogRecord, record_class
 from .utils.privacy import sanitize_for_research, anonymize_for_public
 
 __all__ = [
@@ -46,6 +47,8 @@ __all__ = [
     "sha256_file",
     "SCHEMAS",
     "validate_record",
+    "LogRecord",
+    "record_class",
     "sanitize_for_research",
     "anonymize_for_public"
 ]
@@ -0,0 +1,468 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for rkl_logging.
+
+Batch builders: compares the legacy pandas.DataFrame -> Parquet path with the
+Arrow-native ColumnarBatchBuilder on synthetic records shaped like the ones
+the brief pipeline logs (including nested steps / gpus / quality_dimensions).
+
+Logger: end-to-end StructuredLogger.log() throughput and per-call latency
+(p50/p95/p99, including the calls that trigger a batch write) on a mixed
+stream of every artifact in SCHEMAS. One factor is varied at a time from a
+baseline of Parquet, validation on, one thread and --batch-size:
+
+- batch_size:  each of --batch-sizes
+- format:      parquet, parquet-rolling, ndjson
+- validation:  on, off
+- threads:     each of --threads, logging concurrently into one logger
+- artifact:    each artifact on its own
+
+Every result row has the same keys, so --json output can be diffed across
+commits as the baseline for logger optimizations.
+
+Usage:
+    python -m rkl_logging.benchmark [--suite all|builders|logger] [--records N]
+        [--batch-size N] [--batch-sizes 10,100,1000] [--threads 1,2,4,8,16] [--json]
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+# Allow running as a script from inside rkl_logging/
+parent_dir = str(Path(__file__).parent.parent)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+from rkl_logging.columnar import ARROW_AVAILABLE, ColumnarBatchBuilder
+from rkl_logging.schemas import SCHEMAS
+from rkl_logging.structured_logger import PARQUET_AVAILABLE, StructuredLogger
+from rkl_logging.utils.hashing import sha256_text
+
+try:
+    import pandas as pd
+    PANDAS_AVAILABLE = True
+except ImportError:
+    PANDAS_AVAILABLE = False
+
+
+BUILDER_ARTIFACTS = [
+    "execution_context",
+    "secure_reasoning_trace",
+    "system_state",
+    "quality_trajectories"
+]
+
+
+def synthetic_record(artifact_type: str, i: int) -> Dict[str, Any]:
+    """Generate a realistic record for an artifact (deterministic for a given i)."""
+    session_id = f"bench-session-{i // 100}"
+    timestamp = "2025-11-11T09:15:23Z"
+
+    if artifact_type == "execution_context":
+        return {
+            "timestamp": timestamp,
+            "session_id": session_id,
+            "turn_id": i,
+            "agent_id": ("summarizer", "lay_translator", "metadata_extractor")[i % 3],
+            "model_id": "llama3.2:3b",
+            "model_rev": "3b",
+            "quant": "q4",
+            "temp": 0.7,
+            "top_p": 1.0,
+            "ctx_tokens_used": 1800 + i % 400,
+            "gen_tokens": 120 + i % 80,
+            "tool_lat_ms": 4000 + i % 3000,
+            "prompt_id_hash": sha256_text(f"prompt-{i}"),
+            "system_prompt_hash": sha256_text("system"),
+            "token_estimation": "api",
+            "prompt_preview": "Analyze this AI research paper " * 20,
+            "response_preview": "The paper proposes " * 30,
+            "artifact_id": sha256_text(f"link-{i // 3}")
+        }
+
+    if artifact_type == "secure_reasoning_trace":
+        return {
+            "session_id": session_id,
+            "task_id": sha256_text(f"link-{i}"),
+            "turn_id": i,
+            "steps": [
+                {
+                    "step_index": step,
+                    "phase": ("observe", "act", "verify")[step],
+                    "agent_id": ("metadata_extractor", "summarizer", "lay_translator")[step],
+                    "input_hash": sha256_text(f"in-{i}-{step}"),
+                    "output_hash": sha256_text(f"out-{i}-{step}"),
+                    "verifier_verdict": "n/a",
+                    "citations": [],
+                    "start_t": 1700000000000 + i * 1000 + step * 100,
+                    "end_t": 1700000000050 + i * 1000 + step * 100,
+                    "duration_ms": 50
+                }
+                for step in range(3)
+            ]
+        }
+
+    if artifact_type == "system_state":
+        return {
+            "session_id": session_id,
+            "stage": "start_fetch" if i % 2 == 0 else "done_fetch",
+            "host": "betty-node-1",
+            "platform": "Linux-6.1-x86_64",
+            "cpu_percent": 12.5 + i % 50,
+            "load1": 0.5, "load5": 0.4, "load15": 0.3,
+            "mem_total_bytes": 64 * 1024 ** 3,
+            "mem_used_bytes": 20 * 1024 ** 3 + i,
+            "mem_free_bytes": 44 * 1024 ** 3 - i,
+            "mem_percent": 31.2,
+            "gpus": [
+                {
+                    "uuid": f"GPU-{g}", "name": "RTX 4090", "util_percent": 80.0,
+                    "mem_used_mb": 12000.0, "mem_total_mb": 24564.0, "temp_c": 65.0,
+                    "power_w": 300.0, "power_cap_w": 450.0, "pstate": "P2",
+                    "sm_clock_mhz": 2520.0, "mem_clock_mhz": 10501.0, "driver_version": "550.54"
+                }
+                for g in range(2)
+            ],
+            "gpu_count": 2,
+            "disk_io": {"read_bytes": i * 10, "write_bytes": i * 20, "read_time_ms": i, "write_time_ms": i},
+            "proc_mem_bytes": {"rss": 300_000_000 + i, "vms": 900_000_000 + i}
+        }
+
+    if artifact_type == "quality_trajectories":
+        return {
+            "session_id": session_id,
+            "artifact_id": sha256_text(f"link-{i}"),
+            "version": 1,
+            "score_name": "summary_presence",
+            "score": 1.0,
+            "evaluator_id": "pipeline",
+            "reason_tag": "non_empty_fields",
+            "time_to_next_version": 0,
+            "quality_dimensions": {
+                "completeness": 1.0,
+                "technical_depth": (i % 600) / 600.0,
+                "clarity": (i % 400) / 400.0,
+                "metadata_richness": 0.8
+            },
+            "metrics": {
+                "technical_summary_length": i % 600,
+                "lay_explanation_length": i % 400,
+                "tags_count": 4
+            }
+        }
+
+    if artifact_type in ("reasoning_graph_edge", "agent_graph"):
+        return {
+            "session_id": session_id,
+            "edge_id": sha256_text(f"edge-{i}")[:36],
+            "timestamp": timestamp,
+            "t": 1700000000000 + i * 1000,
+            "from_agent": ("feed_monitor", "summarizer", "hybrid_router")[i % 3],
+            "to_agent": ("summarizer", "lay_translator", "gemini_qa")[i % 3],
+            "msg_type": "act",
+            "intent_tag": "summarize_article",
+            "content_hash": sha256_text(f"content-{i}"),
+            "latency_ms": 900 + i % 500,
+            "retry_count": i % 2,
+            "route_reason": "static:default_local"
+        }
+
+    if artifact_type in ("boundary_event", "boundary_events"):
+        return {
+            "event_id": sha256_text(f"boundary-{i}")[:36],
+            "timestamp": timestamp,
+            "t": 1700000000000 + i * 1000,
+            "session_id": session_id,
+            "agent_id": "summarizer",
+            "rule_id": "type3_processing_boundary",
+            "trigger_tag": "local_model_call",
+            "context_tag": "article_summarization",
+            "action": "allow"
+        }
+
+    if artifact_type == "governance_ledger":
+        return {
+            "publish_id": f"pub-{i:06d}",
+            "timestamp": timestamp,
+            "artifact_ids": [sha256_text(f"link-{i}-{a}") for a in range(20)],
+            "contributing_agent_ids": ["feed_monitor", "summarizer", "lay_translator", "brief_formatter"],
+            "verification_hashes": [sha256_text(f"brief-{i}")],
+            "human_signoff_id": "operator",
+            "release_commit_sha": sha256_text(f"commit-{i}")[:40],
+            "quality_score": 0.85,
+            "type3_verified": True,
+            "care_compliance_verified": True
+        }
+
+    if artifact_type == "retrieval_provenance":
+        return {
+            "session_id": session_id,
+            "feed_name": f"Feed {i % 12}",
+            "feed_url_hash": sha256_text(f"feed-{i % 12}"),
+            "candidate_count": 40,
+            "selected_count": 8,
+            "candidate_hashes": [sha256_text(f"cand-{i}-{c}") for c in range(40)],
+            "selected_hashes": [sha256_text(f"cand-{i}-{c}") for c in range(8)],
+            "cutoff_date": "2025-11-04",
+            "category": "research",
+            "fetch_latency_ms": 300 + i % 700,
+            "feed_cache": ("miss", "not_modified", "unchanged")[i % 3]
+        }
+
+    if artifact_type == "failure_snapshots":
+        return {
+            "session_id": session_id,
+            "reason": "empty_summary",
+            "failed_count": 1 + i % 3,
+            "failed_titles": [f"Article {i}-{n}" for n in range(1 + i % 3)]
+        }
+
+    if artifact_type == "hallucination_matrix":
+        return {
+            "session_id": session_id,
+            "artifact_id": sha256_text(f"link-{i}"),
+            "verdict": ("pass", "pass", "uncertain", "fail")[i % 4],
+            "method": "gemini_qa",
+            "confidence": 0.85,
+            "error_type": "none",
+            "notes": "Summary matches the abstract.",
+            "theme_score": (i % 100) / 100.0,
+            "theme_verdict": "pass",
+            "theme_threshold": 0.6
+        }
+
+    if artifact_type == "human_interventions":
+        return {
+            "session_id": session_id,
+            "event_id": sha256_text(f"intervention-{i}")[:36],
+            "t": 1700000000000 + i * 1000,
+            "human_role": "operator",
+            "intervention_type": ("rerun", "approve", "edit")[i % 3],
+            "target_turn_id": i,
+            "delta_metrics": {"articles": i % 20},
+            "rationale_tag": "manual_review"
+        }
+
+    raise ValueError(f"No synthetic generator for artifact: {artifact_type}")
+
+
+def _time_batches(write_batch: Callable[[Path, List[Dict[str, Any]]], None],
+                  records: List[Dict[str, Any]], batch_size: int, out_dir: Path) -> float:
+    """Write records in batches with write_batch; return elapsed seconds."""
+    start = time.perf_counter()
+    for n, offset in enumerate(range(0, len(records), batch_size)):
+        write_batch(out_dir / f"batch_{n:06d}.parquet", records[offset:offset + batch_size])
+    return time.perf_counter() - start
+
+
+def bench_batch_builders(num_records: int = 5000, batch_size: int = 100,
+                         artifacts: List[str] = None) -> List[Dict[str, Any]]:
+    """
+    Compare pandas and Arrow-native Parquet batch writing.
+
+    Returns:
+        One result dict per (artifact, path) with records/sec
+    """
+    artifacts = artifacts or BUILDER_ARTIFACTS
+    results = []
+
+    for artifact_type in artifacts:
+        records = [synthetic_record(artifact_type, i) for i in range(num_records)]
+        paths = {}
+        if PANDAS_AVAILABLE:
+            paths["pandas"] = lambda path, batch: pd.DataFrame(batch).to_parquet(path, index=False)
+        if ARROW_AVAILABLE:
+            paths["columnar"] = (
+                lambda path, batch, a=artifact_type:
+                ColumnarBatchBuilder(a).extend(batch).write_parquet(path)
+            )
+
+        for name, write_batch in paths.items():
+            with tempfile.TemporaryDirectory() as tmpdir:
+                elapsed = _time_batches(write_batch, records, batch_size, Path(tmpdir))
+            results.append({
+                "benchmark": "batch_builder",
+                "artifact": artifact_type,
+                "path": name,
+                "records": num_records,
+                "batch_size": batch_size,
+                "elapsed_s": round(elapsed, 4),
+                "records_per_sec": round(num_records / elapsed, 1) if elapsed > 0 else None
+            })
+
+    return results
+
+
+# Canonical artifact names (SCHEMAS also registers plural/alias keys)
+LOGGER_ARTIFACTS = [a for a in SCHEMAS if a not in ("agent_graph", "boundary_events")]
+
+FORMATS = {
+    "parquet": {"file_format": "parquet"},
+    "parquet-rolling": {"file_format": "parquet", "rolling_files": True},
+    "ndjson": {"file_format": "ndjson"}
+}
+
+
+def _percentile(sorted_values: List[int], q: float) -> float:
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+
+def run_logger(records: List[Any], batch_size: int = 100, file_format: str = "parquet",
+               validate: bool = True, threads: int = 1) -> Dict[str, Any]:
+    """
+    Log (artifact_type, record) pairs through a fresh StructuredLogger.
+
+    Records are split round-robin across threads. Elapsed time runs from the
+    first log() call until close() has written everything.
+
+    Returns:
+        records_per_sec, elapsed_s and per-call latency percentiles in microseconds
+    """
+    latencies: List[List[int]] = [[] for _ in range(threads)]
+    barrier = threading.Barrier(threads + 1)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        logger = StructuredLogger(
+            base_dir=tmpdir, batch_size=batch_size, validate_schema=validate,
+            auto_manifest=False, **FORMATS[file_format]
+        )
+
+        def worker(n: int) -> None:
+            out = latencies[n]
+            mine = records[n::threads]
+            barrier.wait()
+            for artifact_type, record in mine:
+                start = time.perf_counter_ns()
+                logger.log(artifact_type, record)
+                out.append(time.perf_counter_ns() - start)
+
+        workers = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+        for w in workers:
+            w.start()
+        barrier.wait()
+        start = time.perf_counter()
+        for w in workers:
+            w.join()
+        logger.close()
+        elapsed = time.perf_counter() - start
+
+    merged = sorted(ns for per_thread in latencies for ns in per_thread)
+    return {
+        "records": len(records),
+        "elapsed_s": round(elapsed, 4),
+        "records_per_sec": round(len(records) / elapsed, 1) if elapsed > 0 else None,
+        "p50_us": round(_percentile(merged, 0.50) / 1000, 1),
+        "p95_us": round(_percentile(merged, 0.95) / 1000, 1),
+        "p99_us": round(_percentile(merged, 0.99) / 1000, 1),
+        "max_us": round(merged[-1] / 1000, 1)
+    }
+
+
+def bench_logger(num_records: int = 5000, batch_size: int = 100,
+                 batch_sizes: List[int] = None, thread_counts: List[int] = None,
+                 artifacts: List[str] = None) -> List[Dict[str, Any]]:
+    """
+    Sweep StructuredLogger.log() over batch size, format, validation, threads and artifact.
+
+    Returns:
+        One result dict per configuration (same keys for every row)
+    """
+    artifacts = artifacts or LOGGER_ARTIFACTS
+    batch_sizes = batch_sizes or [10, 100, 1000]
+    thread_counts = thread_counts or [1, 2, 4, 8, 16]
+    formats = [f for f in FORMATS if f == "ndjson" or PARQUET_AVAILABLE]
+    if not ARROW_AVAILABLE:
+        formats = [f for f in formats if f != "parquet-rolling"]
+    baseline = {"batch_size": batch_size, "file_format": formats[0], "validate": True, "threads": 1}
+
+    mixed = [(artifacts[i % len(artifacts)], synthetic_record(artifacts[i % len(artifacts)], i))
+             for i in range(num_records)]
+    sweeps = (
+        [("batch_size", "mixed", mixed, {"batch_size": b}) for b in batch_sizes]
+        + [("format", "mixed", mixed, {"file_format": f}) for f in formats]
+        + [("validation", "mixed", mixed, {"validate": v}) for v in (True, False)]
+        + [("threads", "mixed", mixed, {"threads": t}) for t in thread_counts]
+        + [("artifact", a, [(a, synthetic_record(a, i)) for i in range(num_records)], {})
+           for a in artifacts]
+    )
+
+    results = []
+    for sweep, artifact, records, overrides in sweeps:
+        config = dict(baseline, **overrides)
+        results.append({
+            "benchmark": "logger",
+            "sweep": sweep,
+            "artifact": artifact,
+            **config,
+            **run_logger(records, **config)
+        })
+    return results
+
+
+def print_results(results: List[Dict[str, Any]]) -> None:
+    """Print results as fixed-width tables (one per benchmark)."""
+    builders = [r for r in results if r["benchmark"] == "batch_builder"]
+    loggers = [r for r in results if r["benchmark"] == "logger"]
+
+    if builders:
+        print(f"{'benchmark':<15} {'artifact':<24} {'path':<10} {'records':>8} {'batch':>6} {'rec/s':>12}")
+        print("-" * 80)
+        for r in builders:
+            print(
+                f"{r['benchmark']:<15} {r['artifact']:<24} {r['path']:<10} "
+                f"{r['records']:>8} {r['batch_size']:>6} {r['records_per_sec'] or 0:>12,.1f}"
+            )
+
+    if loggers:
+        if builders:
+            print()
+        print(
+            f"{'sweep':<11} {'artifact':<24} {'format':<16} {'valid':<5} {'batch':>6} {'thr':>4} "
+            f"{'rec/s':>11} {'p50_us':>8} {'p95_us':>8} {'p99_us':>9}"
+        )
+        print("-" * 110)
+        for r in loggers:
+            print(
+                f"{r['sweep']:<11} {r['artifact']:<24} {r['file_format']:<16} {'on' if r['validate'] else 'off':<5} "
+                f"{r['batch_size']:>6} {r['threads']:>4} {r['records_per_sec'] or 0:>11,.1f} "
+                f"{r['p50_us']:>8.1f} {r['p95_us']:>8.1f} {r['p99_us']:>9.1f}"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="rkl_logging benchmarks")
+    parser.add_argument("--records", type=int, default=5000, help="Records per artifact (default: 5000)")
+    parser.add_argument("--batch-size", type=int, default=100, help="Records per batch (default: 100)")
+    parser.add_argument("--suite", choices=["all", "builders", "logger"], default="all",
+                        help="Benchmarks to run (default: all)")
+    parser.add_argument("--batch-sizes", default="10,100,1000",
+                        help="Logger batch-size sweep (default: 10,100,1000)")
+    parser.add_argument("--threads", default="1,2,4,8,16",
+                        help="Logger thread-count sweep (default: 1,2,4,8,16)")
+    parser.add_argument("--json", action="store_true", help="Emit results as JSON")
+    args = parser.parse_args()
+
+    results = []
+    if args.suite in ("all", "builders"):
+        results += bench_batch_builders(args.records, args.batch_size)
+    if args.suite in ("all", "logger"):
+        results += bench_logger(
+            args.records, args.batch_size,
+            batch_sizes=[int(b) for b in args.batch_sizes.split(",")],
+            thread_counts=[int(t) for t in args.threads.split(",")]
+        )
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print_results(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""
+Arrow-native columnar batch builder.
+
+Replaces the per-batch pandas.DataFrame construction in StructuredLogger:
+records are distributed into per-field value columns, and each column is
+converted with a single pyarrow.array() call using the type declared in the
+artifact's schema (rkl_logging/schemas/*). Only fields without a declared
+scalar type (lists, dicts, undeclared extras) fall back to Arrow inference,
+which keeps nested fields such as steps, gpus and quality_dimensions as real
+list/struct columns.
+
+Columns that Parquet cannot store as inferred (mixed types across records,
+structs with no fields such as an empty delta_metrics dict) are written as
+JSON-encoded strings instead of failing the whole batch.
+"""
+
+import json
+from typing import Any, Dict, Iterable, List, Optional
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    ARROW_AVAILABLE = True
+except ImportError:
+    ARROW_AVAILABLE = False
+
+from .schemas import SCHEMAS
+
+
+def arrow_type_for(py_type: Any) -> Optional["pa.DataType"]:
+    """
+    Map a schema field_types entry to an Arrow type.
+
+    Args:
+        py_type: Python type or tuple of types from a schema's field_types
+
+    Returns:
+        Arrow type, or None if the column should be inferred from the data
+        (list, dict and mixed declarations)
+    """
+    if isinstance(py_type, tuple):
+        types = {t for t in py_type if t is not type(None)}
+        if types and types <= {int, float}:
+            return pa.float64()
+        if len(types) == 1:
+            return arrow_type_for(types.pop())
+        return None
+
+    if py_type is bool:
+        return pa.bool_()
+    if py_type is int:
+        return pa.int64()
+    if py_type is float:
+        return pa.float64()
+    if py_type is str:
+        return pa.string()
+    return None
+
+
+def _has_empty_struct(arrow_type: "pa.DataType") -> bool:
+    """True if the type contains a struct with no children (unwritable in Parquet)."""
+    if pa.types.is_struct(arrow_type):
+        if arrow_type.num_fields == 0:
+            return True
+        return any(_has_empty_struct(arrow_type.field(i).type) for i in range(arrow_type.num_fields))
+    if pa.types.is_list(arrow_type) or pa.types.is_large_list(arrow_type):
+        return _has_empty_struct(arrow_type.value_type)
+    return False
+
+
+def _json_column(values: List[Any]) -> "pa.Array":
+    """Encode a column that Arrow/Parquet cannot store natively as JSON strings."""
+    return pa.array(
+        [
+            None if v is None else v if isinstance(v, str) else json.dumps(v, default=str)
+            for v in values
+        ],
+        type=pa.string()
+    )
+
+
+class ColumnarBatchBuilder:
+    """
+    Build an Arrow table for one artifact batch without going through pandas.
+
+    Example:
+        builder = ColumnarBatchBuilder("execution_context")
+        builder.extend(records)
+        builder.write_parquet("batch.parquet")
+    """
+
+    def __init__(self, artifact_type: str, schema: Optional[Dict[str, Any]] = None):
+        """
+        Initialize builder.
+
+        Args:
+            artifact_type: Artifact key in SCHEMAS (unknown artifacts infer every column)
+            schema: Override schema (default: SCHEMAS[artifact_type])
+        """
+        if not ARROW_AVAILABLE:
+            raise ImportError("pyarrow required for columnar batches. Install: pip install pyarrow")
+
+        self.artifact_type = artifact_type
+        schema = schema if schema is not None else SCHEMAS.get(artifact_type, {})
+        self._declared: Dict[str, "pa.DataType"] = {}
+        for field, py_type in schema.get("field_types", {}).items():
+            arrow_type = arrow_type_for(py_type)
+            if arrow_type is not None:
+                self._declared[field] = arrow_type
+
+        self._columns: Dict[str, List[Any]] = {}
+        self._num_rows = 0
+
+    def __len__(self) -> int:
+        return self._num_rows
+
+    def append(self, record: Dict[str, Any]) -> None:
+        """Append one record (dict or LogRecord); fields missing from it become nulls."""
+        n = self._num_rows
+        columns = self._columns
+        items = record.items()
+        for field, value in items:
+            column = columns.get(field)
+            if column is None:
+                column = columns[field] = [None] * n
+            column.append(value)
+        self._num_rows = n + 1
+        if len(items) != len(columns):
+            for column in columns.values():
+                if len(column) == n:
+                    column.append(None)
+
+    def extend(self, records: Iterable[Dict[str, Any]]) -> "ColumnarBatchBuilder":
+        """Append many records. Returns self for chaining."""
+        for record in records:
+            self.append(record)
+        return self
+
+    def _build_column(self, field: str, values: List[Any]) -> "pa.Array":
+        """Convert one column, preferring the declared type over inference."""
+        declared = self._declared.get(field)
+        if declared is not None:
+            try:
+                return pa.array(values, type=declared)
+            except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError, TypeError):
+                pass  # Value doesn't match the schema; let Arrow infer instead
+
+        try:
+            array = pa.array(values)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError, TypeError):
+            return _json_column(values)
+
+        if _has_empty_struct(array.type):
+            return _json_column(values)
+        return array
+
+    def to_table(self) -> "pa.Table":
+        """Materialize buffered records as an Arrow table (column order = first appearance)."""
+        names = list(self._columns.keys())
+        arrays = [self._build_column(name, self._columns[name]) for name in names]
+        return pa.Table.from_arrays(arrays, names=names)
+
+    def write_parquet(self, file_path, compression: str = "snappy") -> None:
+        """Write buffered records to a Parquet file."""
+        pq.write_table(self.to_table(), str(file_path), compression=compression)
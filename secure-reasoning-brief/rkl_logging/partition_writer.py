@@ -0,0 +1,112 @@
+"""
+Partition writer for StructuredLogger batches.
+
+Resolves the artifact/YYYY/MM/DD partition for each batch and gives it a
+collision-proof file name:
+
+    {artifact}_{HHMMSS}_{host}-{pid}_{seq}.{ext}
+
+- HHMMSS keeps files roughly chronological when sorted by name
+- host + pid separate concurrent processes writing the same partition
+- seq is a per-process, per-artifact monotonic counter, so two batches
+  flushed within the same second never share a name
+
+Files are written to a hidden temp file in the same directory and moved into
+place with os.replace(), so readers (fix_manifest.py, health_check.py, DuckDB)
+never see a partially written batch.
+"""
+
+import os
+import re
+import socket
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+
+
+def _writer_id() -> str:
+    """Host + process id, restricted to filename-safe characters."""
+    host = re.sub(r"[^A-Za-z0-9.-]", "-", socket.gethostname() or "host")
+    return f"{host}-{os.getpid()}"
+
+
+class PartitionWriter:
+    """
+    Allocates output paths for batches and commits them atomically.
+
+    Example:
+        writer = PartitionWriter("./data/research")
+        path = writer.next_path("execution_context", "parquet")
+        with writer.atomic(path) as tmp_path:
+            write_records(tmp_path, records)
+        # path now exists; tmp_path is gone
+    """
+
+    def __init__(self, base_dir: str, writer_id: Optional[str] = None):
+        """
+        Initialize PartitionWriter.
+
+        Args:
+            base_dir: Base directory for data storage
+            writer_id: Override for the host/process component of file names
+        """
+        self.base_dir = Path(base_dir)
+        self.writer_id = writer_id or _writer_id()
+        self._seq: Dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def partition_dir(self, artifact_type: str, when: Optional[datetime] = None) -> Path:
+        """Return (and create) artifact/YYYY/MM/DD for the given UTC time."""
+        when = when or datetime.utcnow()
+        output_dir = (
+            self.base_dir / artifact_type
+            / when.strftime("%Y") / when.strftime("%m") / when.strftime("%d")
+        )
+        output_dir.mkdir(parents=True, exist_ok=True)
+        return output_dir
+
+    def next_path(self, artifact_type: str, ext: str, when: Optional[datetime] = None) -> Path:
+        """
+        Allocate a unique output path for the next batch of an artifact.
+
+        Args:
+            artifact_type: Artifact being written (e.g., "execution_context")
+            ext: File extension without dot ("parquet" or "ndjson")
+            when: UTC time used for partitioning and naming (default: now)
+
+        Returns:
+            Path that no other batch from any process will be assigned
+        """
+        when = when or datetime.utcnow()
+        with self._lock:
+            seq = self._seq[artifact_type]
+            self._seq[artifact_type] = seq + 1
+        name = f"{artifact_type}_{when.strftime('%H%M%S')}_{self.writer_id}_{seq:06d}.{ext}"
+        return self.partition_dir(artifact_type, when) / name
+
+    @staticmethod
+    def temp_path(final_path: Path) -> Path:
+        """Hidden temp file next to final_path (never matches *.parquet / *.ndjson)."""
+        return final_path.with_name(f".{final_path.name}.tmp")
+
+    @contextmanager
+    def atomic(self, final_path: Path) -> Iterator[Path]:
+        """
+        Yield a temp path to write to; move it to final_path on success.
+
+        The temp file is removed if the write raises, so a failed batch leaves
+        nothing behind for readers or the manifest fixer to count.
+        """
+        tmp_path = self.temp_path(final_path)
+        try:
+            yield tmp_path
+            os.replace(tmp_path, final_path)
+        except BaseException:
+            try:
+                tmp_path.unlink()
+            except FileNotFoundError:
+                pass
+            raise
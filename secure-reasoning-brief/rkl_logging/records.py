@@ -0,0 +1,217 @@
+"""
+Slotted record classes generated from the artifact schemas.
+
+record_class(artifact_type) returns a class with one __slots__ entry per field
+declared in the schema (required + optional + field_types), plus the fields
+StructuredLogger adds (rkl_version, timestamp, type3_compliant) and an
+_extras dict for anything undeclared. Compared with a dict literal:
+
+- no per-instance hash table: a buffered record costs roughly 8 bytes per slot
+- StructuredLogger.log() enriches it in place instead of copying it
+- it reads like a mapping (items(), get(), [], in, len), so validators,
+  ColumnarBatchBuilder and the async queue handle it unchanged
+
+Example:
+    ExecutionContext = record_class("execution_context")
+    logger.log("execution_context", ExecutionContext(
+        session_id="s1", turn_id=1, agent_id="summarizer", model_id="llama3.2:3b"
+    ))
+
+The logger takes ownership of a record passed to log(): don't reuse or
+modify it afterwards (it may still be sitting in a buffer).
+"""
+
+import keyword
+from typing import Any, Dict, Iterator, List, Tuple, Type
+
+from .schemas import SCHEMAS
+
+# Fields StructuredLogger fills in when absent (see StructuredLogger._enrich_record)
+ENRICHMENT_FIELDS = ("rkl_version", "timestamp", "type3_compliant")
+
+
+class _Unset:
+    """Marker for slots that were never assigned (the field is absent)."""
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "UNSET"
+
+    def __reduce__(self):
+        return "UNSET"
+
+
+UNSET = _Unset()
+
+
+class LogRecord:
+    """
+    Base class for generated record types. Behaves like a dict of its set fields.
+
+    Subclasses define artifact_type, _fields (slot names in schema order) and
+    generated __init__ / items() / shape_key() methods unrolled over the slots.
+    """
+
+    __slots__ = ("_extras",)
+
+    artifact_type: str = ""
+    _fields: Tuple[str, ...] = ()
+    _field_set: frozenset = frozenset()
+
+    def items(self) -> List[Tuple[str, Any]]:
+        """(field, value) pairs for set fields in slot order, then extras."""
+        return list(self._extras.items()) if self._extras else []
+
+    def shape_key(self) -> tuple:
+        """Hashable key of which fields are set and their value types (for validator caches)."""
+        extras = self._extras or {}
+        return (type(self), *extras, *map(type, extras.values()))
+
+    def keys(self) -> List[str]:
+        return [f for f, _ in self.items()]
+
+    def values(self) -> List[Any]:
+        return [v for _, v in self.items()]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys())
+
+    def __len__(self) -> int:
+        return len(self.items())
+
+    def __contains__(self, field: str) -> bool:
+        if field in self._field_set:
+            return getattr(self, field) is not UNSET
+        return bool(self._extras) and field in self._extras
+
+    def __getitem__(self, field: str) -> Any:
+        if field in self._field_set:
+            value = getattr(self, field)
+            if value is not UNSET:
+                return value
+        elif self._extras and field in self._extras:
+            return self._extras[field]
+        raise KeyError(field)
+
+    def __setitem__(self, field: str, value: Any) -> None:
+        if field in self._field_set:
+            setattr(self, field, value)
+        else:
+            if self._extras is None:
+                self._extras = {}
+            self._extras[field] = value
+
+    def __delitem__(self, field: str) -> None:
+        if field in self._field_set and getattr(self, field) is not UNSET:
+            setattr(self, field, UNSET)
+        elif self._extras and field in self._extras:
+            del self._extras[field]
+        else:
+            raise KeyError(field)
+
+    def get(self, field: str, default: Any = None) -> Any:
+        try:
+            return self[field]
+        except KeyError:
+            return default
+
+    def update(self, other: Dict[str, Any]) -> None:
+        for field, value in other.items():
+            self[field] = value
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(self.items())
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (LogRecord, dict)):
+            return self.to_dict() == dict(other.items())
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+
+def _class_name(artifact_type: str) -> str:
+    return "".join(part.capitalize() for part in artifact_type.split("_")) + "Record"
+
+
+def build_record_class(artifact_type: str, schema: Dict[str, Any]) -> Type[LogRecord]:
+    """
+    Generate a slotted LogRecord subclass for a schema.
+
+    Fields that aren't valid Python identifiers are not given slots; they
+    are still accepted and kept in the record's extras.
+    """
+    declared = (
+        list(schema.get("required_fields", []))
+        + list(schema.get("optional_fields", []))
+        + list(schema.get("field_types", {}))
+        + list(ENRICHMENT_FIELDS)
+    )
+    fields: List[str] = []
+    for field in declared:
+        if field not in fields and field.isidentifier() and not keyword.iskeyword(field) \
+                and not field.startswith("_") and not hasattr(LogRecord, field):
+            fields.append(field)
+
+    # Generated methods unrolled over the slots (like namedtuple/dataclass):
+    # straight-line attribute access is several times faster than looping
+    params = "".join(f"{f}=UNSET, " for f in fields)
+    source = f"def __init__(self, *, {params}**extras):\n"
+    source += "".join(f"    self.{f} = {f}\n" for f in fields)
+    source += "    self._extras = extras or None\n"
+
+    source += "def items(self):\n    pairs = []\n    append = pairs.append\n"
+    for f in fields:
+        source += f"    v = self.{f}\n    if v is not UNSET:\n        append(({f!r}, v))\n"
+    source += "    if self._extras:\n        pairs.extend(self._extras.items())\n    return pairs\n"
+
+    source += "def shape_key(self):\n    key = (cls"
+    source += "".join(f", type(self.{f})" for f in fields) + ")\n"
+    source += "    extras = self._extras\n"
+    source += "    return key + (*extras, *map(type, extras.values())) if extras else key\n"
+
+    namespace: Dict[str, Any] = {"UNSET": UNSET}
+    exec(source, namespace)
+
+    cls = type(_class_name(artifact_type), (LogRecord,), {
+        "__slots__": tuple(fields),
+        "__init__": namespace["__init__"],
+        "items": namespace["items"],
+        "shape_key": namespace["shape_key"],
+        "__module__": __name__,
+        "artifact_type": artifact_type,
+        "_fields": tuple(fields),
+        "_field_set": frozenset(fields),
+    })
+    namespace["cls"] = cls
+    return cls
+
+
+_CLASSES: Dict[str, Type[LogRecord]] = {}
+
+
+def record_class(artifact_type: str) -> Type[LogRecord]:
+    """
+    Slotted record class for an artifact in SCHEMAS (generated once, then cached).
+
+    Raises:
+        KeyError: Unknown artifact type
+    """
+    cls = _CLASSES.get(artifact_type)
+    if cls is None:
+        if artifact_type not in SCHEMAS:
+            raise KeyError(f"Unknown artifact type: {artifact_type}")
+        cls = _CLASSES[artifact_type] = build_record_class(artifact_type, SCHEMAS[artifact_type])
+    return cls
+
+
+def as_dict(record: Any) -> Dict[str, Any]:
+    """Plain dict for a LogRecord (dicts are returned as is)."""
+    return record.to_dict() if isinstance(record, LogRecord) else record
+
+
+__all__ = ["LogRecord", "UNSET", "record_class", "build_record_class", "as_dict"]
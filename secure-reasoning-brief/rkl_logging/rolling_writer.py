@@ -0,0 +1,215 @@
+"""
+Rolling Parquet writer for StructuredLogger.
+
+Instead of one tiny Parquet file per batch, keeps one pyarrow ParquetWriter
+open per artifact and appends batches as row groups. A file is finalized
+(footer written, temp file renamed into place) when it:
+
+- reaches max_file_bytes
+- has been open longer than max_file_age_s
+- would cross into a new UTC day partition
+- receives a batch whose columns don't fit the file's schema
+- or the logger is closed
+
+Open files live under a hidden temp name (see PartitionWriter.temp_path), so
+readers only ever see complete files. The trade-off: rows in a file that is
+still open are not on disk in readable form until it is finalized, so keep
+max_file_age_s short enough for your crash-loss tolerance.
+
+Not locked internally: calls for different artifacts may run concurrently,
+but callers must serialize calls for the same artifact (StructuredLogger
+holds that artifact's write lock).
+"""
+
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    ARROW_AVAILABLE = True
+except ImportError:
+    ARROW_AVAILABLE = False
+
+from .partition_writer import PartitionWriter
+
+
+class _OpenFile:
+    """State for one artifact's currently open Parquet file."""
+
+    def __init__(self, final_path: Path, tmp_path: Path, writer: "pq.ParquetWriter",
+                 schema: "pa.Schema", date_str: str):
+        self.final_path = final_path
+        self.tmp_path = tmp_path
+        self.writer = writer
+        self.schema = schema
+        self.date_str = date_str
+        self.opened_at = time.monotonic()
+        self.rows = 0
+        self.pending: List["pa.Table"] = []
+        self.pending_rows = 0
+
+
+class RollingParquetWriter:
+    """
+    Appends Arrow tables as row groups to one open file per artifact/day.
+
+    Example:
+        rolling = RollingParquetWriter(PartitionWriter("./data/research"))
+        rolling.write_table("execution_context", table)
+        for artifact, date_str, rows in rolling.close_all():
+            print(f"{artifact} {date_str}: {rows} rows finalized")
+    """
+
+    def __init__(
+        self,
+        partition_writer: PartitionWriter,
+        max_file_bytes: int = 64 * 1024 * 1024,
+        max_file_age_s: float = 600.0,
+        row_group_size: int = 10000,
+        compression: str = "snappy"
+    ):
+        """
+        Initialize RollingParquetWriter.
+
+        Args:
+            partition_writer: Allocates file names and temp paths
+            max_file_bytes: Roll over once a file reaches this size
+            max_file_age_s: Roll over once a file has been open this long
+            row_group_size: Rows buffered before a row group is written
+            compression: Parquet compression codec
+        """
+        if not ARROW_AVAILABLE:
+            raise ImportError("pyarrow required for rolling Parquet files. Install: pip install pyarrow")
+
+        self.partition_writer = partition_writer
+        self.max_file_bytes = max_file_bytes
+        self.max_file_age_s = max_file_age_s
+        self.row_group_size = row_group_size
+        self.compression = compression
+        self._open: Dict[str, _OpenFile] = {}
+
+    def write_table(self, artifact_type: str, table: "pa.Table",
+                    when: Optional[datetime] = None) -> List[Tuple[str, str, int]]:
+        """
+        Append a batch to the artifact's open file, rolling over if needed.
+
+        Args:
+            artifact_type: Artifact being written
+            table: Batch as an Arrow table
+            when: UTC time of the batch (default: now)
+
+        Returns:
+            List of (artifact_type, date_str, rows) for files finalized by this call
+        """
+        when = when or datetime.utcnow()
+        date_str = when.strftime("%Y-%m-%d")
+        finalized = []
+
+        current = self._open.get(artifact_type)
+        if current is not None:
+            conformed = self._conform(table, current.schema)
+            too_old = time.monotonic() - current.opened_at >= self.max_file_age_s
+            if conformed is None or current.date_str != date_str or too_old:
+                finalized.append(self._finalize(artifact_type))
+                current = None
+            else:
+                table = conformed
+
+        if current is None:
+            current = self._open_file(artifact_type, table.schema, when)
+
+        current.pending.append(table)
+        current.pending_rows += table.num_rows
+        if current.pending_rows >= self.row_group_size:
+            self._write_pending(current)
+
+        if self._file_size(current) >= self.max_file_bytes:
+            finalized.append(self._finalize(artifact_type))
+
+        return finalized
+
+    def close_artifact(self, artifact_type: str) -> Optional[Tuple[str, str, int]]:
+        """Finalize one artifact's open file, if any."""
+        if artifact_type not in self._open:
+            return None
+        return self._finalize(artifact_type)
+
+    def close_all(self) -> List[Tuple[str, str, int]]:
+        """Finalize every open file. Returns (artifact_type, date_str, rows) per file."""
+        return [self._finalize(artifact_type) for artifact_type in list(self._open.keys())]
+
+    def open_artifacts(self) -> List[str]:
+        """Artifacts that currently have an open (not yet finalized) file."""
+        return list(self._open.keys())
+
+    def _open_file(self, artifact_type: str, schema: "pa.Schema", when: datetime) -> _OpenFile:
+        final_path = self.partition_writer.next_path(artifact_type, "parquet", when)
+        tmp_path = self.partition_writer.temp_path(final_path)
+        writer = pq.ParquetWriter(str(tmp_path), schema, compression=self.compression)
+        open_file = _OpenFile(final_path, tmp_path, writer, schema, when.strftime("%Y-%m-%d"))
+        self._open[artifact_type] = open_file
+        return open_file
+
+    def _write_pending(self, open_file: _OpenFile) -> None:
+        """Write buffered batches as a single row group."""
+        if not open_file.pending:
+            return
+        table = (
+            open_file.pending[0] if len(open_file.pending) == 1
+            else pa.concat_tables(open_file.pending)
+        )
+        open_file.writer.write_table(table, row_group_size=max(table.num_rows, 1))
+        open_file.rows += table.num_rows
+        open_file.pending = []
+        open_file.pending_rows = 0
+
+    def _finalize(self, artifact_type: str) -> Tuple[str, str, int]:
+        """Flush pending rows, write the footer and move the file into place."""
+        open_file = self._open.pop(artifact_type)
+        try:
+            self._write_pending(open_file)
+        finally:
+            open_file.writer.close()
+        if open_file.rows:
+            open_file.tmp_path.replace(open_file.final_path)
+        else:
+            open_file.tmp_path.unlink(missing_ok=True)
+        return artifact_type, open_file.date_str, open_file.rows
+
+    @staticmethod
+    def _file_size(open_file: _OpenFile) -> int:
+        try:
+            return open_file.tmp_path.stat().st_size
+        except FileNotFoundError:
+            return 0
+
+    @staticmethod
+    def _conform(table: "pa.Table", schema: "pa.Schema") -> Optional["pa.Table"]:
+        """
+        Reshape a batch to an open file's schema.
+
+        Missing columns become nulls and castable type differences are cast.
+        Returns None if the batch has new columns or incompatible types, in
+        which case the caller rolls over to a new file with the batch's schema.
+        """
+        if table.schema.equals(schema):
+            return table
+        if any(name not in schema.names for name in table.schema.names):
+            return None
+
+        columns = []
+        for schema_field in schema:
+            if schema_field.name in table.schema.names:
+                column = table.column(schema_field.name)
+                if not column.type.equals(schema_field.type):
+                    try:
+                        column = column.cast(schema_field.type)
+                    except (pa.ArrowInvalid, pa.ArrowNotImplementedError, pa.ArrowTypeError):
+                        return None
+                columns.append(column)
+            else:
+                columns.append(pa.nulls(table.num_rows, type=schema_field.type))
+        return pa.Table.from_arrays(columns, schema=schema)
@@ -8,6 +8,9 @@ Each artifact type has a versioned schema defining:
 - Deprecated fields (for migration)
 """
 
+from typing import Dict, Optional
+
+from .compiler import CompiledSchema, compile_schema
 from .execution_context import EXECUTION_CONTEXT_SCHEMA
 from .agent_graph import AGENT_GRAPH_SCHEMA
 from .boundary_events import BOUNDARY_EVENTS_SCHEMA
@@ -41,13 +44,34 @@ SCHEMAS["agent_graph"] = AGENT_GRAPH_SCHEMA
 SCHEMAS["boundary_events"] = BOUNDARY_EVENTS_SCHEMA
 
 
+# Compiled validators, keyed by artifact type. Recompiled if SCHEMAS[key] is replaced.
+_COMPILED: Dict[str, CompiledSchema] = {}
+
+
+def get_validator(artifact_type: str) -> Optional[CompiledSchema]:
+    """
+    Precomputed validator for an artifact type (None if the type is unknown).
+
+    Example:
+        >>> validator = get_validator("execution_context")
+        >>> valid, errors, coerced = validator.validate(record, coerce=True)
+    """
+    schema = SCHEMAS.get(artifact_type)
+    if schema is None:
+        return None
+    compiled = _COMPILED.get(artifact_type)
+    if compiled is None or compiled.schema is not schema:
+        compiled = _COMPILED[artifact_type] = compile_schema(schema)
+    return compiled
+
+
 def validate_record(artifact_type: str, record: dict) -> tuple[bool, list[str]]:
     """
     Validate a log record against its schema.
 
     Args:
         artifact_type: Type of artifact (e.g., "execution_context")
-        record: Record to validate
+        record: Record to validate (not modified)
 
     Returns:
         Tuple of (is_valid, list_of_errors)
@@ -57,28 +81,12 @@ def validate_record(artifact_type: str, record: dict) -> tuple[bool, list[str]]:
         >>> if not valid:
         ...     print(f"Validation errors: {errors}")
     """
-    if artifact_type not in SCHEMAS:
+    validator = get_validator(artifact_type)
+    if validator is None:
         return False, [f"Unknown artifact type: {artifact_type}"]
 
-    schema = SCHEMAS[artifact_type]
-    errors = []
-
-    # Check required fields
-    for field in schema["required_fields"]:
-        if field not in record:
-            errors.append(f"Missing required field: {field}")
-
-    # Check field types (basic validation)
-    for field, value in record.items():
-        if field in schema.get("field_types", {}):
-            expected_type = schema["field_types"][field]
-            if not isinstance(value, expected_type):
-                errors.append(
-                    f"Field '{field}' has wrong type. "
-                    f"Expected {expected_type.__name__}, got {type(value).__name__}"
-                )
-
-    return len(errors) == 0, errors
+    valid, errors, _ = validator.validate(record)
+    return valid, errors
 
 
-__all__ = ["SCHEMAS", "validate_record"]
+__all__ = ["SCHEMAS", "CompiledSchema", "compile_schema", "get_validator", "validate_record"]
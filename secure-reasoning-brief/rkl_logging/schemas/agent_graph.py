@@ -12,14 +12,15 @@ AGENT_GRAPH_SCHEMA = {
 
     "optional_fields": [
         "t", "intent_tag", "parent_edge_id", "role_tags",
-        "latency_ms", "retry_count"
+        "latency_ms", "retry_count", "route_reason", "deadline_ms"
     ],
 
     "field_types": {
         "edge_id": str, "session_id": str, "timestamp": str,
         "t": int, "from_agent": str, "to_agent": str, "msg_type": str,
         "intent_tag": str, "content_hash": str, "parent_edge_id": str,
-        "role_tags": list, "latency_ms": int, "retry_count": int
+        "role_tags": list, "latency_ms": int, "retry_count": int,
+        "route_reason": str, "deadline_ms": int
     },
 
     "example": {
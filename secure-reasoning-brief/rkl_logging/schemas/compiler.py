@@ -0,0 +1,121 @@
+"""
+Schema compiler: turns a schema dict into a precomputed validator.
+
+validate_record() used to walk required_fields as a list and re-read
+field_types for every record. A CompiledSchema resolves all of that once:
+
+- required fields as a frozenset (one subset check per record)
+- a type table mapping each typed field to an isinstance()-ready type or tuple
+- the set of float fields that accept ints when coercion is on (temp, top_p, ...)
+
+Records logged from one call site nearly always have the same keys and value
+types, so the outcome for each valid "shape" (keys + value types) is memoized:
+a repeat shape costs one tuple build and a dict lookup instead of a per-field
+isinstance() walk.
+
+Error messages match the original validate_record() output.
+"""
+
+from typing import Any, Dict, FrozenSet, List, Tuple
+
+# Distinct valid record shapes remembered per schema
+MAX_SHAPES = 1024
+
+
+def _type_name(expected: Any) -> str:
+    if isinstance(expected, tuple):
+        return "|".join(t.__name__ for t in expected)
+    return expected.__name__
+
+
+class CompiledSchema:
+    """
+    Precomputed validator for one artifact schema.
+
+    Example:
+        validator = compile_schema(EXECUTION_CONTEXT_SCHEMA)
+        valid, errors, coerced = validator.validate(record, coerce=True)
+    """
+
+    __slots__ = ("schema", "artifact_type", "required", "required_order",
+                 "types", "type_names", "float_fields", "_shapes")
+
+    def __init__(self, schema: Dict[str, Any]):
+        self.schema = schema
+        self.artifact_type = schema.get("artifact_type", "")
+        self.required_order: Tuple[str, ...] = tuple(schema.get("required_fields", ()))
+        self.required: FrozenSet[str] = frozenset(self.required_order)
+
+        self.types: Dict[str, Any] = {}
+        self.type_names: Dict[str, str] = {}
+        float_fields = set()
+        for field, expected in schema.get("field_types", {}).items():
+            if isinstance(expected, list):
+                expected = tuple(expected)
+            self.types[field] = expected
+            self.type_names[field] = _type_name(expected)
+            declared = set(expected) if isinstance(expected, tuple) else {expected}
+            if float in declared and int not in declared:
+                float_fields.add(field)
+        self.float_fields: FrozenSet[str] = frozenset(float_fields)
+        # shape -> float fields to coerce (empty tuple = valid as is)
+        self._shapes: Dict[tuple, Tuple[str, ...]] = {}
+
+    def validate(self, record: Dict[str, Any], coerce: bool = False) -> Tuple[bool, List[str], int]:
+        """
+        Check required fields and declared types.
+
+        None is accepted for optional fields (stored as null). With coerce=True,
+        ints in float fields are converted in place (bools are left alone).
+
+        Returns:
+            (is_valid, list_of_errors, fields_coerced)
+        """
+        if type(record) is dict:
+            shape = (*record, *map(type, record.values()))
+        else:
+            # Slotted records (rkl_logging.records.LogRecord) compute their own key
+            shape = record.shape_key()
+        to_coerce = self._shapes.get(shape)
+        if to_coerce is not None and (coerce or not to_coerce):
+            for field in to_coerce:
+                record[field] = float(record[field])
+            return True, [], len(to_coerce)
+
+        errors = []
+        coerced = []
+
+        if not self.required.issubset(record):
+            errors.extend(
+                f"Missing required field: {field}"
+                for field in self.required_order if field not in record
+            )
+
+        types = self.types
+        for field, value in record.items():
+            expected = types.get(field)
+            if expected is None or isinstance(value, expected):
+                continue
+            if value is None and field not in self.required:
+                continue
+            if (coerce and field in self.float_fields
+                    and type(value) is int):
+                coerced.append(field)
+                continue
+            errors.append(
+                f"Field '{field}' has wrong type. "
+                f"Expected {self.type_names[field]}, got {type(value).__name__}"
+            )
+
+        if errors:
+            return False, errors, 0
+        for field in coerced:
+            record[field] = float(record[field])
+        if len(self._shapes) < MAX_SHAPES:
+            self._shapes[shape] = tuple(coerced)
+        return True, errors, len(coerced)
+
+
+def compile_schema(schema: Dict[str, Any]) -> CompiledSchema:
+    """Compile a schema dict (see rkl_logging/schemas/*) into a validator."""
+    return CompiledSchema(schema)
@@ -28,7 +28,25 @@ EXECUTION_CONTEXT_SCHEMA = {
         "gen_tokens",
         "tool_lat_ms",
         "cache_hit",
+        "retry_count",
+        "rate_limit_wait_ms",
+        "prompt_eval_ms",
+        "eval_ms",
+        "prompt_eval_saved_ms",
+        "context_reused",
+        "ttft_ms",
+        "tokens_per_sec",
+        "streamed",
+        "stop_reason",
+        "host",
         "prompt_id_hash",
+        "system_prompt_hash",
+        "token_estimation",
+        "prompt_preview",
+        "response_preview",
+        "artifact_id",
+        "parent_call_id",
+        "span_attribution",
         # RKL-specific
         "rkl_version",
         "type3_compliant",
@@ -50,7 +68,25 @@ EXECUTION_CONTEXT_SCHEMA = {
         "gen_tokens": int,
         "tool_lat_ms": int,
         "cache_hit": bool,
+        "retry_count": int,
+        "rate_limit_wait_ms": int,
+        "prompt_eval_ms": int,
+        "eval_ms": int,
+        "prompt_eval_saved_ms": int,
+        "context_reused": bool,
+        "ttft_ms": int,
+        "tokens_per_sec": float,
+        "streamed": bool,
+        "stop_reason": str,
+        "host": str,
         "prompt_id_hash": str,
+        "system_prompt_hash": str,
+        "token_estimation": str,
+        "prompt_preview": str,
+        "response_preview": str,
+        "artifact_id": str,
+        "parent_call_id": str,
+        "span_attribution": str,
         "timestamp": str,
         # RKL fields
         "rkl_version": str,
@@ -75,7 +111,25 @@ EXECUTION_CONTEXT_SCHEMA = {
         "gen_tokens": "Tokens generated in response",
         "tool_lat_ms": "Latency in milliseconds",
         "cache_hit": "Whether inference used cached result",
+        "retry_count": "Transient-error retries before the call succeeded or gave up",
+        "rate_limit_wait_ms": "Time spent waiting on the client-side rate limiter (external APIs)",
+        "prompt_eval_ms": "Prefill time reported by the model server (prompt_eval_duration)",
+        "eval_ms": "Decode time reported by the model server (eval_duration)",
+        "prompt_eval_saved_ms": "Prefill time saved versus the article's first call, scaled by prompt length (KV prefix/context reuse)",
+        "context_reused": "Whether the call continued an earlier call's Ollama context instead of resending the article",
+        "ttft_ms": "Time to first streamed token, measured client-side",
+        "tokens_per_sec": "Decode throughput (eval_count / eval_duration)",
+        "streamed": "Whether the response was consumed as a token stream",
+        "stop_reason": "done, max_words or stop_pattern (streaming only); json_fallback for an unusable format=json call",
+        "host": "Model server (host:port) that served the call",
         "prompt_id_hash": "SHA-256 hash of prompt template used",
+        "system_prompt_hash": "SHA-256 hash of the system prompt ('' if none)",
+        "token_estimation": "How token counts were obtained (api, word_count, or cache for cache hits where no model ran)",
+        "prompt_preview": "First 1000 characters of the prompt",
+        "response_preview": "First 1000 characters of the response",
+        "artifact_id": "SHA-256 of the article link, for end-to-end tracing",
+        "parent_call_id": "Shared by the rows one model call was split into (JSON summary mode)",
+        "span_attribution": "How the row's latency/tokens were derived: json_single_call (share of one call) or json_fallback",
         "timestamp": "ISO 8601 timestamp",
         "rkl_version": "RKL system version",
         "type3_compliant": "Whether this operation maintained Type III boundaries",
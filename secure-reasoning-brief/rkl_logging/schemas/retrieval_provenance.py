@@ -19,6 +19,8 @@ RETRIEVAL_PROVENANCE_SCHEMA = {
         "candidate_hashes": list,
         "selected_hashes": list,
         "cutoff_date": str,
-        "category": str
+        "category": str,
+        "fetch_latency_ms": int,
+        "feed_cache": str
     }
 }
@@ -2,29 +2,55 @@
 Core StructuredLogger implementation.
 
 Lightweight structured logger with:
-- Batched writes to Parquet or NDJSON
-- Date/artifact partitioning
+- Batched writes to Parquet (Arrow-native, no pandas) or NDJSON
+- Date/artifact partitioning with collision-proof, atomically renamed files
 - Automatic manifest generation
-- Schema validation
+- Schema validation (compiled validators; failures are counted, not printed)
+- Slotted record classes (rkl_logging.records) logged without a per-record copy
 - Sampling support
+- Optional background writer thread (async mode) with bounded queue
+- Optional rolling files: one open Parquet file per artifact/day, batches as row groups
+- Per-artifact buffer locks: batches are swapped out under the artifact's lock
+  and written outside it, so threads logging different artifacts never wait
+  on each other's disk writes
 """
 
 import json
 import os
 import hashlib
+import logging
+import random
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional, List
-from collections import defaultdict
+from typing import Dict, Any, Optional, List, Deque, Tuple, Union
+from collections import defaultdict, deque
 import threading
 import atexit
+from contextlib import contextmanager
 
-# Try to import Parquet support
+from .partition_writer import PartitionWriter
+from .rolling_writer import RollingParquetWriter
+
+try:
+    import fcntl
+except ImportError:  # Windows: manifest merges are not serialized across processes
+    fcntl = None
+
+from .columnar import ARROW_AVAILABLE, ColumnarBatchBuilder
+from .schemas import get_validator
+from .records import LogRecord, as_dict
+
+# Try to import Parquet support (pyarrow preferred; pandas engine as fallback)
 try:
     import pandas as pd
-    PARQUET_AVAILABLE = True
+    PANDAS_AVAILABLE = True
 except ImportError:
-    PARQUET_AVAILABLE = False
+    PANDAS_AVAILABLE = False
+
+PARQUET_AVAILABLE = ARROW_AVAILABLE or PANDAS_AVAILABLE
+
+# Backpressure policies for async mode (what log() does when the queue is full)
+BACKPRESSURE_POLICIES = ("block", "drop_oldest", "drop_sampled")
 
 
 class StructuredLogger:
@@ -38,6 +64,17 @@ class StructuredLogger:
     - Schema validation (optional)
     - Sampling support
     - Automatic manifest generation
+    - Async mode: log() only enqueues; a writer thread builds and writes batches
+    - Rolling mode: batches are appended as row groups to one open Parquet
+      file per artifact/day, rolled over by size or age and finalized on close()
+
+    Backpressure (async mode, queue full):
+    - "block": log() waits for the writer to free space (lossless)
+    - "drop_oldest": oldest queued record is discarded to admit the new one
+    - "drop_sampled": records of sampled artifacts (sampling rate < 1.0) are
+      dropped; fully-captured artifacts still block, so Phase 0 audit trails
+      stay lossless
+    hold_writes() pauses the writer so a policy can be exercised on demand.
 
     Example:
         logger = StructuredLogger(
@@ -63,7 +100,16 @@ class StructuredLogger:
         batch_size: int = 100,
         sampling: Optional[Dict[str, float]] = None,
         auto_manifest: bool = True,
-        validate_schema: bool = True
+        validate_schema: bool = True,
+        async_writes: bool = False,
+        queue_size: int = 10000,
+        backpressure: str = "block",
+        flush_interval: float = 1.0,
+        rolling_files: bool = False,
+        roll_bytes: int = 64 * 1024 * 1024,
+        roll_seconds: float = 600.0,
+        file_format: Optional[str] = None,
+        coerce_types: bool = True
     ):
         """
         Initialize StructuredLogger.
@@ -76,7 +122,30 @@ class StructuredLogger:
             sampling: Sampling rates per artifact (default: 1.0 for all)
             auto_manifest: Auto-generate daily manifests
             validate_schema: Enable schema validation
+            async_writes: Write batches from a background thread (log() only enqueues)
+            queue_size: Max records queued in async mode before backpressure applies
+            backpressure: Policy when the queue is full ("block", "drop_oldest", "drop_sampled")
+            flush_interval: Seconds between writer wake-ups when the queue is idle
+            rolling_files: Append batches to one open Parquet file per artifact/day
+                (requires pyarrow; ignored in NDJSON mode)
+            roll_bytes: Rolling mode: finalize a file once it reaches this size
+            roll_seconds: Rolling mode: finalize a file once it has been open this long
+            file_format: "parquet" or "ndjson" (default: Parquet when available)
+            coerce_types: While validating, convert ints in float fields (temp, top_p, ...)
+                to float so every batch has the same column types
         """
+        if backpressure not in BACKPRESSURE_POLICIES:
+            raise ValueError(
+                f"Unknown backpressure policy: {backpressure} "
+                f"(expected one of {', '.join(BACKPRESSURE_POLICIES)})"
+            )
+        if queue_size < 1:
+            raise ValueError("queue_size must be >= 1")
+        if file_format not in (None, "parquet", "ndjson"):
+            raise ValueError(f"Unknown file_format: {file_format} (expected parquet or ndjson)")
+        if file_format == "parquet" and not PARQUET_AVAILABLE:
+            raise ValueError("file_format='parquet' requires pyarrow or pandas")
+
         self.base_dir = Path(base_dir)
         self.rkl_version = rkl_version
         self.type3_enforcement = type3_enforcement
@@ -84,26 +153,89 @@ class StructuredLogger:
         self.sampling = sampling or {}
         self.auto_manifest = auto_manifest
         self.validate_schema = validate_schema
+        self.coerce_types = coerce_types
+        self.async_writes = async_writes
+        self.queue_size = queue_size
+        self.backpressure = backpressure
+        self.flush_interval = flush_interval
+        self.file_format = file_format or ("parquet" if PARQUET_AVAILABLE else "ndjson")
+
+        # Validation outcomes (see get_validation_stats); each distinct error is logged once
+        self._validation_lock = threading.Lock()
+        self._validation_stats: Dict[str, Dict[str, int]] = defaultdict(
+            lambda: {"checked": 0, "failed": 0, "coerced": 0}
+        )
+        self._validation_errors: Dict[Tuple[str, str], int] = defaultdict(int)
 
-        # Buffers for batching
-        self._buffers: Dict[str, List[Dict]] = defaultdict(list)
+        # Buffers for batching, one lock per artifact (see _artifact_locks)
+        self._buffers: Dict[str, List[Dict]] = {}
+        self._buffer_locks: Dict[str, threading.Lock] = {}
+        # Rolling mode: serializes writes to an artifact's open file
+        self._write_locks: Dict[str, threading.Lock] = {}
+        self._registry_lock = threading.Lock()
+
+        # Held by the async writer thread while it processes a drained chunk
         self._lock = threading.Lock()
 
-        # Track statistics for manifest
+        # Track statistics for manifest (guarded by _stats_lock). Batches
+        # swapped out but not yet committed are counted in _inflight so
+        # flush() can wait for writes started by other threads.
+        self._stats_lock = threading.Lock()
+        self._writes_done = threading.Condition(self._stats_lock)
+        self._inflight = 0
         self._stats: Dict[str, Dict[str, int]] = defaultdict(
             lambda: {"rows": 0, "writes": 0}
         )
+        # Written-but-not-yet-manifested counts, keyed by partition date
+        self._manifest_pending: Dict[str, Dict[str, Dict[str, int]]] = defaultdict(
+            lambda: defaultdict(lambda: {"rows": 0, "writes": 0})
+        )
+
+        # Unique file naming + temp-file/rename commits
+        self._partition_writer = PartitionWriter(str(self.base_dir))
+        self._rolling_writer: Optional[RollingParquetWriter] = None
+        if rolling_files and ARROW_AVAILABLE and self.file_format == "parquet":
+            self._rolling_writer = RollingParquetWriter(
+                self._partition_writer,
+                max_file_bytes=roll_bytes,
+                max_file_age_s=roll_seconds
+            )
+
+        # Async mode: bounded record queue drained by a dedicated writer thread
+        self._queue: Deque[Tuple[str, Dict[str, Any], bool]] = deque()
+        self._queue_cond = threading.Condition()
+        self._queue_stats: Dict[str, Any] = {
+            "enqueued": 0,
+            "dropped": 0,
+            "blocked": 0,
+            "peak_depth": 0,
+            "write_errors": 0,
+            "dropped_by_artifact": defaultdict(int)
+        }
+        self._flush_requested = 0
+        self._flush_completed = 0
+        self._writes_held = 0
+        self._stopping = False
+        self._writer_thread: Optional[threading.Thread] = None
 
         # Create base directory
         self.base_dir.mkdir(parents=True, exist_ok=True)
 
+        if self.async_writes:
+            self._writer_thread = threading.Thread(
+                target=self._writer_loop,
+                name="rkl-logger-writer",
+                daemon=True
+            )
+            self._writer_thread.start()
+
         # Register cleanup
         atexit.register(self.close)
 
     def log(
         self,
         artifact_type: str,
-        record: Dict[str, Any],
+        record: Union[Dict[str, Any], LogRecord],
         force_write: bool = False
     ) -> None:
         """
@@ -111,7 +243,9 @@ class StructuredLogger:
 
         Args:
             artifact_type: Type of artifact (e.g., "execution_context")
-            record: Record dictionary
+            record: Record dictionary (copied), or a record_class() instance,
+                which is enriched and buffered in place: the logger takes
+                ownership, so don't modify it after this call
             force_write: Skip batching, write immediately
 
         Example:
@@ -126,20 +260,123 @@ class StructuredLogger:
         if not self._should_sample(artifact_type):
             return
 
-        # Add RKL metadata
+        # Add RKL metadata (timestamp is taken here, not when the batch is written)
         enriched_record = self._enrich_record(record)
 
+        # Async mode: hand off to the writer thread (validation happens there)
+        if self._writer_running():
+            self._enqueue(artifact_type, enriched_record, force_write)
+            return
+
         # Validate schema (optional)
         if self.validate_schema:
             self._validate_record(artifact_type, enriched_record)
 
-        with self._lock:
-            self._buffers[artifact_type].append(enriched_record)
-            self._stats[artifact_type]["rows"] += 1
+        self._append_record(artifact_type, enriched_record, force_write)
+
+    def _artifact_locks(self, artifact_type: str) -> Tuple[threading.Lock, threading.Lock]:
+        """(buffer lock, write lock) for an artifact, created on first use."""
+        buffer_lock = self._buffer_locks.get(artifact_type)
+        if buffer_lock is None:
+            with self._registry_lock:
+                if artifact_type not in self._buffer_locks:
+                    self._buffers[artifact_type] = []
+                    self._write_locks[artifact_type] = threading.Lock()
+                    self._buffer_locks[artifact_type] = threading.Lock()
+                buffer_lock = self._buffer_locks[artifact_type]
+        return buffer_lock, self._write_locks[artifact_type]
+
+    def _append_record(self, artifact_type: str, record: Dict[str, Any],
+                       force_write: bool) -> None:
+        """Buffer a record and write the batch if full or forced."""
+        buffer_lock, _ = self._artifact_locks(artifact_type)
+        with buffer_lock:
+            buffer = self._buffers[artifact_type]
+            buffer.append(record)
+            full = len(buffer) >= self.batch_size
+
+        # Write batch if full or forced (outside the buffer lock)
+        if force_write or full:
+            self._write_batch(artifact_type)
+
+    def _writer_running(self) -> bool:
+        """True if the async writer thread is accepting records."""
+        return (
+            self._writer_thread is not None
+            and self._writer_thread.is_alive()
+            and not self._stopping
+        )
 
-            # Write batch if full or forced
-            if force_write or len(self._buffers[artifact_type]) >= self.batch_size:
-                self._write_batch(artifact_type)
+    def _enqueue(self, artifact_type: str, record: Dict[str, Any],
+                 force_write: bool) -> None:
+        """Put a record on the async queue, applying the backpressure policy."""
+        with self._queue_cond:
+            while len(self._queue) >= self.queue_size:
+                if self.backpressure == "drop_oldest":
+                    dropped_type, _, _ = self._queue.popleft()
+                    self._queue_stats["dropped"] += 1
+                    self._queue_stats["dropped_by_artifact"][dropped_type] += 1
+                    break
+                if (self.backpressure == "drop_sampled"
+                        and self.sampling.get(artifact_type, 1.0) < 1.0):
+                    self._queue_stats["dropped"] += 1
+                    self._queue_stats["dropped_by_artifact"][artifact_type] += 1
+                    return
+                # "block" (and fully-captured artifacts under "drop_sampled")
+                self._queue_stats["blocked"] += 1
+                self._queue_cond.notify_all()
+                self._queue_cond.wait(self.flush_interval)
+                if not self._writer_running():
+                    break
+
+            self._queue.append((artifact_type, record, force_write))
+            self._queue_stats["enqueued"] += 1
+            depth = len(self._queue)
+            if depth > self._queue_stats["peak_depth"]:
+                self._queue_stats["peak_depth"] = depth
+            # Wake the writer early once a batch worth of records is waiting
+            if force_write or depth >= self.batch_size:
+                self._queue_cond.notify_all()
+
+    def _writer_loop(self) -> None:
+        """Background writer: drain the queue, batch per artifact, write to disk."""
+        while True:
+            with self._queue_cond:
+                if (not self._queue and not self._stopping
+                        and self._flush_requested == self._flush_completed):
+                    self._queue_cond.wait(self.flush_interval)
+                while self._writes_held and not self._stopping:
+                    self._queue_cond.wait(self.flush_interval)
+                items = list(self._queue)
+                self._queue.clear()
+                flush_target = self._flush_requested
+                stopping = self._stopping
+                # Wake producers blocked on a full queue
+                self._queue_cond.notify_all()
+
+            with self._lock:
+                for artifact_type, record, force_write in items:
+                    try:
+                        if self.validate_schema:
+                            self._validate_record(artifact_type, record)
+                        self._append_record(artifact_type, record, force_write)
+                    except Exception as e:
+                        self._queue_stats["write_errors"] += 1
+                        logging.error(f"rkl_logging writer failed for {artifact_type}: {e}")
+
+                if flush_target != self._flush_completed or stopping:
+                    for atype in list(self._buffers.keys()):
+                        try:
+                            self._write_batch(atype)
+                        except Exception as e:
+                            self._queue_stats["write_errors"] += 1
+                            logging.error(f"rkl_logging writer failed for {atype}: {e}")
+
+            with self._queue_cond:
+                self._flush_completed = flush_target
+                self._queue_cond.notify_all()
+                if stopping and not self._queue:
+                    return
 
     def _should_sample(self, artifact_type: str) -> bool:
         """Check if record should be sampled based on sampling rate."""
@@ -150,12 +387,11 @@ class StructuredLogger:
         if rate <= 0.0:
             return False
 
-        import random
         return random.random() < rate
 
-    def _enrich_record(self, record: Dict[str, Any]) -> Dict[str, Any]:
-        """Add RKL-specific metadata to record."""
-        enriched = record.copy()
+    def _enrich_record(self, record: Union[Dict[str, Any], LogRecord]) -> Union[Dict[str, Any], LogRecord]:
+        """Add RKL-specific metadata to record (slotted records in place, dicts on a copy)."""
+        enriched = record if isinstance(record, LogRecord) else record.copy()
 
         # Add RKL context if not present
         if "rkl_version" not in enriched:
@@ -170,44 +406,131 @@ class StructuredLogger:
         return enriched
 
     def _validate_record(self, artifact_type: str, record: Dict[str, Any]) -> None:
-        """Validate record against schema."""
-        from .schemas import validate_record
+        """
+        Validate record against its compiled schema and count the outcome.
 
-        valid, errors = validate_record(artifact_type, record)
-        if not valid:
-            print(f"WARNING: Schema validation failed for {artifact_type}: {errors}")
-            # Don't block logging, just warn
+        Invalid records are still logged. The first occurrence of each distinct
+        error is reported via logging.warning; the rest only increment counters.
+        """
+        validator = get_validator(artifact_type)
+        if validator is None:
+            valid, errors, coerced = False, [f"Unknown artifact type: {artifact_type}"], 0
+        else:
+            valid, errors, coerced = validator.validate(record, coerce=self.coerce_types)
+
+        new_errors = []
+        with self._validation_lock:
+            counts = self._validation_stats[artifact_type]
+            counts["checked"] += 1
+            counts["coerced"] += coerced
+            if not valid:
+                counts["failed"] += 1
+                for error in errors:
+                    key = (artifact_type, error)
+                    if key not in self._validation_errors:
+                        new_errors.append(error)
+                    self._validation_errors[key] += 1
+        for error in new_errors:
+            logging.warning(f"rkl_logging schema validation failed for {artifact_type}: {error} "
+                            f"(further occurrences are counted in get_validation_stats())")
 
     def _write_batch(self, artifact_type: str) -> None:
-        """Write buffered records to disk."""
-        if not self._buffers[artifact_type]:
-            return
-
-        records = self._buffers[artifact_type]
-        self._buffers[artifact_type] = []  # Clear buffer
-
-        # Determine output path with date partitioning
-        today = datetime.utcnow().strftime("%Y-%m-%d")
-        year, month, day = today.split("-")
+        """
+        Write buffered records to disk.
 
-        output_dir = self.base_dir / artifact_type / year / month / day
-        output_dir.mkdir(parents=True, exist_ok=True)
+        The buffer is swapped for an empty list under the artifact's buffer
+        lock and the batch is written after releasing it, so other threads
+        keep appending while the file is built. Each batch goes to its own
+        file; only rolling mode, where batches share an open file, holds the
+        artifact's write lock for the write (other artifacts are unaffected).
 
-        # Write to Parquet or NDJSON
-        timestamp = datetime.utcnow().strftime("%H%M%S")
+        Rows and writes are counted only after the file has been committed,
+        so the manifest matches what is actually on disk. In rolling mode
+        that happens when the open file is finalized.
+        """
+        buffer_lock, write_lock = self._artifact_locks(artifact_type)
+        if self._rolling_writer is not None:
+            # Swap under the write lock too, so batches reach the file in order
+            with write_lock:
+                records = self._swap_buffer(artifact_type, buffer_lock)
+                if not records:
+                    return
+                try:
+                    table = ColumnarBatchBuilder(artifact_type).extend(records).to_table()
+                    now = datetime.utcnow()
+                    for atype, date_str, rows in self._rolling_writer.write_table(artifact_type, table, now):
+                        self._record_write(atype, date_str, rows)
+                finally:
+                    self._write_finished()
+            return
 
-        if PARQUET_AVAILABLE:
-            output_file = output_dir / f"{artifact_type}_{timestamp}.parquet"
-            self._write_parquet(output_file, records)
-        else:
-            output_file = output_dir / f"{artifact_type}_{timestamp}.ndjson"
-            self._write_ndjson(output_file, records)
+        records = self._swap_buffer(artifact_type, buffer_lock)
+        if not records:
+            return
+        try:
+            now = datetime.utcnow()
+            # Date partitioning + unique name (artifact/YYYY/MM/DD/artifact_HHMMSS_host-pid_seq)
+            output_file = self._partition_writer.next_path(artifact_type, self.file_format, now)
+
+            # Write to Parquet or NDJSON via temp file + atomic rename
+            with self._partition_writer.atomic(output_file) as tmp_file:
+                if self.file_format == "parquet":
+                    self._write_parquet(tmp_file, records, artifact_type)
+                else:
+                    self._write_ndjson(tmp_file, records)
+
+            self._record_write(artifact_type, now.strftime("%Y-%m-%d"), len(records))
+        finally:
+            self._write_finished()
+
+    def _swap_buffer(self, artifact_type: str, buffer_lock: threading.Lock) -> List[Dict]:
+        """Take the artifact's buffered records; a non-empty batch is counted as in flight."""
+        with buffer_lock:
+            records = self._buffers[artifact_type]
+            if not records:
+                return records
+            self._buffers[artifact_type] = []
+            with self._stats_lock:
+                self._inflight += 1
+        return records
+
+    def _write_finished(self) -> None:
+        """Mark a batch taken by _swap_buffer as written (or failed)."""
+        with self._writes_done:
+            self._inflight -= 1
+            if not self._inflight:
+                self._writes_done.notify_all()
+
+    def _wait_for_writes(self) -> None:
+        """Block until no batch is being written by any thread."""
+        with self._writes_done:
+            while self._inflight:
+                self._writes_done.wait()
+
+    def _record_write(self, artifact_type: str, date_str: str, rows: int) -> None:
+        """Count a committed file in the session stats and the pending manifest delta."""
+        if not rows:
+            return
+        with self._stats_lock:
+            self._stats[artifact_type]["rows"] += rows
+            self._stats[artifact_type]["writes"] += 1
+            pending = self._manifest_pending[date_str][artifact_type]
+            pending["rows"] += rows
+            pending["writes"] += 1
+
+    def _write_parquet(self, file_path: Path, records: List[Dict],
+                       artifact_type: Optional[str] = None) -> None:
+        """
+        Write records to Parquet file.
 
-        self._stats[artifact_type]["writes"] += 1
+        Uses the schema-typed ColumnarBatchBuilder when pyarrow is installed;
+        pandas is only used as a fallback engine.
+        """
+        if ARROW_AVAILABLE:
+            ColumnarBatchBuilder(artifact_type or "").extend(records).write_parquet(file_path)
+            return
 
-    def _write_parquet(self, file_path: Path, records: List[Dict]) -> None:
-        """Write records to Parquet file."""
-        df = pd.DataFrame(records)
+        df = pd.DataFrame([as_dict(r) for r in records])
         try:
             df.to_parquet(file_path, index=False, engine="pyarrow")
         except ImportError:
@@ -218,93 +541,231 @@ class StructuredLogger:
         """Write records to NDJSON file."""
         with open(file_path, "w") as f:
             for record in records:
-                f.write(json.dumps(record) + "\n")
+                f.write(json.dumps(as_dict(record)) + "\n")
 
     def flush(self, artifact_type: Optional[str] = None) -> None:
         """
         Flush buffered records to disk.
 
+        In async mode this drains the queue and waits until the writer thread
+        has written every buffered record (all artifacts). Otherwise it also
+        waits for batches other threads are still writing.
+
         Args:
             artifact_type: Specific artifact to flush, or None for all
         """
-        with self._lock:
-            if artifact_type:
-                self._write_batch(artifact_type)
-            else:
-                for atype in list(self._buffers.keys()):
-                    self._write_batch(atype)
+        if self._writer_running():
+            with self._queue_cond:
+                self._flush_requested += 1
+                target = self._flush_requested
+                self._queue_cond.notify_all()
+                while self._flush_completed < target and self._writer_thread.is_alive():
+                    self._queue_cond.wait(self.flush_interval)
+            return
+
+        if artifact_type:
+            self._write_batch(artifact_type)
+        else:
+            for atype in list(self._buffers.keys()):
+                self._write_batch(atype)
+        self._wait_for_writes()
+
+    @contextmanager
+    def hold_writes(self):
+        """
+        Async mode: keep the writer thread from draining the queue inside the block.
+
+        Records keep queueing and the backpressure policy applies once the
+        queue is full, so this is how to exercise a policy deterministically
+        (or to pause disk I/O briefly). Under "block", a full queue blocks
+        log() until the hold ends; flush() and close() also wait for it.
+        No effect in synchronous mode.
+
+        Example:
+            with logger.hold_writes():
+                for record in burst:
+                    logger.log("agent_graph", record)
+                print(logger.get_queue_stats()["dropped"])
+        """
+        with self._queue_cond:
+            self._writes_held += 1
+        try:
+            yield self
+        finally:
+            with self._queue_cond:
+                self._writes_held -= 1
+                self._queue_cond.notify_all()
 
     def close(self) -> None:
         """
         Close logger and flush all remaining records.
 
-        Also generates manifest if auto_manifest is True.
+        Also generates manifest if auto_manifest is True. In async mode the
+        queue is drained and the writer thread is stopped first; in rolling
+        mode open files are finalized.
         """
         self.flush()
+        self._stop_writer()
+        self._close_rolling_files()
 
         if self.auto_manifest:
             self._generate_manifest()
 
+    def _stop_writer(self) -> None:
+        """Stop the async writer thread after it drains the queue."""
+        if self._writer_thread is None:
+            return
+        with self._queue_cond:
+            self._stopping = True
+            self._queue_cond.notify_all()
+        if self._writer_thread.is_alive() and self._writer_thread is not threading.current_thread():
+            self._writer_thread.join()
+        # Records that raced in after the stop are written synchronously
+        with self._queue_cond:
+            leftover = list(self._queue)
+            self._queue.clear()
+        if leftover:
+            with self._lock:
+                for artifact_type, record, force_write in leftover:
+                    self._append_record(artifact_type, record, force_write)
+                for atype in list(self._buffers.keys()):
+                    self._write_batch(atype)
+
+    def _close_rolling_files(self) -> None:
+        """Finalize all open rolling Parquet files and count their rows."""
+        if self._rolling_writer is None:
+            return
+        for artifact_type in self._rolling_writer.open_artifacts():
+            with self._artifact_locks(artifact_type)[1]:
+                finalized = self._rolling_writer.close_artifact(artifact_type)
+            if finalized:
+                self._record_write(*finalized)
+
     def _generate_manifest(self) -> None:
         """
-        Generate daily manifest with statistics.
+        Merge this process's newly written counts into the daily manifests.
 
         CRITICAL: Merges with existing manifest instead of overwriting.
         This allows multiple processes per day to accumulate stats correctly.
+        Only counts not yet merged are added, so calling close() twice (or
+        close() followed by the atexit hook) never double-counts, and rows are
+        attributed to the day of the partition they were written to.
         """
-        today = datetime.utcnow().strftime("%Y-%m-%d")
+        with self._stats_lock:
+            pending = {
+                date_str: {a: dict(c) for a, c in artifacts.items()}
+                for date_str, artifacts in self._manifest_pending.items()
+            }
+            self._manifest_pending.clear()
+
+        if not pending:
+            # Nothing written since the last merge; still ensure today's manifest exists
+            pending = {datetime.utcnow().strftime("%Y-%m-%d"): {}}
+
         manifest_dir = self.base_dir / "manifests"
         manifest_dir.mkdir(parents=True, exist_ok=True)
 
-        manifest_path = manifest_dir / f"{today}.json"
-
-        # Load existing manifest if present (merge instead of overwrite)
-        existing = {
-            "date": today,
-            "rkl_version": self.rkl_version,
-            "artifacts": {}
-        }
+        for date_str, artifacts in sorted(pending.items()):
+            self._merge_manifest(manifest_dir / f"{date_str}.json", date_str, artifacts)
 
-        if manifest_path.exists():
-            try:
-                with open(manifest_path, "r") as f:
-                    existing = json.load(f)
-            except (json.JSONDecodeError, IOError):
-                # If manifest is corrupted, start fresh but log warning
-                import logging
-                logging.warning(f"Could not load existing manifest {manifest_path}, starting fresh")
-
-        # Merge: add this process's stats to existing counts
-        for artifact, stats in self._stats.items():
-            if artifact not in existing["artifacts"]:
-                existing["artifacts"][artifact] = {
-                    "rows": 0,
-                    "writes": 0,
-                    "schema_version": "v1.0"
-                }
-
-            # Accumulate counts from this process
-            prev = existing["artifacts"][artifact]
-            prev["rows"] = int(prev.get("rows", 0)) + int(stats["rows"])
-            prev["writes"] = int(prev.get("writes", 0)) + int(stats["writes"])
-            prev["schema_version"] = "v1.0"
-
-        # Update timestamp
-        existing["generated_at"] = datetime.utcnow().isoformat() + "Z"
-        existing["rkl_version"] = self.rkl_version
-
-        # Atomic write: tmp file + rename (prevents corruption from interrupted writes)
-        tmp_path = manifest_path.with_suffix(".json.tmp")
-        with open(tmp_path, "w") as f:
-            f.write(json.dumps(existing, indent=2))
-
-        # Atomic rename (OS-level atomic operation)
-        import os
-        os.replace(tmp_path, manifest_path)
+    def _merge_manifest(self, manifest_path: Path, date_str: str,
+                        artifacts: Dict[str, Dict[str, int]]) -> None:
+        """Read-modify-write one manifest under an exclusive lock file."""
+        lock_file = open(manifest_path.with_suffix(".json.lock"), "w")
+        try:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+
+            # Load existing manifest if present (merge instead of overwrite)
+            existing = {
+                "date": date_str,
+                "rkl_version": self.rkl_version,
+                "artifacts": {}
+            }
+
+            if manifest_path.exists():
+                try:
+                    with open(manifest_path, "r") as f:
+                        existing = json.load(f)
+                except (json.JSONDecodeError, IOError):
+                    # If manifest is corrupted, start fresh but log warning
+                    logging.warning(f"Could not load existing manifest {manifest_path}, starting fresh")
+            existing.setdefault("artifacts", {})
+
+            # Merge: add this process's stats to existing counts
+            for artifact, stats in artifacts.items():
+                if artifact not in existing["artifacts"]:
+                    existing["artifacts"][artifact] = {
+                        "rows": 0,
+                        "writes": 0,
+                        "schema_version": "v1.0"
+                    }
+
+                # Accumulate counts from this process
+                prev = existing["artifacts"][artifact]
+                prev["rows"] = int(prev.get("rows", 0)) + int(stats["rows"])
+                prev["writes"] = int(prev.get("writes", 0)) + int(stats["writes"])
+                prev["schema_version"] = "v1.0"
+
+            # Update timestamp
+            existing["generated_at"] = datetime.utcnow().isoformat() + "Z"
+            existing["rkl_version"] = self.rkl_version
+
+            # Atomic write: tmp file + rename (prevents corruption from interrupted writes)
+            tmp_path = manifest_path.with_suffix(".json.tmp")
+            with open(tmp_path, "w") as f:
+                f.write(json.dumps(existing, indent=2))
+
+            # Atomic rename (OS-level atomic operation)
+            os.replace(tmp_path, manifest_path)
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+            lock_file.close()
 
     def get_stats(self) -> Dict[str, Dict[str, int]]:
         """Get logging statistics."""
-        return dict(self._stats)
+        with self._stats_lock:
+            return {a: dict(c) for a, c in self._stats.items()}
+
+    def get_validation_stats(self) -> Dict[str, Any]:
+        """
+        Get schema validation counters.
+
+        Returns:
+            Dict with per-artifact checked/failed/coerced counts and the number
+            of times each distinct error message occurred.
+        """
+        with self._validation_lock:
+            errors: Dict[str, Dict[str, int]] = defaultdict(dict)
+            for (artifact_type, error), count in self._validation_errors.items():
+                errors[artifact_type][error] = count
+            return {
+                "by_artifact": {a: dict(c) for a, c in self._validation_stats.items()},
+                "errors": dict(errors)
+            }
+
+    def get_queue_stats(self) -> Dict[str, Any]:
+        """
+        Get async queue statistics.
+
+        Returns:
+            Dict with current queue depth, peak depth, capacity, counts of
+            enqueued/dropped/blocked records, drops per artifact and writer errors.
+        """
+        with self._queue_cond:
+            return {
+                "async": self.async_writes,
+                "backpressure": self.backpressure,
+                "queue_depth": len(self._queue),
+                "queue_capacity": self.queue_size,
+                "peak_depth": self._queue_stats["peak_depth"],
+                "enqueued": self._queue_stats["enqueued"],
+                "dropped": self._queue_stats["dropped"],
+                "blocked": self._queue_stats["blocked"],
+                "write_errors": self._queue_stats["write_errors"],
+                "dropped_by_artifact": dict(self._queue_stats["dropped_by_artifact"])
+            }
 
 
 # Convenience function
@@ -27,6 +27,8 @@ from rkl_logging.structured_logger import StructuredLogger
 from rkl_logging.utils.hashing import sha256_text, sha256_dict
 from rkl_logging.schemas import SCHEMAS, validate_record
 from rkl_logging.utils.privacy import sanitize_for_research, anonymize_for_public
+from rkl_logging.columnar import ARROW_AVAILABLE, ColumnarBatchBuilder
+from rkl_logging.records import record_class
 
 
 def test_schema_registry():
@@ -78,6 +80,33 @@ def test_schema_validation():
     print(f"✓ Invalid record rejected: {errors[0]}")
 
 
+def test_validation_stats():
+    """Test compiled validation: int->float coercion and aggregated failure counters."""
+    # Tuple-typed fields report readable errors
+    is_valid, errors = validate_record("hallucination_matrix", {
+        "session_id": "s", "artifact_id": "a", "verdict": "pass", "method": "m", "confidence": "high"
+    })
+    assert not is_valid and "Expected int|float, got str" in errors[0], errors
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        logger = StructuredLogger(base_dir=tmpdir, batch_size=100)
+        record = {"session_id": "s", "turn_id": 1, "agent_id": "a", "model_id": "m", "temp": 1}
+        logger.log("execution_context", record)
+        for _ in range(3):
+            logger.log("execution_context", {"session_id": "s", "turn_id": "one"})
+
+        assert isinstance(logger._buffers["execution_context"][0]["temp"], float), "temp not coerced"
+        assert record["temp"] == 1 and isinstance(record["temp"], int), "Caller's record modified"
+
+        stats = logger.get_validation_stats()
+        counts = stats["by_artifact"]["execution_context"]
+        assert counts == {"checked": 4, "failed": 3, "coerced": 1}, counts
+        assert stats["errors"]["execution_context"]["Missing required field: agent_id"] == 3
+        logger.close()
+
+    print(f"✓ Validation stats: {counts}")
+
+
 def test_hashing_utilities():
     """Test SHA-256 hashing helpers."""
     text = "This is sensitive content"
@@ -257,6 +286,294 @@ def test_manifest_generation():
         print(f"✓ Manifest: {stats['rows']} rows, {stats['writes']} writes")
 
 
+def test_collision_proof_naming():
+    """Test that batches flushed within one second never overwrite each other."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        logger = StructuredLogger(base_dir=tmpdir, batch_size=1)
+
+        for i in range(5):
+            logger.log("execution_context", {
+                "session_id": "test",
+                "turn_id": i,
+                "agent_id": "test",
+                "model_id": "test"
+            })
+
+        logger.close()
+        logger.close()  # Second close (e.g. atexit) must not double-count
+
+        files = [f for f in Path(tmpdir).rglob("execution_context_*") if f.is_file()]
+        assert len(files) == 5, f"Expected 5 distinct batch files, got {len(files)}"
+        assert not list(Path(tmpdir).rglob("*.tmp")), "Temp files left behind"
+
+        manifests = list((Path(tmpdir) / "manifests").glob("*.json"))
+        with open(manifests[0]) as f:
+            manifest = json.load(f)
+        counts = manifest["artifacts"]["execution_context"]
+        assert counts["rows"] == 5, f"Manifest rows drifted: {counts}"
+        assert counts["writes"] == 5, f"Manifest writes drifted: {counts}"
+
+        print(f"✓ Naming: {len(files)} unique files, manifest rows={counts['rows']}")
+
+
+def test_columnar_builder():
+    """Test Arrow-native batches keep schema types and nested columns."""
+    if not ARROW_AVAILABLE:
+        print("⚠ pyarrow not installed - columnar builder skipped (NDJSON mode)")
+        return
+
+    import pyarrow as pa
+
+    builder = ColumnarBatchBuilder("secure_reasoning_trace")
+    builder.extend([
+        {"session_id": "s1", "task_id": "t1", "turn_id": 1,
+         "steps": [{"step_index": 0, "phase": "act", "duration_ms": 5}]},
+        {"session_id": "s1", "task_id": "t2", "turn_id": 2, "steps": [],
+         "delta_metrics": {}}  # Empty struct: unwritable in Parquet, must not fail
+    ])
+    table = builder.to_table()
+
+    assert table.num_rows == 2
+    assert table.schema.field("turn_id").type == pa.int64()
+    steps_type = table.schema.field("steps").type
+    assert pa.types.is_list(steps_type) and pa.types.is_struct(steps_type.value_type), \
+        f"steps should be list<struct>, got {steps_type}"
+    assert table.schema.field("delta_metrics").type == pa.string()
+
+    # Declared float columns accept ints; missing fields become nulls
+    ctx = ColumnarBatchBuilder("execution_context").extend([
+        {"session_id": "s", "temp": 1},
+        {"session_id": "s", "top_p": 0.9}
+    ]).to_table()
+    assert ctx.schema.field("temp").type == pa.float64()
+    assert ctx.column("top_p").to_pylist() == [None, 0.9]
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        builder.write_parquet(Path(tmpdir) / "batch.parquet")
+
+    print(f"✓ Columnar builder: steps stored as {steps_type}")
+
+
+def test_rolling_files():
+    """Test rolling mode appends batches to one file per artifact/day."""
+    if not ARROW_AVAILABLE:
+        print("⚠ pyarrow not installed - rolling files skipped (NDJSON mode)")
+        return
+
+    import pyarrow.parquet as pq
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        logger = StructuredLogger(base_dir=tmpdir, batch_size=5, rolling_files=True)
+
+        for i in range(23):
+            record = {
+                "session_id": "test",
+                "turn_id": i,
+                "agent_id": "test",
+                "model_id": "test"
+            }
+            if i < 5:
+                record["gen_tokens"] = i  # Column missing from later batches
+            logger.log("execution_context", record)
+
+        # Nothing is visible until the open file is finalized
+        assert not list(Path(tmpdir).rglob("*.parquet")), "Open file visible before close()"
+
+        logger.close()
+
+        files = list(Path(tmpdir).rglob("*.parquet"))
+        assert len(files) == 1, f"Expected one rolled file, got {len(files)}"
+        assert pq.ParquetFile(files[0]).metadata.num_rows == 23
+        assert logger._stats["execution_context"]["rows"] == 23
+        assert not list(Path(tmpdir).rglob("*.tmp")), "Temp files left behind"
+
+    print(f"✓ Rolling files: 23 rows in {len(files)} file")
+
+
+def test_record_classes():
+    """Test slotted record classes: mapping behaviour, no copy on log(), same columns as dicts."""
+    ExecutionContext = record_class("execution_context")
+    fields = {"session_id": "s", "turn_id": 1, "agent_id": "a", "model_id": "m", "temp": 1,
+              "timestamp": "2025-11-11T09:00:00Z"}
+    record = ExecutionContext(**fields, custom_tag="x")
+
+    assert not hasattr(record, "__dict__"), "Record class is not slotted"
+    assert "gen_tokens" not in record and record.get("gen_tokens") is None
+    assert record["custom_tag"] == "x" and len(record) == 7
+    assert record.to_dict() == dict(fields, custom_tag="x")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        logger = StructuredLogger(base_dir=tmpdir, batch_size=100)
+        logger.log("execution_context", record)
+        logger.log("execution_context", dict(fields, custom_tag="x"))
+
+        buffered = logger._buffers["execution_context"]
+        assert buffered[0] is record, "Slotted record was copied"
+        assert isinstance(record["temp"], float) and "rkl_version" in record
+        assert logger.get_validation_stats()["by_artifact"]["execution_context"]["failed"] == 0
+
+        if ARROW_AVAILABLE:
+            table = ColumnarBatchBuilder("execution_context").extend(buffered).to_table()
+            rows = table.to_pylist()
+            assert rows[0] == rows[1], f"Slotted and dict rows differ: {rows}"
+        logger.close()
+
+    print(f"✓ Record classes: {type(record).__name__} with {len(type(record).__slots__)} slots")
+
+
+def test_ndjson_format():
+    """Test file_format="ndjson" writes NDJSON even when Parquet is available."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        logger = StructuredLogger(base_dir=tmpdir, batch_size=2, file_format="ndjson")
+        for i in range(3):
+            logger.log("execution_context", {
+                "session_id": "test", "turn_id": i, "agent_id": "test", "model_id": "test"
+            })
+        logger.close()
+
+        files = list(Path(tmpdir).rglob("*.ndjson"))
+        assert len(files) == 2, f"Expected two NDJSON batches, got {len(files)}"
+        assert not list(Path(tmpdir).rglob("*.parquet")), "Parquet written in NDJSON mode"
+        rows = [json.loads(line) for f in files for line in f.read_text().splitlines()]
+        assert sorted(r["turn_id"] for r in rows) == [0, 1, 2]
+
+    try:
+        StructuredLogger(base_dir=tempfile.gettempdir(), file_format="csv")
+        assert False, "Unknown file_format accepted"
+    except ValueError:
+        pass
+
+    print(f"✓ NDJSON format: {len(rows)} rows in {len(files)} files")
+
+
+def test_async_logging():
+    """Test async writer thread drains the queue on flush/close."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        logger = StructuredLogger(
+            base_dir=tmpdir,
+            batch_size=5,
+            async_writes=True,
+            queue_size=100
+        )
+
+        for i in range(12):
+            logger.log("execution_context", {
+                "session_id": "test",
+                "turn_id": i,
+                "agent_id": "test",
+                "model_id": "test"
+            })
+
+        logger.flush()
+        assert logger.get_queue_stats()["queue_depth"] == 0, "Queue not drained by flush()"
+        assert logger._stats["execution_context"]["rows"] == 12
+
+        logger.close()
+        assert not logger._writer_thread.is_alive(), "Writer thread still running after close()"
+
+        files = list(Path(tmpdir).rglob("execution_context_*"))
+        assert files, "No output files written by async writer"
+
+        stats = logger.get_queue_stats()
+        assert stats["enqueued"] == 12 and stats["dropped"] == 0
+        print(f"✓ Async logging: {stats['enqueued']} enqueued, peak depth {stats['peak_depth']}")
+
+
+def test_async_backpressure():
+    """Test drop_oldest and drop_sampled backpressure policies."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        logger = StructuredLogger(
+            base_dir=tmpdir,
+            batch_size=1000,
+            async_writes=True,
+            queue_size=4,
+            backpressure="drop_oldest"
+        )
+        # The writer cannot drain the queue while writes are held
+        with logger.hold_writes():
+            for i in range(10):
+                logger.log("agent_graph", {"edge_id": f"e{i}"})
+            stats = logger.get_queue_stats()
+        assert stats["queue_depth"] == 4
+        assert stats["dropped"] == 6, f"Expected drops under drop_oldest: {stats}"
+        logger.close()
+        assert logger.get_stats()["agent_graph"]["rows"] == 4, "Newest records not kept"
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        logger = StructuredLogger(
+            base_dir=tmpdir,
+            batch_size=1000,
+            async_writes=True,
+            queue_size=4,
+            backpressure="drop_sampled",
+            sampling={"agent_graph": 0.999999}  # Sampled artifact (rate < 1.0)
+        )
+        with logger.hold_writes():
+            # Fully-captured records fill the queue; sampled ones are then dropped
+            for i in range(4):
+                logger.log("boundary_event", {"event_id": f"b{i}"})
+            for i in range(5):
+                logger.log("agent_graph", {"edge_id": f"e{i}"})
+            stats = logger.get_queue_stats()
+        assert stats["queue_depth"] == 4
+        assert stats["dropped_by_artifact"] == {"agent_graph": 5}, stats
+        logger.close()
+        assert logger.get_stats()["boundary_event"]["rows"] == 4, "Audit records lost"
+
+        try:
+            StructuredLogger(base_dir=tmpdir, backpressure="nope")
+            assert False, "Unknown backpressure policy accepted"
+        except ValueError:
+            pass
+
+    print("✓ Backpressure: drop_oldest and drop_sampled bound queue depth and count drops")
+
+
+def test_concurrent_logging():
+    """Test threads logging several artifacts at once lose no rows, in each write mode."""
+    import threading
+
+    artifacts = ["execution_context", "boundary_event", "agent_graph"]
+    per_thread = 250
+
+    def worker(logger, thread_id):
+        for i in range(per_thread):
+            logger.log(artifacts[i % len(artifacts)], {
+                "session_id": f"t{thread_id}", "turn_id": i, "agent_id": "a", "model_id": "m",
+                "event_id": f"{thread_id}-{i}", "rule_id": "r", "trigger_tag": "t", "context_tag": "c"
+            })
+
+    modes = [{"file_format": "ndjson"}]
+    if ARROW_AVAILABLE:
+        modes += [{"file_format": "parquet"}, {"rolling_files": True}]
+
+    for mode in modes:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            logger = StructuredLogger(base_dir=tmpdir, batch_size=7, validate_schema=False, **mode)
+            threads = [threading.Thread(target=worker, args=(logger, t)) for t in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            logger.close()
+
+            total = sum(stats["rows"] for stats in logger.get_stats().values())
+            assert total == 8 * per_thread, f"{mode}: expected {8 * per_thread} rows, got {total}"
+
+            on_disk = 0
+            for path in Path(tmpdir).rglob("*.ndjson"):
+                on_disk += len(path.read_text().splitlines())
+            if ARROW_AVAILABLE:
+                import pyarrow.parquet as pq
+                on_disk += sum(pq.ParquetFile(p).metadata.num_rows for p in Path(tmpdir).rglob("*.parquet"))
+            assert on_disk == total, f"{mode}: {on_disk} rows on disk, stats say {total}"
+
+            manifest = json.loads(next(Path(tmpdir).rglob("manifests/*.json")).read_text())
+            assert sum(a["rows"] for a in manifest["artifacts"].values()) == total
+
+    print(f"✓ Concurrent logging: 8 threads x {per_thread} records, {len(modes)} write modes")
+
+
 def test_schema_drift_detection():
     """Test that schema changes are detected."""
     # Get current schema
@@ -295,11 +612,20 @@ def run_all_tests():
     tests = [
         ("Schema Registry", test_schema_registry),
         ("Schema Validation", test_schema_validation),
+        ("Validation Stats", test_validation_stats),
         ("Hashing Utilities", test_hashing_utilities),
         ("Privacy Helpers", test_privacy_helpers),
         ("Basic Logging", test_basic_logging),
         ("Sampling", test_sampling),
         ("Manifest Generation", test_manifest_generation),
+        ("Collision-Proof Naming", test_collision_proof_naming),
+        ("Columnar Builder", test_columnar_builder),
+        ("Rolling Files", test_rolling_files),
+        ("Record Classes", test_record_classes),
+        ("NDJSON Format", test_ndjson_format),
+        ("Async Logging", test_async_logging),
+        ("Async Backpressure", test_async_backpressure),
+        ("Concurrent Logging", test_concurrent_logging),
         ("Schema Drift Detection", test_schema_drift_detection)
     ]
 
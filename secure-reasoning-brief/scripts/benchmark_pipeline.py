@@ -0,0 +1,499 @@
+#!/usr/bin/env python3
+"""
+Pipeline Benchmark - Per-stage throughput, latency, memory and I/O
+
+Runs the brief pipeline against the model stand-in (model_standin.py) and its
+synthetic feeds, so results depend on this code rather than on a GPU, the
+network or API quotas. Each stage is measured separately:
+
+- fetch:        FeedFetcher.fetch_feeds() over the synthetic feeds
+- summarize:    ArticleSummarizer.summarize_article() per article (concurrent, telemetry on)
+- qa:           fetch_and_summarize.run_gemini_qa() with StandinGeminiClient (telemetry on)
+- publish:      publish_brief.BriefGenerator.generate_brief() + write
+- daily_brief:  generate_daily_brief.generate_daily_brief() (stand-in Gemini)
+- end_to_end:   fetch_and_summarize.main() with telemetry on (--stages to skip)
+
+Per stage the result records items, wall time, throughput (items/s), p50/p95
+latency per item, peak RSS of this process while the stage ran, and bytes
+written to the stage's output directory (telemetry for summarize/qa; none for
+fetch, which writes nothing with the feed cache off). The stand-in runs as a
+subprocess so its CPU time doesn't count against the pipeline.
+
+Results are JSON (with the git commit) and can be compared across commits:
+
+    python scripts/benchmark_pipeline.py --output bench/base.json
+    git checkout my-branch
+    python scripts/benchmark_pipeline.py --output bench/new.json --compare bench/base.json
+
+--compare exits 1 when any stage's throughput drops, p95 latency or peak RSS
+grows by more than --threshold (default 10%).
+
+Usage:
+    python scripts/benchmark_pipeline.py [--articles N] [--speedup S] [--json]
+
+Options:
+    --articles N         Articles across all synthetic feeds (default: 200)
+    --feeds K            Synthetic feeds (default: 5)
+    --concurrency N      Articles summarized at once (default: 8)
+    --summary-mode MODE  multi or json (default: multi)
+    --repeat N           Runs of the fetch/publish/daily_brief stages (default: 3)
+    --speedup S          Stand-in delay divisor; 0 = no model delay (default: 0)
+    --decode-tps N       Stand-in decode rate when --speedup > 0 (default: 40)
+    --stages LIST        Comma-separated stages to run (default: all)
+    --output PATH        Write results JSON to PATH
+    --compare PATH       Compare against a previous results JSON
+    --threshold PCT      Regression threshold for --compare (default: 10)
+    --keep-outputs       Keep the temporary work directory (briefs, telemetry)
+    --json               Print results as JSON instead of a table
+"""
+
+import argparse
+import atexit
+import contextlib
+import json
+import logging
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import requests
+
+script_dir = Path(__file__).parent
+sys.path.insert(0, str(script_dir))
+
+try:
+    import psutil  # type: ignore
+except ImportError:
+    psutil = None
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+STAGES = ["fetch", "summarize", "qa", "publish", "daily_brief", "end_to_end"]
+
+# Environment the pipeline reads; set for the duration of the benchmark
+BENCH_ENV = {
+    "BRIEF_IGNORE_KEYWORDS": "true",
+    "BRIEF_FEED_CACHE": "false",
+    "BRIEF_SUMMARY_CACHE": "false",
+    "GEMINI_STANDIN": "true",
+    "GEMINI_STANDIN_SPEEDUP": "0",
+    "ENABLE_GEMINI_QA": "true",
+    "PUBLISH_TO_GITHUB": "false"
+}
+
+
+def current_rss() -> Optional[int]:
+    """Resident set size of this process in bytes."""
+    if psutil:
+        return psutil.Process().memory_info().rss
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        pass
+    if resource:
+        # Peak since process start (KB on Linux); the best available without /proc
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    return None
+
+
+class RssSampler:
+    """Background thread recording peak RSS while a stage runs."""
+
+    def __init__(self, interval_s: float = 0.05):
+        self.interval_s = interval_s
+        self.peak = current_rss()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="rss-sampler", daemon=True)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_s):
+            rss = current_rss()
+            if rss is not None and (self.peak is None or rss > self.peak):
+                self.peak = rss
+
+    def __enter__(self) -> "RssSampler":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._stop.set()
+        self._thread.join()
+        rss = current_rss()
+        if rss is not None and (self.peak is None or rss > self.peak):
+            self.peak = rss
+
+
+def dir_bytes(path: Path) -> int:
+    """Total size of regular files under path."""
+    if not path.exists():
+        return 0
+    return sum(p.stat().st_size for p in path.rglob("*") if p.is_file())
+
+
+def percentile(values: List[float], q: float) -> Optional[float]:
+    """Nearest-rank percentile (q in 0..1)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def measure(stage: str, run: Callable[[List[float]], int], out_dir: Optional[Path]) -> Dict[str, Any]:
+    """
+    Run one stage and collect its metrics.
+
+    Args:
+        stage: Stage name
+        run: Called with a list to append per-item latencies (ms) to; returns items processed
+        out_dir: Directory whose growth counts as bytes written (None: stage writes nothing)
+    """
+    latencies: List[float] = []
+    bytes_before = dir_bytes(out_dir) if out_dir else 0
+    with RssSampler() as rss:
+        start = time.perf_counter()
+        items = run(latencies)
+        wall_s = time.perf_counter() - start
+    p50, p95 = percentile(latencies, 0.5), percentile(latencies, 0.95)
+    return {
+        "stage": stage,
+        "items": items,
+        "wall_s": round(wall_s, 4),
+        "throughput_per_s": round(items / wall_s, 2) if wall_s > 0 else None,
+        "p50_ms": round(p50, 2) if p50 is not None else None,
+        "p95_ms": round(p95, 2) if p95 is not None else None,
+        "peak_rss_mb": round(rss.peak / 1024 / 1024, 1) if rss.peak else None,
+        "bytes_written": dir_bytes(out_dir) - bytes_before if out_dir else None
+    }
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_standin(work_dir: Path, args) -> subprocess.Popen:
+    """Launch model_standin.py with synthetic feeds; wait until it answers."""
+    port = free_port()
+    items = -(-args.articles // args.feeds)
+    cmd = [
+        sys.executable, str(script_dir / "model_standin.py"),
+        "--port", str(port), "--speedup", str(args.speedup), "--decode-tps", str(args.decode_tps),
+        "--num-parallel", str(args.concurrency),
+        "--write-feeds-config", str(work_dir / "config" / "feeds.json"),
+        "--feeds", str(args.feeds), "--items", str(items)
+    ]
+    proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    proc.base_url = f"http://127.0.0.1:{port}"
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        try:
+            requests.get(f"{proc.base_url}/api/tags", timeout=1).raise_for_status()
+            return proc
+        except requests.RequestException:
+            if proc.poll() is not None:
+                break
+            time.sleep(0.1)
+    proc.kill()
+    raise RuntimeError("model stand-in did not start")
+
+
+def git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=script_dir,
+                             capture_output=True, text=True, timeout=10)
+        return out.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def run_benchmarks(args) -> Dict[str, Any]:
+    """Run the selected stages in pipeline order; returns the results document."""
+    stages = [s.strip() for s in args.stages.split(",")] if args.stages else STAGES
+    unknown = set(stages) - set(STAGES)
+    if unknown:
+        raise ValueError(f"Unknown stages: {', '.join(sorted(unknown))}")
+
+    work_dir = Path(tempfile.mkdtemp(prefix="bench-pipeline-"))
+    if not args.keep_outputs:
+        # At exit, so loggers flushing their manifests on shutdown go first
+        atexit.register(shutil.rmtree, work_dir, ignore_errors=True)
+    briefs_dir = work_dir / "content" / "briefs"
+    briefs_dir.mkdir(parents=True)
+    standin = start_standin(work_dir, args)
+    os.environ.update(BENCH_ENV)
+    os.environ["BRIEF_FEEDS_CONFIG"] = str(work_dir / "config" / "feeds.json")
+    os.environ["OLLAMA_ENDPOINT"] = f"{standin.base_url}/api/generate"
+    os.environ["BRIEF_MAX_ARTICLES"] = str(args.articles)
+    os.environ["BRIEF_SUMMARY_CONCURRENCY"] = str(args.concurrency)
+    os.environ["BRIEF_SUMMARY_MODE"] = args.summary_mode
+    logging.disable(logging.INFO)
+
+    # Imported after the environment is set (module-level GeminiClient choice)
+    import fetch_and_summarize as pipeline
+    import generate_daily_brief as daily
+    from model_standin import StandinGeminiClient
+    from publish_brief import BriefGenerator
+    from rkl_logging import StructuredLogger
+
+    with open(work_dir / "config" / "feeds.json") as f:
+        feeds_config = json.load(f)
+    state: Dict[str, Any] = {"articles": [], "summaries": []}
+    results = []
+
+    def research_logger(out_dir: Path) -> "StructuredLogger":
+        """Telemetry logger configured like fetch_and_summarize.main()."""
+        return StructuredLogger(base_dir=str(out_dir), rkl_version="1.0", batch_size=50, async_writes=True)
+
+    def fetch(latencies):
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            fetcher = pipeline.FeedFetcher(feeds_config, [])
+            state["articles"] = fetcher.fetch_feeds()[:args.articles]
+            latencies.append((time.perf_counter() - start) * 1000)
+        return len(state["articles"]) * args.repeat
+
+    def summarize(latencies, out_dir=None):
+        if not state["articles"]:
+            state["articles"] = pipeline.FeedFetcher(feeds_config, []).fetch_feeds()[:args.articles]
+        telemetry = research_logger(out_dir) if out_dir else None
+        client = pipeline.OllamaClient(os.environ["OLLAMA_ENDPOINT"], os.getenv("OLLAMA_MODEL", "llama3.2"),
+                                       research_logger=telemetry)
+        summarizer = pipeline.ArticleSummarizer(client, mode=args.summary_mode)
+
+        def one(article):
+            start = time.perf_counter()
+            summary = summarizer.summarize_article(
+                article["title"], article["content"] or article["summary"], article["link"])
+            latencies.append((time.perf_counter() - start) * 1000)
+            summary.pop("_step_timings", None)
+            summary.update({
+                "date": article["date"].strftime("%Y-%m-%d"),
+                "source": article["source"],
+                "category": article["category"]
+            })
+            return summary
+
+        with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+            state["summaries"] = list(pool.map(one, state["articles"]))
+        if telemetry:
+            telemetry.close()
+        return len(state["summaries"])
+
+    def qa(latencies, out_dir):
+        summaries = state["summaries"]
+
+        class TimedGeminiClient(StandinGeminiClient):
+            """Records the latency of each QA request (one per article unless batched)."""
+
+            def generate(self, *a, **kw):
+                start = time.perf_counter()
+                try:
+                    return super().generate(*a, **kw)
+                finally:
+                    latencies.append((time.perf_counter() - start) * 1000)
+
+        telemetry = research_logger(out_dir)
+        pipeline.GeminiClient = TimedGeminiClient
+        try:
+            pipeline.run_gemini_qa(summaries, "bench", telemetry)
+        finally:
+            pipeline.GeminiClient = StandinGeminiClient
+            telemetry.close()
+        # Same theme gate as main(); later stages see what would be published
+        state["summaries"] = [s for s in summaries if not s.pop("_drop", False)]
+        return len(summaries)
+
+    def articles_json() -> Path:
+        path = briefs_dir / f"{datetime.now().strftime('%Y-%m-%d')}_0900_articles.json"
+        if not path.exists():
+            with open(path, "w") as f:
+                json.dump({"session_id": "bench", "articles": state["summaries"]}, f, indent=2)
+        return path
+
+    def publish(latencies):
+        with open(articles_json()) as f:
+            articles_data = json.load(f)
+        generator = BriefGenerator()
+        for n in range(args.repeat):
+            start = time.perf_counter()
+            content = generator.generate_brief(articles_data, datetime.now().strftime("%Y-%m-%d"))
+            with open(work_dir / "website" / f"brief-{n}.md", "w") as f:
+                f.write(content)
+            latencies.append((time.perf_counter() - start) * 1000)
+        return args.repeat
+
+    def daily_brief(latencies):
+        json_path = articles_json()
+        daily.GeminiClient = StandinGeminiClient
+        daily.GEMINI_AVAILABLE = True
+        for n in range(args.repeat):
+            start = time.perf_counter()
+            daily.generate_daily_brief(json_path, work_dir / "daily" / f"daily-{n}.md")
+            latencies.append((time.perf_counter() - start) * 1000)
+        return args.repeat
+
+    def end_to_end(latencies):
+        pipeline.script_dir = work_dir / "e2e"
+        start = time.perf_counter()
+        pipeline.main()
+        latencies.append((time.perf_counter() - start) * 1000)
+        # Articles actually summarized (fewer than --articles if feeds ran short)
+        processed = 0
+        for path in (work_dir / "e2e" / "content" / "briefs").glob("*_articles.json"):
+            with open(path) as f:
+                processed += json.load(f).get("metadata", {}).get("num_articles", 0)
+        return processed
+
+    runners = {
+        "fetch": (fetch, None),
+        "summarize": (lambda latencies: summarize(latencies, work_dir / "summarize"), work_dir / "summarize"),
+        "qa": (lambda latencies: qa(latencies, work_dir / "qa"), work_dir / "qa"),
+        "publish": (publish, work_dir / "website"),
+        "daily_brief": (daily_brief, work_dir / "daily"),
+        "end_to_end": (end_to_end, work_dir / "e2e")
+    }
+    for name in ("summarize", "qa", "website", "daily", "e2e"):
+        (work_dir / name).mkdir(exist_ok=True)
+    if "summarize" not in stages and {"qa", "publish", "daily_brief"} & set(stages):
+        # Later stages need summaries even when summarize itself isn't benchmarked
+        summarize([])
+
+    try:
+        for stage in STAGES:
+            if stage in stages:
+                run, out_dir = runners[stage]
+                # Stage chatter (print-based progress) must not mix with --json output
+                with contextlib.redirect_stdout(sys.stderr):
+                    results.append(measure(stage, run, out_dir))
+                print(f"  {stage}: {results[-1]['wall_s']:.2f}s", file=sys.stderr)
+    finally:
+        standin.terminate()
+        standin.wait(timeout=10)
+        logging.disable(logging.NOTSET)
+
+    return {
+        "benchmark": "pipeline",
+        "commit": git_commit(),
+        "timestamp": datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "python": sys.version.split()[0],
+        "config": {
+            "articles": args.articles, "feeds": args.feeds, "concurrency": args.concurrency,
+            "summary_mode": args.summary_mode, "repeat": args.repeat,
+            "speedup": args.speedup, "decode_tps": args.decode_tps
+        },
+        "work_dir": str(work_dir) if args.keep_outputs else None,
+        "stages": results
+    }
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], threshold_pct: float) -> List[Dict[str, Any]]:
+    """
+    Per-stage deltas between two results documents.
+
+    Returns:
+        One row per (stage, metric) with baseline, current, change_pct and regression flag
+    """
+    # Higher is better for throughput; lower is better for the rest
+    metrics = {"throughput_per_s": 1, "p95_ms": -1, "p50_ms": -1, "peak_rss_mb": -1}
+    base_stages = {s["stage"]: s for s in baseline.get("stages", [])}
+    rows = []
+    for stage in current.get("stages", []):
+        base = base_stages.get(stage["stage"])
+        if not base:
+            continue
+        for metric, direction in metrics.items():
+            old, new = base.get(metric), stage.get(metric)
+            if not old or new is None:
+                continue
+            change_pct = (new - old) / old * 100
+            rows.append({
+                "stage": stage["stage"],
+                "metric": metric,
+                "baseline": old,
+                "current": new,
+                "change_pct": round(change_pct, 1),
+                # p50 is reported but only throughput, p95 and RSS gate
+                "regression": metric != "p50_ms" and -direction * change_pct > threshold_pct
+            })
+    return rows
+
+
+def print_results(results: Dict[str, Any]) -> None:
+    """Print stage results as a fixed-width table."""
+    print(f"Pipeline benchmark @ {results.get('commit') or 'unknown'} {results['config']}")
+    print(f"{'stage':<12} {'items':>6} {'wall_s':>8} {'items/s':>9} {'p50_ms':>9} {'p95_ms':>9} {'rss_mb':>7} {'bytes':>10}")
+    print("-" * 78)
+    for r in results["stages"]:
+        written = f"{r['bytes_written']:,}" if r["bytes_written"] is not None else "-"
+        print(
+            f"{r['stage']:<12} {r['items']:>6} {r['wall_s']:>8.2f} {r['throughput_per_s'] or 0:>9.1f} "
+            f"{r['p50_ms'] or 0:>9.1f} {r['p95_ms'] or 0:>9.1f} {r['peak_rss_mb'] or 0:>7.1f} {written:>10}"
+        )
+
+
+def print_comparison(rows: List[Dict[str, Any]]) -> None:
+    print(f"{'stage':<12} {'metric':<17} {'baseline':>10} {'current':>10} {'change':>8}")
+    print("-" * 62)
+    for r in rows:
+        flag = "  ❌ regression" if r["regression"] else ""
+        print(f"{r['stage']:<12} {r['metric']:<17} {r['baseline']:>10} {r['current']:>10} {r['change_pct']:>7.1f}%{flag}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the brief pipeline stage by stage")
+    parser.add_argument("--articles", type=int, default=200, help="Articles across all feeds (default: 200)")
+    parser.add_argument("--feeds", type=int, default=5, help="Synthetic feeds (default: 5)")
+    parser.add_argument("--concurrency", type=int, default=8, help="Articles summarized at once (default: 8)")
+    parser.add_argument("--summary-mode", choices=["multi", "json"], default="multi",
+                        help="multi or json (default: multi)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs of fetch/publish/daily_brief (default: 3)")
+    parser.add_argument("--speedup", type=float, default=0.0, help="Stand-in delay divisor; 0 = none (default: 0)")
+    parser.add_argument("--decode-tps", type=float, default=40.0, help="Stand-in decode rate (default: 40)")
+    parser.add_argument("--stages", default=None, help=f"Comma-separated subset of: {','.join(STAGES)}")
+    parser.add_argument("--output", type=Path, default=None, help="Write results JSON to PATH")
+    parser.add_argument("--compare", type=Path, default=None, help="Compare against a previous results JSON")
+    parser.add_argument("--threshold", type=float, default=10.0, help="Regression threshold in %% (default: 10)")
+    parser.add_argument("--keep-outputs", action="store_true", help="Keep the temporary work directory")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    results = run_benchmarks(args)
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+    rows = None
+    if args.compare:
+        with open(args.compare) as f:
+            rows = compare(json.load(f), results, args.threshold)
+        results["comparison"] = {"baseline": str(args.compare), "threshold_pct": args.threshold, "rows": rows}
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print_results(results)
+        if rows is not None:
+            print()
+            print_comparison(rows)
+
+    if rows and any(r["regression"] for r in rows):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Circuit breaker and rolling health stats for model backends.
+
+A CircuitBreaker wraps calls to one backend (Gemini, an Ollama endpoint):
+
+- closed:    calls flow; outcomes are recorded in a rolling window
+- open:      calls are refused until cooldown_s has passed
+- half-open: after the cooldown, a limited number of trial calls go through;
+             a success closes the breaker, a failure re-opens it
+
+The breaker trips on failure_threshold consecutive failures, or when the
+rolling success rate over the last `window` calls drops below
+min_success_rate. Successes slower than slow_call_ms count as unhealthy for
+the success rate, so a backend that answers but too slowly is also avoided.
+
+No probing happens up front: the first real call is the health check, which
+keeps client construction instant.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Three-state circuit breaker with rolling success rate and latency.
+
+    Example:
+        breaker = CircuitBreaker("gemini", failure_threshold=3, cooldown_s=60)
+        if breaker.allow_request():
+            start = time.time()
+            try:
+                result = call_backend()
+                breaker.record_success((time.time() - start) * 1000)
+            except Exception:
+                breaker.record_failure()
+                raise
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 3,
+        cooldown_s: float = 60.0,
+        window: int = 20,
+        min_success_rate: float = 0.5,
+        min_calls: int = 5,
+        slow_call_ms: Optional[float] = None,
+        half_open_max_calls: int = 1
+    ):
+        """
+        Initialize CircuitBreaker.
+
+        Args:
+            name: Backend name used in log messages
+            failure_threshold: Consecutive failures that open the breaker
+            cooldown_s: Seconds to stay open before allowing trial calls
+            window: Number of recent calls used for success rate and latency
+            min_success_rate: Open when the rolling success rate falls below this
+            min_calls: Calls needed in the window before the success rate can trip
+            slow_call_ms: Successes slower than this count as unhealthy (None = off)
+            half_open_max_calls: Concurrent trial calls allowed while half-open
+        """
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.cooldown_s = cooldown_s
+        self.min_success_rate = min_success_rate
+        self.min_calls = max(1, min_calls)
+        self.slow_call_ms = slow_call_ms
+        self.half_open_max_calls = max(1, half_open_max_calls)
+
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._consecutive_failures = 0
+        self._half_open_inflight = 0
+        self._outcomes = deque(maxlen=window)   # True = healthy call
+        self._latencies = deque(maxlen=window)  # ms, successful calls only
+        self._lock = threading.Lock()
+        self._stats = {"calls": 0, "failures": 0, "rejected": 0, "opened": 0}
+
+    @property
+    def state(self) -> str:
+        """Current state (an open breaker past its cooldown reports half_open)."""
+        with self._lock:
+            self._maybe_half_open(time.monotonic())
+            return self._state
+
+    def _maybe_half_open(self, now: float) -> None:
+        if self._state == OPEN and now - self._opened_at >= self.cooldown_s:
+            self._state = HALF_OPEN
+            self._half_open_inflight = 0
+            logger.info(f"Circuit {self.name}: half-open, allowing trial call")
+
+    def _open(self, reason: str) -> None:
+        """Trip the breaker (lock held)."""
+        if self._state != OPEN:
+            self._stats["opened"] += 1
+            logger.warning(f"Circuit {self.name}: open for {self.cooldown_s:.0f}s ({reason})")
+        self._state = OPEN
+        self._opened_at = time.monotonic()
+        self._half_open_inflight = 0
+
+    def allow_request(self) -> bool:
+        """
+        Whether a call may be sent now.
+
+        In half-open state this reserves one of the trial slots, so every
+        True must be followed by record_success() or record_failure().
+        """
+        with self._lock:
+            self._maybe_half_open(time.monotonic())
+            if self._state == CLOSED:
+                return True
+            if self._state == HALF_OPEN and self._half_open_inflight < self.half_open_max_calls:
+                self._half_open_inflight += 1
+                return True
+            self._stats["rejected"] += 1
+            return False
+
+    def record_success(self, latency_ms: Optional[float] = None) -> None:
+        """Record a successful call and its latency."""
+        with self._lock:
+            self._stats["calls"] += 1
+            healthy = not (self.slow_call_ms and latency_ms is not None and latency_ms > self.slow_call_ms)
+            self._outcomes.append(healthy)
+            if latency_ms is not None:
+                self._latencies.append(latency_ms)
+            self._consecutive_failures = 0
+            if self._state == HALF_OPEN:
+                self._state = CLOSED
+                self._half_open_inflight = 0
+                # Start the window fresh so old failures don't re-trip it immediately
+                self._outcomes.clear()
+                self._outcomes.append(healthy)
+                logger.info(f"Circuit {self.name}: closed")
+            elif self._rate_tripped():
+                self._open(f"success rate {self._success_rate():.0%} (slow calls)")
+
+    def record_failure(self) -> None:
+        """Record a failed call."""
+        with self._lock:
+            self._stats["calls"] += 1
+            self._stats["failures"] += 1
+            self._outcomes.append(False)
+            self._consecutive_failures += 1
+            if self._state == HALF_OPEN:
+                self._open("trial call failed")
+            elif self._consecutive_failures >= self.failure_threshold:
+                self._open(f"{self._consecutive_failures} consecutive failures")
+            elif self._rate_tripped():
+                self._open(f"success rate {self._success_rate():.0%}")
+
+    def _success_rate(self) -> Optional[float]:
+        if not self._outcomes:
+            return None
+        return sum(self._outcomes) / len(self._outcomes)
+
+    def _rate_tripped(self) -> bool:
+        return (
+            self._state == CLOSED
+            and len(self._outcomes) >= self.min_calls
+            and self._success_rate() < self.min_success_rate
+        )
+
+    def _percentile(self, q: float) -> Optional[float]:
+        if not self._latencies:
+            return None
+        ordered = sorted(self._latencies)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    @property
+    def success_rate(self) -> Optional[float]:
+        """Share of healthy calls in the rolling window (None before any call)."""
+        with self._lock:
+            return self._success_rate()
+
+    def latency_ms(self, q: float = 0.5) -> Optional[float]:
+        """Rolling latency percentile of successful calls (q in 0..1)."""
+        with self._lock:
+            return self._percentile(q)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """State, counters, rolling success rate and p50/p95 latency."""
+        with self._lock:
+            self._maybe_half_open(time.monotonic())
+            stats = dict(self._stats)
+            rate = self._success_rate()
+            p50, p95 = self._percentile(0.5), self._percentile(0.95)
+            stats.update({
+                "state": self._state,
+                "success_rate": round(rate, 3) if rate is not None else None,
+                "p50_ms": round(p50) if p50 is not None else None,
+                "p95_ms": round(p95) if p95 is not None else None
+            })
+        return stats
@@ -0,0 +1,385 @@
+#!/usr/bin/env python3
+"""
+Telemetry Compactor - Merge many small batch files into a few sorted Parquet files
+
+Rewrites each data/research/{artifact}/YYYY/MM/DD/ partition into one (or a
+few, see --max-rows-per-file) Parquet files sorted by (session_id, t), so
+fix_manifest.py, health_check.py and DuckDB scans touch a handful of files
+instead of hundreds.
+
+- Inputs may be a mix of Parquet and NDJSON batches (NDJSON fallback mode)
+- Schema drift between files is resolved by promoting types (int -> double,
+  missing columns -> null); irreconcilable columns are JSON-encoded strings
+- Row counts are verified before anything is replaced
+- Crash-safe: outputs are written to hidden temp files, a journal records the
+  swap, and an interrupted run is rolled forward (or back) on the next run
+- Idempotent: a partition already holding only compacted files of one run is skipped
+- Updates the daily manifest atomically (tmp file + rename, under the same
+  manifests/YYYY-MM-DD.json.lock file StructuredLogger uses). The lock file
+  is left in place on purpose: deleting it would let a process already
+  waiting on the old file and one creating a new file both hold "the" lock
+
+Safe to run from cron after each brief. Open rolling files from a running
+logger (hidden .*.tmp) and files that appear mid-run are left untouched.
+
+Usage:
+    python scripts/compact_telemetry.py [--date YYYY-MM-DD] [--base-dir PATH]
+
+Options:
+    --date YYYY-MM-DD        Only compact this date (default: all dates)
+    --artifact NAME          Only compact this artifact (default: all)
+    --base-dir PATH          Research data directory (default: ./data/research)
+    --max-rows-per-file N    Split outputs larger than N rows (default: 1000000)
+    --dry-run                Report what would be compacted without writing
+"""
+
+import os
+import sys
+import json
+import argparse
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, List, Optional
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    print("❌ pyarrow required for compaction")
+    print("   Install: pip install pyarrow")
+    exit(1)
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from rkl_logging.columnar import ColumnarBatchBuilder  # noqa: E402
+
+JOURNAL_NAME = ".compaction.json"
+TEMP_PREFIX = ".compact-"
+COMPACTED_MARKER = "_compacted_"
+SORT_KEYS = ["session_id", "t", "timestamp"]
+
+
+def list_partitions(base_dir: Path, date_str: Optional[str] = None,
+                    artifact: Optional[str] = None) -> List[Path]:
+    """Find artifact/YYYY/MM/DD partition directories."""
+    partitions = []
+    for artifact_dir in sorted(base_dir.iterdir()):
+        if not artifact_dir.is_dir() or artifact_dir.name == "manifests":
+            continue
+        if artifact and artifact_dir.name != artifact:
+            continue
+        for day_dir in sorted(artifact_dir.glob("[0-9][0-9][0-9][0-9]/[0-9][0-9]/[0-9][0-9]")):
+            if date_str and partition_date(day_dir) != date_str:
+                continue
+            partitions.append(day_dir)
+    return partitions
+
+
+def partition_date(day_dir: Path) -> str:
+    """artifact/YYYY/MM/DD -> YYYY-MM-DD"""
+    return f"{day_dir.parent.parent.name}-{day_dir.parent.name}-{day_dir.name}"
+
+
+def data_files(day_dir: Path) -> List[Path]:
+    """Committed batch files in a partition (hidden temp/journal files excluded)."""
+    return sorted(
+        f for f in day_dir.iterdir()
+        if f.is_file() and not f.name.startswith(".") and f.suffix in (".parquet", ".ndjson")
+    )
+
+
+def read_file(path: Path, artifact: str) -> pa.Table:
+    """Read a Parquet or NDJSON batch file into an Arrow table."""
+    if path.suffix == ".parquet":
+        return pq.read_table(path)
+
+    records = []
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                records.append(json.loads(line))
+    return ColumnarBatchBuilder(artifact).extend(records).to_table()
+
+
+def combine_tables(tables: List[pa.Table], artifact: str) -> pa.Table:
+    """Concatenate tables with drifting schemas."""
+    try:
+        return pa.concat_tables(tables, promote_options="permissive")
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        # Irreconcilable types: rebuild through the schema-aware builder,
+        # which JSON-encodes columns that can't share one Arrow type
+        builder = ColumnarBatchBuilder(artifact)
+        for table in tables:
+            builder.extend(table.to_pylist())
+        return builder.to_table()
+
+
+def sort_table(table: pa.Table) -> pa.Table:
+    """Sort by session_id, t (falling back to timestamp) where present."""
+    keys = [k for k in SORT_KEYS if k in table.column_names]
+    if "t" in keys and "timestamp" in keys:
+        keys.remove("timestamp")
+    if not keys:
+        return table
+    return table.sort_by([(k, "ascending") for k in keys])
+
+
+def write_journal(day_dir: Path, journal: Dict) -> None:
+    """Atomically write the compaction journal for a partition."""
+    tmp_path = day_dir / f"{JOURNAL_NAME}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(journal, f, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, day_dir / JOURNAL_NAME)
+
+
+def recover_partition(day_dir: Path) -> None:
+    """
+    Finish or undo a compaction interrupted by a crash.
+
+    The journal is only written once every output temp file is complete, so
+    if it exists the swap can always be rolled forward. Temp outputs without
+    a journal are from a run that died before committing and are discarded.
+    """
+    journal_path = day_dir / JOURNAL_NAME
+    if journal_path.exists():
+        with open(journal_path) as f:
+            journal = json.load(f)
+
+        outputs_ok = True
+        for name in journal["outputs"]:
+            final_path = day_dir / name
+            tmp_path = day_dir / f"{TEMP_PREFIX}{name}.tmp"
+            if not final_path.exists():
+                if tmp_path.exists():
+                    os.replace(tmp_path, final_path)
+                else:
+                    outputs_ok = False
+
+        if outputs_ok:
+            for name in journal["inputs"]:
+                (day_dir / name).unlink(missing_ok=True)
+            print(f"   ↻ {day_dir}: rolled forward interrupted compaction")
+        else:
+            # Outputs went missing: keep the inputs, drop partial outputs
+            for name in journal["outputs"]:
+                (day_dir / name).unlink(missing_ok=True)
+            print(f"   ↺ {day_dir}: rolled back interrupted compaction")
+        journal_path.unlink()
+
+    for stale in day_dir.glob(f"{TEMP_PREFIX}*.tmp"):
+        stale.unlink()
+    (day_dir / f"{JOURNAL_NAME}.tmp").unlink(missing_ok=True)
+
+
+def compact_partition(day_dir: Path, max_rows_per_file: int, dry_run: bool = False) -> Optional[Dict]:
+    """
+    Compact one partition.
+
+    Returns:
+        Dict with artifact, date, input/output file counts and rows, or None if skipped
+    """
+    artifact = day_dir.parent.parent.parent.name
+    date_str = partition_date(day_dir)
+
+    if not dry_run:
+        recover_partition(day_dir)
+
+    inputs = data_files(day_dir)
+    if not inputs:
+        return None
+    generations = {
+        p.name.split(COMPACTED_MARKER, 1)[1].split("_")[0] if COMPACTED_MARKER in p.name else None
+        for p in inputs
+    }
+    if len(generations) == 1 and None not in generations:
+        return None  # Already compacted (one generation, nothing new since)
+
+    tables = [read_file(path, artifact) for path in inputs]
+    input_rows = sum(t.num_rows for t in tables)
+
+    if dry_run:
+        print(f"   • {artifact} {date_str}: {len(inputs)} file(s), {input_rows} rows (dry run)")
+        return {"artifact": artifact, "date": date_str, "input_files": len(inputs),
+                "output_files": 0, "rows": input_rows}
+
+    table = sort_table(combine_tables(tables, artifact))
+    if table.num_rows != input_rows:
+        raise RuntimeError(
+            f"{artifact} {date_str}: row count mismatch ({table.num_rows} != {input_rows})"
+        )
+
+    # Generation stamp keeps new outputs from colliding with earlier compacted files
+    generation = datetime.utcnow().strftime("%Y%m%d%H%M%S")
+    outputs = []
+    for part, offset in enumerate(range(0, max(table.num_rows, 1), max_rows_per_file)):
+        name = f"{artifact}{COMPACTED_MARKER}{generation}_{part:03d}.parquet"
+        tmp_path = day_dir / f"{TEMP_PREFIX}{name}.tmp"
+        pq.write_table(table.slice(offset, max_rows_per_file), tmp_path, compression="snappy")
+        outputs.append(name)
+
+    written_rows = sum(
+        pq.ParquetFile(day_dir / f"{TEMP_PREFIX}{name}.tmp").metadata.num_rows for name in outputs
+    )
+    if written_rows != input_rows:
+        raise RuntimeError(
+            f"{artifact} {date_str}: wrote {written_rows} rows, expected {input_rows}"
+        )
+
+    # Commit: journal -> rename outputs -> delete inputs -> drop journal
+    write_journal(day_dir, {
+        "inputs": [p.name for p in inputs],
+        "outputs": outputs,
+        "rows": input_rows,
+        "started_at": datetime.utcnow().isoformat() + "Z"
+    })
+    for name in outputs:
+        os.replace(day_dir / f"{TEMP_PREFIX}{name}.tmp", day_dir / name)
+    for path in inputs:
+        path.unlink(missing_ok=True)
+    (day_dir / JOURNAL_NAME).unlink()
+
+    print(f"   ✅ {artifact} {date_str}: {len(inputs)} → {len(outputs)} file(s), {input_rows} rows")
+    return {"artifact": artifact, "date": date_str, "input_files": len(inputs),
+            "output_files": len(outputs), "rows": input_rows}
+
+
+def update_manifest(base_dir: Path, date_str: str, results: List[Dict]) -> None:
+    """
+    Record compaction results in the daily manifest (atomic, under lock).
+
+    Row counts are left as logged: compaction preserves rows exactly (and
+    verifies it), so only file counts and a compaction timestamp change.
+    The empty .json.lock file is shared with StructuredLogger and is never
+    removed (see module docstring).
+    """
+    manifest_dir = base_dir / "manifests"
+    manifest_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = manifest_dir / f"{date_str}.json"
+
+    lock_file = open(manifest_path.with_suffix(".json.lock"), "w")
+    try:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+
+        manifest = {"date": date_str, "rkl_version": "1.0", "artifacts": {}}
+        if manifest_path.exists():
+            try:
+                with open(manifest_path) as f:
+                    manifest = json.load(f)
+            except (json.JSONDecodeError, IOError):
+                print(f"⚠️  Could not load manifest {manifest_path.name}, rewriting compaction info only")
+        manifest.setdefault("artifacts", {})
+
+        compacted_at = datetime.utcnow().isoformat() + "Z"
+        for result in results:
+            entry = manifest["artifacts"].setdefault(
+                result["artifact"], {"rows": result["rows"], "writes": 0, "schema_version": "v1.0"}
+            )
+            entry["files"] = result["output_files"]
+            entry["compacted_at"] = compacted_at
+            entry["compacted_rows"] = result["rows"]
+
+        tmp_path = manifest_path.with_suffix(".json.tmp")
+        with open(tmp_path, "w") as f:
+            f.write(json.dumps(manifest, indent=2))
+        os.replace(tmp_path, manifest_path)
+    finally:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+        lock_file.close()
+
+
+def compact(base_dir: Path, date_str: Optional[str] = None, artifact: Optional[str] = None,
+            max_rows_per_file: int = 1_000_000, dry_run: bool = False) -> List[Dict]:
+    """Compact all matching partitions and update manifests. Returns per-partition results."""
+    print("=" * 60)
+    print("Telemetry Compactor")
+    print("=" * 60)
+    print(f"\nBase directory: {base_dir}")
+    print(f"Date: {date_str or 'all'} | Artifact: {artifact or 'all'}")
+    print()
+
+    results = []
+    for day_dir in list_partitions(base_dir, date_str, artifact):
+        try:
+            result = compact_partition(day_dir, max_rows_per_file, dry_run)
+        except Exception as e:
+            print(f"   ❌ {day_dir}: {e} (partition left unchanged)")
+            continue
+        if result:
+            results.append(result)
+
+    if not dry_run:
+        by_date: Dict[str, List[Dict]] = {}
+        for result in results:
+            by_date.setdefault(result["date"], []).append(result)
+        for day, day_results in sorted(by_date.items()):
+            update_manifest(base_dir, day, day_results)
+
+    print()
+    print("=" * 60)
+    files_before = sum(r["input_files"] for r in results)
+    files_after = sum(r["output_files"] for r in results)
+    if dry_run:
+        print(f"DRY RUN: {len(results)} partition(s), {files_before} file(s) would be compacted")
+    elif results:
+        print(f"✅ COMPACTED {len(results)} partition(s): {files_before} → {files_after} file(s)")
+    else:
+        print("✅ Nothing to compact")
+    print("=" * 60)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compact telemetry partitions into sorted Parquet files"
+    )
+    parser.add_argument(
+        "--date",
+        type=str,
+        default=None,
+        help="Only compact this date (YYYY-MM-DD, default: all dates)"
+    )
+    parser.add_argument(
+        "--artifact",
+        type=str,
+        default=None,
+        help="Only compact this artifact (default: all)"
+    )
+    parser.add_argument(
+        "--base-dir",
+        type=Path,
+        default=Path("./data/research"),
+        help="Research data directory (default: ./data/research)"
+    )
+    parser.add_argument(
+        "--max-rows-per-file",
+        type=int,
+        default=1_000_000,
+        help="Split compacted output above this many rows (default: 1000000)"
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Report what would be compacted without writing"
+    )
+
+    args = parser.parse_args()
+
+    if not args.base_dir.exists():
+        print(f"❌ Base directory not found: {args.base_dir}")
+        print("   Check that you're running from the project root")
+        exit(1)
+
+    compact(args.base_dir, args.date, args.artifact, args.max_rows_per_file, args.dry_run)
+
+
+if __name__ == "__main__":
+    main()
@@ -71,6 +71,12 @@ if [ $EXIT_CODE -eq 0 ]; then
     else
         echo "⚠️  No articles JSON found - skipping daily brief" >> "$LOG_FILE"
     fi
+
+    # Merge today's small telemetry batch files into sorted Parquet (idempotent, crash-safe)
+    echo "" >> "$LOG_FILE"
+    echo "Compacting telemetry..." >> "$LOG_FILE"
+    $PYTHON_BIN scripts/compact_telemetry.py --date "$(date -u +%Y-%m-%d)" >> "$LOG_FILE" 2>&1 \
+        || echo "⚠️  Telemetry compaction failed (data left uncompacted)" >> "$LOG_FILE"
 else
     echo "⚠️  Pipeline failed - skipping health check and daily brief" >> "$LOG_FILE"
 fi
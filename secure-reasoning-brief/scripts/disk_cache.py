@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Small on-disk JSON cache shared by the brief pipeline scripts.
+
+Each entry is one JSON file named by the sha256 of its key:
+
+    {cache_dir}/{sha[:2]}/{sha}.json   ->   {"key": ..., "stored_at": ..., "value": ...}
+
+- Writes go to a temp file and are moved into place with os.replace(), so
+  concurrent threads/processes never read a half-written entry
+- Entries older than ttl_seconds are treated as missing (and removed)
+- prune() evicts expired entries, then the least recently used ones until
+  the cache is under max_entries / max_bytes
+
+Values must be JSON-serializable. The cache only ever holds data that is
+already stored locally (feeds, derived summaries); nothing here leaves the host.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+class DiskCache:
+    """
+    Content-addressed JSON cache with TTL and size-based eviction.
+
+    Example:
+        cache = DiskCache("data/cache/feeds", ttl_seconds=14 * 86400, max_entries=500)
+        entry = cache.get(url)
+        if entry is None:
+            entry = fetch(url)
+            cache.set(url, entry)
+        cache.prune()
+    """
+
+    def __init__(
+        self,
+        cache_dir: str,
+        ttl_seconds: Optional[float] = None,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None
+    ):
+        """
+        Initialize DiskCache.
+
+        Args:
+            cache_dir: Directory holding cache entries (created if missing)
+            ttl_seconds: Entries older than this are ignored and evicted (None = no expiry)
+            max_entries: prune() keeps at most this many entries (None = unlimited)
+            max_bytes: prune() keeps total entry size under this (None = unlimited)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "writes": 0, "evictions": 0}
+
+    @staticmethod
+    def key_hash(key: str) -> str:
+        """sha256 hex digest used as the entry file name."""
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        digest = self.key_hash(key)
+        return self.cache_dir / digest[:2] / f"{digest}.json"
+
+    def _count(self, stat: str, n: int = 1) -> None:
+        with self._lock:
+            self._stats[stat] += n
+
+    def _expired(self, stored_at: float, now: Optional[float] = None) -> bool:
+        if self.ttl_seconds is None:
+            return False
+        return (now or time.time()) - stored_at > self.ttl_seconds
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Return the cached value for key, or None on miss/expiry/corruption.
+
+        A hit refreshes the entry's mtime so prune() evicts in LRU order.
+        """
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            self._count("misses")
+            return None
+        except (OSError, ValueError):
+            self._remove(path)
+            self._count("misses")
+            return None
+
+        if entry.get("key") != key or self._expired(entry.get("stored_at", 0)):
+            if entry.get("key") == key:
+                self._remove(path)
+                self._count("evictions")
+            self._count("misses")
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self._count("hits")
+        return entry.get("value")
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a JSON-serializable value under key (atomic replace)."""
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        payload = {"key": key, "stored_at": time.time(), "value": value}
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(payload, f, default=str)
+            os.replace(tmp_path, path)
+        except BaseException:
+            self._remove(tmp_path)
+            raise
+        self._count("writes")
+
+    def delete(self, key: str) -> None:
+        """Remove an entry if present."""
+        self._remove(self._path(key))
+
+    @staticmethod
+    def _remove(path: Path) -> None:
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+
+    def prune(self) -> int:
+        """
+        Evict expired entries, then least recently used ones over the size limits.
+
+        Returns:
+            Number of entries removed
+        """
+        now = time.time()
+        entries = []
+        removed = 0
+        for path in self.cache_dir.glob("*/*.json"):
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                continue
+            # mtime >= stored_at (writes and hits touch it), so an old mtime means expired
+            if self._expired(st.st_mtime, now):
+                self._remove(path)
+                removed += 1
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+
+        entries.sort()  # oldest first
+        total_bytes = sum(size for _, size, _ in entries)
+        count = len(entries)
+        for _, size, path in entries:
+            over_entries = self.max_entries is not None and count > self.max_entries
+            over_bytes = self.max_bytes is not None and total_bytes > self.max_bytes
+            if not (over_entries or over_bytes):
+                break
+            self._remove(path)
+            removed += 1
+            count -= 1
+            total_bytes -= size
+
+        if removed:
+            self._count("evictions", removed)
+        return removed
+
+    def get_stats(self) -> Dict[str, int]:
+        """Hit/miss/write/eviction counters for this process."""
+        with self._lock:
+            return dict(self._stats)
@@ -41,12 +41,21 @@ import requests
 import feedparser
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+from urllib.parse import urlparse
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+import hashlib
+import random
+import re
+import shlex
 import subprocess
+import threading
 import platform
+from collections import OrderedDict
 
 # CRITICAL: Load .env BEFORE importing GeminiClient (which checks USE_VERTEX_AI)
 script_dir = Path(__file__).parent.parent
@@ -58,9 +67,15 @@ try:
 except ImportError:
     psutil = None
 
+from disk_cache import DiskCache
+
 # Optional Gemini QA
 try:
-    from gemini_client import GeminiClient  # type: ignore
+    if os.getenv("GEMINI_STANDIN", "false").lower() in ("1", "true", "yes"):
+        # Offline load tests: replay recorded QA verdicts (see model_standin.py)
+        from model_standin import StandinGeminiClient as GeminiClient  # type: ignore
+    else:
+        from gemini_client import GeminiClient  # type: ignore
     GEMINI_CLIENT_AVAILABLE = True
 except Exception as e:
     GEMINI_CLIENT_AVAILABLE = False
@@ -69,7 +84,9 @@ except Exception as e:
 # Import RKL logging for research telemetry
 try:
     sys.path.insert(0, str(Path(__file__).parent.parent))
-    from rkl_logging import StructuredLogger, sha256_text
+    from rkl_logging import StructuredLogger, record_class, sha256_text
+    BoundaryEvent = record_class("boundary_event")
+    ExecutionContext = record_class("execution_context")
     RKL_LOGGING_AVAILABLE = True
 except ImportError:
     RKL_LOGGING_AVAILABLE = False
@@ -98,6 +115,19 @@ class OllamaClient:
     - Records boundary events to verify Type III compliance
     - Generates research data for studying model performance
 
+    Transport:
+    - One pooled requests.Session per client (keep-alive, OLLAMA_POOL_SIZE)
+    - Separate connect/read timeouts (OLLAMA_CONNECT_TIMEOUT / OLLAMA_READ_TIMEOUT)
+    - Connection errors and 5xx responses are retried up to OLLAMA_MAX_RETRIES
+      times with full-jitter exponential backoff (base OLLAMA_RETRY_BACKOFF
+      seconds, capped at 30s); retry_count is logged with the call
+
+    Streaming (OLLAMA_STREAM=true):
+    - Consumes Ollama's NDJSON token stream as it arrives and records
+      time-to-first-token, tokens/sec and prompt-eval vs eval durations
+    - Callers may pass a word budget and stop patterns; once either is hit the
+      stream is closed, which makes Ollama stop generating
+
     Attributes:
         endpoint (str): Ollama API endpoint (e.g., http://192.168.1.11:11434/api/generate)
         model (str): Model name to use (e.g., llama3.2:3b, llama3.2:8b)
@@ -120,6 +150,24 @@ class OllamaClient:
         self.endpoint = endpoint
         self.model = model
         self.research_logger = research_logger
+        # Keep the model (and its prompt cache) loaded between calls
+        self.keep_alive = os.getenv("OLLAMA_KEEP_ALIVE", "10m")
+
+        self.timeout = (
+            float(os.getenv("OLLAMA_CONNECT_TIMEOUT", "5")),
+            float(os.getenv("OLLAMA_READ_TIMEOUT", "120"))
+        )
+        self.max_retries = max(0, int(os.getenv("OLLAMA_MAX_RETRIES", "3")))
+        self.retry_backoff = float(os.getenv("OLLAMA_RETRY_BACKOFF", "1.0"))
+        self.retry_backoff_max = 30.0
+
+        self.stream = os.getenv("OLLAMA_STREAM", "false").lower() in ("1", "true", "yes")
+
+        pool_size = max(1, int(os.getenv("OLLAMA_POOL_SIZE", "8")))
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
 
     def generate(self, prompt: str, system_prompt: Optional[str] = None,
                  agent_id: str = "unknown", session_id: Optional[str] = None,
@@ -145,77 +193,588 @@ class OllamaClient:
         Raises:
             Does not raise - logs errors and returns empty string
         """
+        generated_text, stats = self.generate_with_stats(prompt, system_prompt)
+        self.log_retries(agent_id, session_id, artifact_id, stats)
+        if stats.get("error"):
+            return ""
+
+        # Log execution context for research
+        if self.research_logger and RKL_LOGGING_AVAILABLE:
+            self.log_execution(
+                prompt, system_prompt, generated_text,
+                agent_id=agent_id, session_id=session_id, turn_id=turn_id,
+                artifact_id=artifact_id, latency_ms=stats["latency_ms"],
+                prompt_tokens=stats["prompt_tokens"], gen_tokens=stats["gen_tokens"],
+                options=stats["payload"], cache_hit=False,
+                extra=self.timing_fields(stats)
+            )
+            self.log_boundary(agent_id, session_id)
+
+        return generated_text
+
+    def generate_with_stats(self, prompt: str, system_prompt: Optional[str] = None,
+                            format: Optional[str] = None,
+                            context: Optional[List[int]] = None,
+                            max_words: Optional[int] = None,
+                            stop_patterns: Optional[List[str]] = None,
+                            affinity: Optional[str] = None) -> Tuple[str, Dict]:
+        """
+        Call Ollama without logging telemetry; return (response, stats).
+
+        Used by callers that attribute one model call to several agents
+        (see ArticleSummarizer JSON mode) and log telemetry themselves.
+
+        Args:
+            prompt: User prompt to send to the model
+            system_prompt: Optional system prompt to set model behavior
+            format: Ollama output format ("json" constrains output to valid JSON)
+            context: Token context returned by an earlier call; the prompt is
+                then evaluated as a continuation of that call
+            max_words: Streaming only - stop once the response reaches this many words
+            stop_patterns: Streaming only - regexes; stop (and cut) at the first match
+            affinity: Endpoint pools only - calls with the same key (e.g. an
+                artifact_id) go to the same server while it is healthy
+
+        Returns:
+            (generated_text, stats) where stats has latency_ms, retry_count,
+            prompt_tokens, gen_tokens, prompt_eval_ms / eval_ms (None if not
+            reported), context, payload and, when streaming, ttft_ms,
+            tokens_per_sec and stop_reason; or "error" (text is then "")
+        """
         start_time = time.time()
 
         payload = {
             "model": self.model,
             "prompt": prompt,
-            "stream": False
+            "stream": self.stream
         }
 
         if system_prompt:
             payload["system"] = system_prompt
+        if format:
+            payload["format"] = format
+        if context:
+            payload["context"] = context
+        if self.keep_alive:
+            payload["keep_alive"] = self.keep_alive
+
+        stream_stats = {}
+        retry_count = 0
+        try:
+            response, retry_count = self._post_with_retries(payload)
+            if self.stream:
+                generated_text, result, stream_stats = self._consume_stream(
+                    response, start_time, max_words, stop_patterns
+                )
+            else:
+                result = response.json()
+                generated_text = result.get("response", "")
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Error calling Ollama API: {e}")
+            return "", {
+                "error": str(e),
+                "latency_ms": int((time.time() - start_time) * 1000),
+                # Errors raised mid-stream come after any retries of the POST
+                "retry_count": getattr(e, "retry_count", retry_count)
+            }
+
+        prompt_eval_ns = result.get("prompt_eval_duration")
+        eval_ns = result.get("eval_duration")
+        # Prefer Ollama's actual counts if available, fallback to word count estimates
+        stats = {
+            "latency_ms": int((time.time() - start_time) * 1000),
+            "retry_count": retry_count,
+            "prompt_tokens": result.get("prompt_eval_count", len(prompt.split())),
+            "gen_tokens": result.get("eval_count", len(generated_text.split())),
+            "prompt_eval_ms": int(prompt_eval_ns / 1e6) if prompt_eval_ns is not None else None,
+            "eval_ms": int(eval_ns / 1e6) if eval_ns is not None else None,
+            "context": result.get("context"),
+            "payload": payload,
+            "host": urlparse(self.endpoint).netloc
+        }
+        stats.update(stream_stats)
+        return generated_text, stats
+
+    @staticmethod
+    def _truncate_words(text: str, max_words: int) -> str:
+        """Cut text after its max_words-th word (whitespace preserved before it)."""
+        match = re.match(r"\s*(?:\S+\s+){%d}" % max_words, text)
+        return text[:match.end()].rstrip() if match else text
 
+    def _consume_stream(self, response, start_time: float, max_words: Optional[int],
+                        stop_patterns: Optional[List[str]]) -> Tuple[str, Dict, Dict]:
+        """
+        Read an NDJSON generate stream until done or an early-stop condition.
+
+        Returns:
+            (generated_text, final_chunk, stream_stats). final_chunk holds
+            Ollama's counters/durations ({} if the stream was cut early, in
+            which case eval figures are measured client-side).
+        """
+        compiled = [re.compile(pattern) for pattern in (stop_patterns or [])]
+        text = ""
+        words = 0
+        chunks = 0
+        first_token_at = None
+        final = {}
+        stop_reason = "done"
         try:
-            response = requests.post(self.endpoint, json=payload, timeout=120)
-            response.raise_for_status()
-            result = response.json()
-            generated_text = result.get("response", "")
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                try:
+                    chunk = json.loads(line)
+                except ValueError as e:
+                    # Truncated/malformed line: fail the call like any other transport error
+                    raise requests.exceptions.RequestException(f"Malformed stream chunk: {e}") from e
+                if chunk.get("error"):
+                    raise requests.exceptions.RequestException(chunk["error"])
+                if chunk.get("done"):
+                    final = chunk
+                piece = chunk.get("response", "")
+                if piece:
+                    if first_token_at is None:
+                        first_token_at = time.time()
+                    # Running word count: a piece continuing the previous word adds no new word
+                    words += len(piece.split())
+                    if text and not text[-1].isspace() and not piece[0].isspace():
+                        words -= 1
+                    text += piece
+                    chunks += 1
+
+                    # Checks run on the final chunk too, so its text is cut as well
+                    cut = None
+                    for pattern in compiled:
+                        match = pattern.search(text)
+                        if match and (cut is None or match.start() < cut):
+                            cut = match.start()
+                    if cut is not None:
+                        text, stop_reason = text[:cut], "stop_pattern"
+                        break
+                    if max_words and words > max_words:
+                        text, stop_reason = self._truncate_words(text, max_words), "max_words"
+                        break
+                if final:
+                    break
+        finally:
+            # Closing the connection mid-stream makes Ollama stop generating
+            response.close()
+
+        end = time.time()
+        stream_stats = {
+            "streamed": True,
+            "stop_reason": stop_reason,
+            "ttft_ms": int((first_token_at - start_time) * 1000) if first_token_at else None
+        }
+        if final.get("eval_count") and final.get("eval_duration"):
+            stream_stats["tokens_per_sec"] = round(final["eval_count"] / (final["eval_duration"] / 1e9), 2)
+        elif first_token_at and end > first_token_at and chunks > 1:
+            # Cut early: no server counters, each chunk is ~one token
+            stream_stats["tokens_per_sec"] = round((chunks - 1) / (end - first_token_at), 2)
+            final = {"eval_count": chunks, "eval_duration": int((end - first_token_at) * 1e9)}
+        return text, final, stream_stats
+
+    @staticmethod
+    def timing_fields(stats: Dict) -> Dict:
+        """execution_context fields describing where a call's time went."""
+        return {
+            "retry_count": stats.get("retry_count", 0),
+            "prompt_eval_ms": stats.get("prompt_eval_ms"),
+            "eval_ms": stats.get("eval_ms"),
+            "ttft_ms": stats.get("ttft_ms"),
+            "tokens_per_sec": stats.get("tokens_per_sec"),
+            "streamed": stats.get("streamed", False),
+            "stop_reason": stats.get("stop_reason"),
+            "host": stats.get("host")
+        }
 
-            # Calculate metrics
-            latency_ms = int((time.time() - start_time) * 1000)
-            # Prefer Ollama's actual counts if available, fallback to word count estimates
-            prompt_tokens = result.get("prompt_eval_count", len(prompt.split()))
-            gen_tokens = result.get("eval_count", len(generated_text.split()))
+    RETRY_STATUS = (500, 502, 503, 504)
 
-            # Log execution context for research
-            if self.research_logger and RKL_LOGGING_AVAILABLE:
-                quant = os.getenv("OLLAMA_QUANT", "")
-                seed_env = os.getenv("OLLAMA_SEED")
-                seed_val = int(seed_env) if seed_env and seed_env.isdigit() else None
-                exec_record = {
-                    "timestamp": datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
-                    "session_id": session_id or "unknown",
-                    "turn_id": turn_id or 0,
-                    "agent_id": agent_id,
-                    "model_id": self.model,
-                    "model_rev": self.model.split(":")[-1] if ":" in self.model else "latest",
-                    "quant": quant or "unknown",
-                    "temp": payload.get("temperature", 0.7),  # Default from Ollama
-                    "top_p": payload.get("top_p", 1.0),  # Default from Ollama
-                    "ctx_tokens_used": prompt_tokens,
-                    "gen_tokens": gen_tokens,
-                    "tool_lat_ms": latency_ms,
-                    "prompt_id_hash": sha256_text(prompt) if RKL_LOGGING_AVAILABLE else "",
-                    "system_prompt_hash": sha256_text(system_prompt) if system_prompt and RKL_LOGGING_AVAILABLE else "",
-                    "token_estimation": "api" if prompt_tokens and gen_tokens else "word_count",
-                    # Phase 1 Enhancement: Capture full prompts and responses for deeper analysis
-                    "prompt_preview": prompt[:1000] if prompt else "",
-                    "response_preview": generated_text[:1000] if generated_text else "",
-                    # Phase 2 Enhancement: Link to artifact for end-to-end tracing
-                    "artifact_id": artifact_id or ""
-                }
-                if seed_val is not None:
-                    exec_record["seed"] = seed_val
-                self.research_logger.log("execution_context", exec_record)
-
-                # Log boundary event (Type III compliance)
-                self.research_logger.log("boundary_event", {
-                    "event_id": str(uuid.uuid4()),
-                    "t": int(time.time() * 1000),
-                    "session_id": session_id or "unknown",
-                    "agent_id": agent_id,
-                    "rule_id": "type3.local_processing.allowed",
-                    "trigger_tag": "ollama_generate",
-                    "context_tag": "summarization",
-                    "action": "allow"
-                })
+    def _post_with_retries(self, payload: Dict) -> Tuple["requests.Response", int]:
+        """
+        POST to Ollama, retrying connection errors and 5xx responses.
 
-            return generated_text
+        Returns:
+            (response, retry_count); the body is left unread when streaming
 
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Error calling Ollama API: {e}")
-            return ""
+        Raises:
+            requests.exceptions.RequestException once retries are exhausted
+            (or immediately for non-retryable errors such as 4xx / read
+            timeouts); the exception carries a retry_count attribute
+        """
+        attempt = 0
+        while True:
+            try:
+                response = self.session.post(
+                    self.endpoint, json=payload, timeout=self.timeout,
+                    stream=bool(payload.get("stream"))
+                )
+                if response.status_code in self.RETRY_STATUS and attempt < self.max_retries:
+                    raise requests.exceptions.HTTPError(
+                        f"{response.status_code} Server Error", response=response
+                    )
+                response.raise_for_status()
+                return response, attempt
+            except (requests.exceptions.ConnectionError, requests.exceptions.HTTPError) as e:
+                status = e.response.status_code if getattr(e, "response", None) is not None else None
+                if status is not None:
+                    # Unread (streamed) body: return the connection to the pool
+                    e.response.close()
+                retryable = status is None or status in self.RETRY_STATUS
+                if not retryable or attempt >= self.max_retries:
+                    e.retry_count = attempt
+                    raise
+                # Full jitter: uniform(0, min(cap, base * 2^attempt))
+                delay = random.uniform(0, min(self.retry_backoff_max, self.retry_backoff * (2 ** attempt)))
+                attempt += 1
+                logger.warning(f"Ollama call failed ({e}); retry {attempt}/{self.max_retries} in {delay:.1f}s")
+                time.sleep(delay)
+            except requests.exceptions.RequestException as e:
+                e.retry_count = attempt
+                raise
+
+    def log_retries(self, agent_id: str, session_id: Optional[str],
+                    artifact_id: Optional[str], stats: Dict) -> None:
+        """Log a reasoning_graph_edge for a call that needed retries."""
+        retry_count = stats.get("retry_count", 0)
+        if not retry_count or not self.research_logger or not RKL_LOGGING_AVAILABLE:
+            return
+        self.research_logger.log("reasoning_graph_edge", {
+            "edge_id": str(uuid.uuid4()),
+            "session_id": session_id or "unknown",
+            "timestamp": datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "t": int(time.time() * 1000),
+            "from_agent": agent_id,
+            "to_agent": "ollama",
+            "msg_type": "retry",
+            "intent_tag": "transient_error_retry",
+            "content_hash": sha256_text(f"{agent_id}|{artifact_id or ''}|{retry_count}"),
+            "decision_rationale": (
+                f"Ollama call {'failed' if stats.get('error') else 'succeeded'} "
+                f"after {retry_count} retr{'y' if retry_count == 1 else 'ies'}."
+            ),
+            "latency_ms": stats.get("latency_ms", 0),
+            "retry_count": retry_count,
+            "artifact_id": artifact_id or ""
+        })
+
+    def log_boundary(self, agent_id: str, session_id: Optional[str]) -> None:
+        """Log the Type III boundary event for a local generation."""
+        if not self.research_logger or not RKL_LOGGING_AVAILABLE:
+            return
+        # Slotted records are buffered as is (no dict copy); one pair per model call
+        self.research_logger.log("boundary_event", BoundaryEvent(
+            event_id=str(uuid.uuid4()),
+            t=int(time.time() * 1000),
+            session_id=session_id or "unknown",
+            agent_id=agent_id,
+            rule_id="type3.local_processing.allowed",
+            trigger_tag="ollama_generate",
+            context_tag="summarization",
+            action="allow"
+        ))
+
+    def log_execution(self, prompt: str, system_prompt: Optional[str], generated_text: str,
+                      agent_id: str, session_id: Optional[str], turn_id: Optional[int],
+                      artifact_id: Optional[str], latency_ms: int, prompt_tokens: int,
+                      gen_tokens: int, options: Optional[Dict] = None,
+                      cache_hit: bool = False, extra: Optional[Dict] = None) -> None:
+        """
+        Log one execution_context record for an inference (or a cached answer).
+
+        Args:
+            options: Request payload/options (temperature, top_p) if any
+            cache_hit: True when the response came from the summary store
+                instead of a model call (gen_tokens is then 0)
+            extra: Additional fields merged into the record
+        """
+        if not self.research_logger or not RKL_LOGGING_AVAILABLE:
+            return
+        options = options or {}
+        quant = os.getenv("OLLAMA_QUANT", "")
+        seed_env = os.getenv("OLLAMA_SEED")
+        seed_val = int(seed_env) if seed_env and seed_env.isdigit() else None
+        exec_record = ExecutionContext(
+            timestamp=datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
+            session_id=session_id or "unknown",
+            turn_id=turn_id or 0,
+            agent_id=agent_id,
+            model_id=self.model,
+            model_rev=self.model.split(":")[-1] if ":" in self.model else "latest",
+            quant=quant or "unknown",
+            temp=options.get("temperature", 0.7),  # Default from Ollama
+            top_p=options.get("top_p", 1.0),  # Default from Ollama
+            ctx_tokens_used=prompt_tokens,
+            gen_tokens=gen_tokens,
+            tool_lat_ms=latency_ms,
+            cache_hit=cache_hit,
+            prompt_id_hash=sha256_text(prompt),
+            system_prompt_hash=sha256_text(system_prompt) if system_prompt else "",
+            # No model ran for a cache hit: its counts are not estimates of anything
+            token_estimation="cache" if cache_hit else ("api" if prompt_tokens and gen_tokens else "word_count"),
+            # Phase 1 Enhancement: Capture full prompts and responses for deeper analysis
+            prompt_preview=prompt[:1000] if prompt else "",
+            response_preview=generated_text[:1000] if generated_text else "",
+            # Phase 2 Enhancement: Link to artifact for end-to-end tracing
+            artifact_id=artifact_id or ""
+        )
+        if seed_val is not None:
+            exec_record["seed"] = seed_val
+        if extra:
+            exec_record.update({k: v for k, v in extra.items() if v is not None})
+        self.research_logger.log("execution_context", exec_record)
+
+
+class OllamaEndpoint:
+    """Load and health state for one server in an OllamaEndpointPool."""
+
+    def __init__(self, url: str):
+        self.url = url
+        self.host = urlparse(url).netloc or url
+        self.outstanding = 0
+        self.requests = 0
+        self.failures = 0
+        self.healthy = True
+        self.has_model: Optional[bool] = None
+        self.checked_at = 0.0
+
+    def tags_url(self) -> str:
+        """/api/tags on the same server as the generate endpoint."""
+        return self.url.split("/api/", 1)[0].rstrip("/") + "/api/tags"
+
+
+class OllamaEndpointPool(OllamaClient):
+    """
+    OllamaClient that spreads generations across several Ollama servers.
+
+    Configured with OLLAMA_ENDPOINTS (comma-separated generate URLs), e.g. one
+    per GPU node on Betty. Behaves exactly like OllamaClient for callers:
+
+    - Least-outstanding-requests balancing: each call goes to the healthy
+      endpoint with the fewest in-flight generations (ties: fewest served)
+    - Health checks: /api/tags on startup confirms each server is up and has
+      the model pulled; unhealthy endpoints are re-probed in the background
+      after OLLAMA_HEALTH_INTERVAL_S (default 30s)
+    - Affinity: calls passing the same affinity key (one article's steps)
+      stay on the endpoint that served the first one while it is healthy, so
+      its KV prefix cache is reused; a call carrying a context is never sent
+      to a different endpoint (the token array is only valid where it was made)
+    - Failover: connection errors and 5xx mark the endpoint unhealthy and the
+      call moves to the next endpoint immediately; backoff only starts once
+      every endpoint has failed (still bounded by OLLAMA_MAX_RETRIES)
+    - Attribution: the serving host is returned in stats["host"] and logged
+      to execution_context
+
+    All endpoints must be on the local network (Type III: raw content stays
+    on infrastructure we control).
+    """
+
+    def __init__(self, endpoints: List[str], model: str,
+                 research_logger: Optional['StructuredLogger'] = None):
+        """
+        Initialize the pool and probe every endpoint.
+
+        Args:
+            endpoints: Ollama generate URLs (http://host:11434/api/generate)
+            model: Model identifier (must be pulled on every endpoint)
+            research_logger: Optional StructuredLogger for research telemetry
+        """
+        if not endpoints:
+            raise ValueError("OllamaEndpointPool needs at least one endpoint")
+        super().__init__(endpoints[0], model, research_logger)
+        self.endpoints = [OllamaEndpoint(url) for url in endpoints]
+        self.health_interval_s = float(os.getenv("OLLAMA_HEALTH_INTERVAL_S", "30"))
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        # affinity key -> endpoint url, most recent last (bounded, see MAX_AFFINITY_KEYS)
+        self._affinity: "OrderedDict[str, str]" = OrderedDict()
+
+        # One connection pool per host, each sized like a single client's
+        pool_size = max(1, int(os.getenv("OLLAMA_POOL_SIZE", "8")))
+        adapter = HTTPAdapter(pool_connections=len(self.endpoints), pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self.check_health()
+
+    def check_endpoint(self, endpoint: OllamaEndpoint) -> bool:
+        """Probe /api/tags; healthy means reachable and serving self.model."""
+        try:
+            response = self.session.get(endpoint.tags_url(), timeout=(self.timeout[0], 10))
+            response.raise_for_status()
+            names = {m.get("name", "") for m in response.json().get("models", [])}
+            wanted = self.model if ":" in self.model else f"{self.model}:latest"
+            endpoint.has_model = self.model in names or wanted in names
+            if not endpoint.has_model:
+                logger.warning(f"Ollama endpoint {endpoint.host} does not have model {self.model}")
+            healthy = bool(endpoint.has_model)
+        except (requests.exceptions.RequestException, ValueError) as e:
+            logger.warning(f"Ollama endpoint {endpoint.host} health check failed: {e}")
+            healthy = False
+        with self._lock:
+            endpoint.healthy = healthy
+            endpoint.checked_at = time.monotonic()
+        return healthy
+
+    def check_health(self) -> int:
+        """Probe all endpoints in parallel. Returns the number healthy."""
+        with ThreadPoolExecutor(max_workers=len(self.endpoints)) as pool:
+            healthy = sum(pool.map(self.check_endpoint, self.endpoints))
+        logger.info(
+            f"Ollama pool: {healthy}/{len(self.endpoints)} endpoints healthy "
+            f"({', '.join(e.host + ('' if e.healthy else ' DOWN') for e in self.endpoints)})"
+        )
+        return healthy
+
+    @property
+    def healthy_count(self) -> int:
+        return sum(1 for e in self.endpoints if e.healthy)
+
+    MAX_AFFINITY_KEYS = 1024
+
+    def _select(self, exclude: set, preferred: Optional[OllamaEndpoint] = None) -> Optional[OllamaEndpoint]:
+        """Reserve preferred if it is healthy, else the least-loaded healthy endpoint not in exclude."""
+        now = time.monotonic()
+        with self._lock:
+            due = [e for e in self.endpoints
+                   if not e.healthy and now - e.checked_at >= self.health_interval_s]
+            for endpoint in due:
+                endpoint.checked_at = now  # one re-probe per interval; requests keep routing
+        for endpoint in due:
+            # Off the request path: a dead host can take the full probe timeout to answer
+            threading.Thread(target=self.check_endpoint, args=(endpoint,),
+                             name=f"ollama-probe-{endpoint.host}", daemon=True).start()
+        with self._lock:
+            if preferred is not None and preferred.healthy and preferred.url not in exclude:
+                preferred.outstanding += 1
+                preferred.requests += 1
+                return preferred
+            candidates = [e for e in self.endpoints if e.healthy and e.url not in exclude]
+            if not candidates:
+                # Nothing known-good left: try unhealthy ones rather than fail outright
+                candidates = [e for e in self.endpoints if e.url not in exclude]
+            if not candidates:
+                return None
+            endpoint = min(candidates, key=lambda e: (e.outstanding, e.requests))
+            endpoint.outstanding += 1
+            endpoint.requests += 1
+            return endpoint
+
+    def _release(self, endpoint: Optional[OllamaEndpoint]) -> None:
+        if endpoint is None:
+            return
+        with self._lock:
+            endpoint.outstanding = max(0, endpoint.outstanding - 1)
+
+    def _mark_failed(self, endpoint: OllamaEndpoint) -> None:
+        """Take an endpoint out of rotation until its next health check."""
+        with self._lock:
+            endpoint.failures += 1
+            endpoint.healthy = False
+            endpoint.checked_at = time.monotonic()
+
+    def _pinned(self, key: Optional[str]) -> Optional[OllamaEndpoint]:
+        """Endpoint that served the last call with this affinity key, if any."""
+        if key is None:
+            return None
+        with self._lock:
+            url = self._affinity.get(key)
+        return next((e for e in self.endpoints if e.url == url), None)
+
+    def _pin(self, key: Optional[str], endpoint: OllamaEndpoint) -> None:
+        if key is None:
+            return
+        with self._lock:
+            self._affinity[key] = endpoint.url
+            self._affinity.move_to_end(key)
+            while len(self._affinity) > self.MAX_AFFINITY_KEYS:
+                self._affinity.popitem(last=False)
+
+    def generate_with_stats(self, *args, **kwargs) -> Tuple[str, Dict]:
+        """OllamaClient.generate_with_stats on the selected endpoint; adds stats["host"]."""
+        self._local.endpoint = None
+        self._local.affinity = kwargs.get("affinity")
+        try:
+            generated_text, stats = super().generate_with_stats(*args, **kwargs)
+        finally:
+            # Streaming responses are consumed inside the call, so the slot is free now
+            endpoint = self._local.endpoint
+            self._release(endpoint)
+            self._local.endpoint = None
+        stats["host"] = endpoint.host if endpoint else None
+        return generated_text, stats
+
+    def _post_with_retries(self, payload: Dict) -> Tuple["requests.Response", int]:
+        """POST to the pinned or least-loaded endpoint, failing over on connection errors and 5xx."""
+        key = getattr(self._local, "affinity", None)
+        attempt = 0
+        tried = set()
+        while True:
+            if len(tried) >= len(self.endpoints):
+                tried = set()
+            pinned = self._pinned(key)
+            endpoint = self._select(tried, pinned)
+            self._local.endpoint = endpoint
+            if "context" in payload and pinned is not None and endpoint is not pinned:
+                # The context's KV state only exists on the pinned server
+                error = requests.exceptions.RequestException(
+                    f"Ollama context is tied to {pinned.host}, which is unavailable"
+                )
+                error.retry_count = attempt
+                raise error
+            self._pin(key, endpoint)
+            try:
+                response = self.session.post(
+                    endpoint.url, json=payload, timeout=self.timeout,
+                    stream=bool(payload.get("stream"))
+                )
+                if response.status_code in self.RETRY_STATUS and attempt < self.max_retries:
+                    raise requests.exceptions.HTTPError(
+                        f"{response.status_code} Server Error", response=response
+                    )
+                response.raise_for_status()
+                return response, attempt
+            except (requests.exceptions.ConnectionError, requests.exceptions.HTTPError) as e:
+                status = e.response.status_code if getattr(e, "response", None) is not None else None
+                if status is not None:
+                    # Unread (streamed) body: return the connection to the pool
+                    e.response.close()
+                retryable = status is None or status in self.RETRY_STATUS
+                if not retryable or attempt >= self.max_retries:
+                    if retryable:
+                        self._mark_failed(endpoint)
+                    e.retry_count = attempt
+                    raise
+                self._mark_failed(endpoint)
+                self._release(endpoint)
+                self._local.endpoint = None
+                tried.add(endpoint.url)
+                attempt += 1
+                if len(tried) < len(self.endpoints):
+                    logger.warning(f"Ollama {endpoint.host} failed ({e}); failing over (retry {attempt}/{self.max_retries})")
+                    continue
+                # Every endpoint failed this round: back off before starting over
+                delay = random.uniform(0, min(self.retry_backoff_max, self.retry_backoff * (2 ** (attempt - 1))))
+                logger.warning(f"All Ollama endpoints failed ({e}); retry {attempt}/{self.max_retries} in {delay:.1f}s")
+                time.sleep(delay)
+            except requests.exceptions.RequestException as e:
+                e.retry_count = attempt
+                raise
+
+    def get_stats(self) -> List[Dict]:
+        """Per-endpoint load and health counters."""
+        with self._lock:
+            return [
+                {
+                    "host": e.host,
+                    "healthy": e.healthy,
+                    "has_model": e.has_model,
+                    "outstanding": e.outstanding,
+                    "requests": e.requests,
+                    "failures": e.failures
+                }
+                for e in self.endpoints
+            ]
 
 
 class ArticleSummarizer:
@@ -233,21 +792,410 @@ class ArticleSummarizer:
     - Output: Derived insights (summaries, tags) - can cross Type III boundary
     - Demonstrates: "Raw data stays local, derived insights travel"
 
+    Summary Store:
+    - With BRIEF_DAYS_BACK=7 and two runs a day, the same article is seen up to
+      14 times. An optional DiskCache keyed by artifact_id plus a hash of
+      (title, content, model, max_words, PROMPT_VERSION) returns the earlier
+      summary, lay explanation and tags without calling Ollama.
+    - Bump PROMPT_VERSION whenever a prompt changes so old entries stop matching.
+
+    Summary Modes (BRIEF_SUMMARY_MODE):
+    - "multi" (default): three generations per article, one per agent
+    - "json": one generation with Ollama's format=json returning all three
+      fields, so the article content is prefilled once instead of three times.
+      The result is validated/repaired; if the summary or lay explanation is
+      unusable the article falls back to the "multi" path. Telemetry is kept
+      per agent by splitting the single call into sub-spans.
+
+    Prompt Layout:
+    - Every prompt is assembled as [article block][task instruction], with the
+      same system prompt, so the three calls share one long prefix. Ollama
+      reuses the KV cache for a matching prefix while the model stays loaded
+      (OLLAMA_KEEP_ALIVE), so the 2nd and 3rd calls prefill only the instruction.
+    - With context_reuse (BRIEF_PROMPT_CONTEXT_REUSE) the 2nd and 3rd calls
+      instead send only their instruction plus the `context` returned by the
+      1st call. Those calls then also see the technical summary.
+    - execution_context records prompt_eval_ms per call and
+      prompt_eval_saved_ms: the 1st call's prefill time scaled to this call's
+      full prompt length, minus its actual prefill time. Summed per
+      artifact_id this is the prefill time saved per article.
+
     Attributes:
         client (OllamaClient): Local Ollama API client
         max_words (int): Maximum words for summaries (default 80)
+        summary_store (DiskCache): Optional store of prior derived outputs
+        mode (str): "multi" or "json"
+        context_reuse (bool): Chain calls via Ollama's returned context
     """
 
-    def __init__(self, ollama_client: OllamaClient, max_words: int = 80):
+    PROMPT_VERSION = "2"
+    SUMMARY_MODES = ("multi", "json")
+
+    SYSTEM_PROMPT = """You are an AI research analyst specializing in verifiable AI,
+trustworthy AI, and AI governance. Provide concise, accurate technical summaries."""
+
+    # Phase 1 Enhancement: Chain-of-thought prompting for deeper reasoning traces
+    TECH_INSTRUCTION = """Analyze this AI research paper and create a technical summary.
+
+First, identify:
+1. Main contribution (1 sentence)
+2. Key methodology (1 sentence)
+3. Most important result (1 sentence)
+
+Then, combine these into a {max_words}-word technical summary focusing on what practitioners need to know.
+
+Reasoning:"""
+
+    LAY_INSTRUCTION = """Based on this article, explain in 2-3 sentences what this means for
+organizations adopting AI systems. Focus on practical implications, risks, or opportunities.
+
+Provide only the explanation, no preamble."""
+
+    # Streaming early-stop budgets, as multiples of max_words (reasoning + summary,
+    # 2-3 sentences, a short tag list) and stop patterns per agent
+    STREAM_WORD_BUDGETS = {"summarizer": 4.0, "lay_translator": 1.5, "metadata_extractor": 0.5}
+    STREAM_STOP_PATTERNS = {"metadata_extractor": [r"\n\s*\n"]}
+
+    TAG_INSTRUCTION = """Extract 3-5 relevant tags from this article. Choose from:
+verifiable AI, trustworthy AI, AI governance, AI safety, interpretability, alignment,
+responsible AI, AI policy, secure reasoning, formal verification, machine learning,
+deep learning, neural networks, bias, fairness, transparency, accountability.
+
+Return only comma-separated tags, no explanation."""
+
+    def __init__(self, ollama_client: OllamaClient, max_words: int = 80,
+                 summary_store: Optional[DiskCache] = None, mode: str = "multi",
+                 context_reuse: bool = False):
         """
         Initialize the article summarizer.
 
         Args:
             ollama_client: Configured OllamaClient for local processing
             max_words: Maximum words per summary (configurable via BRIEF_SUMMARY_MAX_WORDS)
+            summary_store: Optional DiskCache of prior summaries (see class docstring)
+            mode: "multi" (three calls) or "json" (single JSON-formatted call)
+            context_reuse: Send the 1st call's context with the 2nd and 3rd calls
         """
+        if mode not in self.SUMMARY_MODES:
+            raise ValueError(f"mode must be one of {self.SUMMARY_MODES}, got {mode!r}")
         self.client = ollama_client
         self.max_words = max_words
+        self.summary_store = summary_store
+        self.mode = mode
+        self.context_reuse = context_reuse
+
+    def summary_key(self, artifact_id: str, title: str, content_for_llm: str) -> str:
+        """Summary store key: artifact_id + hash of everything that shapes the output."""
+        fingerprint = hashlib.sha256(
+            f"{title}|{content_for_llm}|{self.client.model}|{self.max_words}|{self.PROMPT_VERSION}|{self.mode}|{self.context_reuse}".encode("utf-8")
+        ).hexdigest()
+        return f"{artifact_id}:{fingerprint}"
+
+    def _cached_summary(self, key: str, prompts: Dict[str, str], system_prompt: str,
+                        title: str, link: str, artifact_id: str,
+                        session_id: Optional[str], turn_id: Optional[int]) -> Optional[Dict]:
+        """Return a summary from the store (logging cache_hit telemetry), or None on miss."""
+        if not self.summary_store:
+            return None
+        lookup_start = int(time.time() * 1000)
+        cached = self.summary_store.get(key)
+        if not cached:
+            return None
+        lookup_end = int(time.time() * 1000)
+
+        outputs = {
+            "summarizer": cached.get("technical_summary", ""),
+            "lay_translator": cached.get("lay_explanation", ""),
+            "metadata_extractor": ", ".join(cached.get("tags", []))
+        }
+        step_timings = []
+        for agent_id, phase in (("summarizer", "act"), ("lay_translator", "verify"),
+                                ("metadata_extractor", "observe")):
+            self.client.log_execution(
+                prompts[agent_id], system_prompt, outputs[agent_id],
+                agent_id=agent_id, session_id=session_id, turn_id=turn_id,
+                artifact_id=artifact_id, latency_ms=lookup_end - lookup_start,
+                prompt_tokens=0, gen_tokens=0, cache_hit=True
+            )
+            step_timings.append({
+                "phase": phase,
+                "agent_id": agent_id,
+                "start_t": lookup_start,
+                "end_t": lookup_end,
+                "duration_ms": lookup_end - lookup_start
+            })
+
+        logger.info(f"Summary store hit: {title[:60]}")
+        return {
+            "title": title,
+            "link": link,
+            "technical_summary": cached.get("technical_summary", ""),
+            "lay_explanation": cached.get("lay_explanation", ""),
+            "tags": cached.get("tags", [])[:5],
+            "_step_timings": step_timings,
+            "_cache_hit": True
+        }
+
+    @staticmethod
+    def article_block(title: str, content_for_llm: str) -> str:
+        """Shared prompt prefix: identical across all calls for one article."""
+        return f"""Title: {title}
+Content: {content_for_llm}
+
+"""
+
+    def assemble_prompts(self, title: str, content_for_llm: str) -> Dict[str, str]:
+        """Per-agent prompts: shared article block first, task instruction last."""
+        block = self.article_block(title, content_for_llm)
+        return {
+            "summarizer": block + self.TECH_INSTRUCTION.format(max_words=self.max_words),
+            "lay_translator": block + self.LAY_INSTRUCTION,
+            "metadata_extractor": block + self.TAG_INSTRUCTION
+        }
+
+    def _json_prompt(self, title: str, content_for_llm: str) -> str:
+        """Single prompt asking for all three derived fields as one JSON object."""
+        return self.article_block(title, content_for_llm) + f"""Analyze this AI research article and respond with a JSON object with exactly these keys:
+
+"technical_summary": a {self.max_words}-word technical summary for practitioners covering the main
+contribution, key methodology and most important result.
+"lay_explanation": 2-3 sentences on what this means for organizations adopting AI systems
+(practical implications, risks, or opportunities).
+"tags": a list of 3-5 tags chosen from: verifiable AI, trustworthy AI, AI governance, AI safety,
+interpretability, alignment, responsible AI, AI policy, secure reasoning, formal verification,
+machine learning, deep learning, neural networks, bias, fairness, transparency, accountability.
+
+Respond with the JSON object only."""
+
+    @staticmethod
+    def parse_json_summary(raw: str) -> Optional[Dict]:
+        """
+        Validate and repair a JSON-mode response.
+
+        Repairs: text around the object, alternate key names, tags given as a
+        comma-separated string, non-string values. Returns None if no usable
+        technical summary and lay explanation can be recovered.
+        """
+        try:
+            data = json.loads(raw)
+        except (TypeError, ValueError):
+            start, end = (raw or "").find("{"), (raw or "").rfind("}")
+            if start < 0 or end <= start:
+                return None
+            try:
+                data = json.loads(raw[start:end + 1])
+            except ValueError:
+                return None
+        if not isinstance(data, dict):
+            return None
+
+        def pick(*names):
+            for name in names:
+                if name in data and data[name]:
+                    return data[name]
+            return ""
+
+        def as_text(value) -> str:
+            if isinstance(value, list):
+                value = " ".join(str(v) for v in value)
+            return str(value).strip()
+
+        technical_summary = as_text(pick("technical_summary", "summary", "technical"))
+        lay_explanation = as_text(pick("lay_explanation", "explanation", "lay"))
+        if not technical_summary or not lay_explanation:
+            return None
+
+        tags = pick("tags", "keywords")
+        if isinstance(tags, str):
+            tags = tags.split(",")
+        if not isinstance(tags, list):
+            tags = []
+        tags = [str(tag).strip() for tag in tags if str(tag).strip()][:5]
+
+        return {
+            "technical_summary": technical_summary,
+            "lay_explanation": lay_explanation,
+            "tags": tags
+        }
+
+    def _summarize_json(self, title: str, link: str, content_for_llm: str, system_prompt: str,
+                        artifact_id: str, session_id: Optional[str],
+                        turn_id: Optional[int]) -> Optional[Dict]:
+        """
+        One format=json generation for all three fields; None if unusable.
+
+        The call is attributed to the three agents as consecutive sub-spans,
+        splitting latency and generated tokens by each field's share of the
+        output. Prompt tokens (the shared prefill) are counted once, on the
+        summarizer span. All three records carry the same parent_call_id.
+        """
+        prompt = self._json_prompt(title, content_for_llm)
+
+        if self.client.research_logger and RKL_LOGGING_AVAILABLE:
+            self.client.research_logger.log("reasoning_graph_edge", {
+                "edge_id": str(uuid.uuid4()),
+                "session_id": session_id or "unknown",
+                "timestamp": datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "t": int(time.time() * 1000),
+                "from_agent": "feed_monitor",
+                "to_agent": "summarizer",
+                "msg_type": "act",
+                "intent_tag": "json_summary",
+                "content_hash": sha256_text(f"{title}|{content_for_llm[:500]}"),
+                "decision_rationale": f"Article from {link[:50]}... passed keyword/date filter. Requesting summary, lay explanation and tags in one JSON call.",
+                "payload_summary": f"Title: {title[:80]}... ({len(content_for_llm)} chars content)",
+                "artifact_id": artifact_id
+            })
+
+        call_start = int(time.time() * 1000)
+        raw, stats = self.client.generate_with_stats(prompt, system_prompt, format="json")
+        call_end = int(time.time() * 1000)
+        self.client.log_retries("summarizer", session_id, artifact_id, stats)
+        parsed = None if stats.get("error") else self.parse_json_summary(raw)
+        if parsed is None:
+            if not stats.get("error"):
+                logger.warning(f"JSON summary unusable for '{title[:60]}', falling back to per-agent calls")
+            self._log_json_fallback(prompt, system_prompt, raw, stats,
+                                    artifact_id, session_id, turn_id)
+            return None
+
+        outputs = [
+            ("summarizer", "act", parsed["technical_summary"]),
+            ("lay_translator", "verify", parsed["lay_explanation"]),
+            ("metadata_extractor", "observe", ", ".join(parsed["tags"]))
+        ]
+        total_chars = sum(max(len(text), 1) for _, _, text in outputs)
+        parent_call_id = str(uuid.uuid4())
+        step_timings = []
+        span_start = call_start
+        for n, (agent_id, phase, text) in enumerate(outputs):
+            share = max(len(text), 1) / total_chars
+            span_end = call_end if n == len(outputs) - 1 else span_start + int((call_end - call_start) * share)
+            step_timings.append({
+                "phase": phase,
+                "agent_id": agent_id,
+                "start_t": span_start,
+                "end_t": span_end,
+                "duration_ms": span_end - span_start
+            })
+            if self.client.research_logger and RKL_LOGGING_AVAILABLE:
+                # Call-level timings (TTFT, prefill, retries) belong to the first span
+                extra = self.client.timing_fields(stats) if n == 0 else {
+                    "retry_count": 0, "prompt_eval_ms": 0, "streamed": stats.get("streamed", False)
+                }
+                if stats.get("eval_ms") is not None:
+                    extra["eval_ms"] = int(stats["eval_ms"] * share)
+                extra.update({"parent_call_id": parent_call_id, "span_attribution": "json_single_call"})
+                self.client.log_execution(
+                    prompt, system_prompt, text,
+                    agent_id=agent_id, session_id=session_id, turn_id=turn_id,
+                    artifact_id=artifact_id, latency_ms=span_end - span_start,
+                    prompt_tokens=stats["prompt_tokens"] if n == 0 else 0,
+                    gen_tokens=int(round(stats["gen_tokens"] * share)),
+                    options=stats["payload"], cache_hit=False, extra=extra
+                )
+            span_start = span_end
+        self.client.log_boundary("summarizer", session_id)
+
+        parsed.update({"title": title, "link": link, "_step_timings": step_timings})
+        return parsed
+
+    def _log_json_fallback(self, prompt: str, system_prompt: str, raw: str, stats: Dict,
+                           artifact_id: str, session_id: Optional[str],
+                           turn_id: Optional[int]) -> None:
+        """
+        Log a format=json call whose output was unusable (or that failed).
+
+        Its prefill and decode cost is real even though the per-agent calls
+        that follow produce the summary, so it gets its own execution_context.
+        """
+        if not self.client.research_logger or not RKL_LOGGING_AVAILABLE:
+            return
+        extra = self.client.timing_fields(stats)
+        extra.update({"stop_reason": "json_fallback", "span_attribution": "json_fallback"})
+        self.client.log_execution(
+            prompt, system_prompt, raw,
+            agent_id="summarizer", session_id=session_id, turn_id=turn_id,
+            artifact_id=artifact_id, latency_ms=stats.get("latency_ms", 0),
+            prompt_tokens=stats.get("prompt_tokens", 0),
+            gen_tokens=stats.get("gen_tokens", 0),
+            options=stats.get("payload"), cache_hit=False, extra=extra
+        )
+        self.client.log_boundary("summarizer", session_id)
+
+    def _generate_step(self, agent_id: str, full_prompt: str, system_prompt: str,
+                       artifact_id: str, session_id: Optional[str], turn_id: Optional[int],
+                       prefill: Dict, instruction: Optional[str] = None) -> str:
+        """
+        Run one agent's generation and log its telemetry.
+
+        Args:
+            full_prompt: Article block + instruction
+            prefill: Per-article state shared across steps: "ms"/"chars" of the
+                first call's prefill (baseline for prompt_eval_saved_ms) and
+                "context" returned by Ollama
+            instruction: With context_reuse, only this is sent along with the
+                first call's context (full_prompt is still used for accounting)
+
+        Returns:
+            Generated text, or "" on error
+        """
+        context = prefill.get("context") if self.context_reuse and instruction else None
+        prompt = instruction if context else full_prompt
+        generate_options = {
+            "max_words": int(self.max_words * self.STREAM_WORD_BUDGETS.get(agent_id, 4.0)),
+            "stop_patterns": self.STREAM_STOP_PATTERNS.get(agent_id),
+            # Endpoint pools keep one article's steps on one server (KV prefix, context)
+            "affinity": artifact_id or None
+        }
+        text, stats = self.client.generate_with_stats(prompt, system_prompt, context=context,
+                                                      **generate_options)
+        self.client.log_retries(agent_id, session_id, artifact_id, stats)
+        if stats.get("error") and context is not None:
+            # The server holding the context may be gone: resend the full prompt
+            context, prompt = None, full_prompt
+            text, stats = self.client.generate_with_stats(prompt, system_prompt, **generate_options)
+            self.client.log_retries(agent_id, session_id, artifact_id, stats)
+        if stats.get("error"):
+            return ""
+
+        prompt_eval_ms = stats.get("prompt_eval_ms")
+        saved_ms = 0
+        if prompt_eval_ms is not None:
+            if "ms" not in prefill:
+                prefill["ms"], prefill["chars"] = prompt_eval_ms, max(len(full_prompt), 1)
+            else:
+                expected_ms = prefill["ms"] * len(full_prompt) / prefill["chars"]
+                saved_ms = max(0, int(expected_ms - prompt_eval_ms))
+        if "context" not in prefill and stats.get("context"):
+            prefill["context"] = stats["context"]
+
+        extra = self.client.timing_fields(stats)
+        extra.update({"prompt_eval_saved_ms": saved_ms, "context_reused": context is not None})
+        self.client.log_execution(
+            prompt, system_prompt, text,
+            agent_id=agent_id, session_id=session_id, turn_id=turn_id,
+            artifact_id=artifact_id, latency_ms=stats["latency_ms"],
+            prompt_tokens=stats["prompt_tokens"], gen_tokens=stats["gen_tokens"],
+            options=stats["payload"], cache_hit=False, extra=extra
+        )
+        self.client.log_boundary(agent_id, session_id)
+        return text
+
+    def _store_summary(self, store_key: str, technical_summary: str,
+                       lay_explanation: str, tags: List[str]) -> None:
+        """Save a complete result to the summary store (no-op without one)."""
+        # Only store complete results; generate() returns "" on errors
+        if not self.summary_store or not technical_summary.strip() or not lay_explanation.strip():
+            return
+        self.summary_store.set(store_key, {
+            "technical_summary": technical_summary.strip(),
+            "lay_explanation": lay_explanation.strip(),
+            "tags": tags[:5],
+            "model": self.client.model,
+            "prompt_version": self.PROMPT_VERSION,
+            "created_at": datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
+        })
 
     def summarize_article(self, title: str, content: str, link: str,
                           session_id: Optional[str] = None, turn_id: Optional[int] = None) -> Dict:
@@ -286,28 +1234,34 @@ class ArticleSummarizer:
         step_timings = []
 
         # System prompt for technical summary - sets agent role
-        system_prompt = """You are an AI research analyst specializing in verifiable AI,
-trustworthy AI, and AI governance. Provide concise, accurate technical summaries."""
+        system_prompt = self.SYSTEM_PROMPT
 
         # Use more context for Ollama (up to 8000 chars - still well within 128K limit)
         # This allows better summaries especially for long-form content
         content_for_llm = content[:8000]
 
-        # Technical summary prompt - Agent #3: Summarizer
-        # Phase 1 Enhancement: Chain-of-thought prompting for deeper reasoning traces
-        tech_prompt = f"""Analyze this AI research paper and create a technical summary.
-
-First, identify:
-1. Main contribution (1 sentence)
-2. Key methodology (1 sentence)
-3. Most important result (1 sentence)
-
-Then, combine these into a {self.max_words}-word technical summary focusing on what practitioners need to know.
-
-Title: {title}
-Content: {content_for_llm}
+        # Shared article block first, task instruction last (see Prompt Layout)
+        prompts = self.assemble_prompts(title, content_for_llm)
+        tech_prompt = prompts["summarizer"]
+        lay_prompt = prompts["lay_translator"]
+        tag_prompt = prompts["metadata_extractor"]
+        prefill = {}
+
+        # Summary store: identical article + model + prompts → reuse prior derived outputs
+        store_key = self.summary_key(artifact_id, title, content_for_llm)
+        cached = self._cached_summary(
+            store_key, prompts, system_prompt, title, link, artifact_id, session_id, turn_id
+        )
+        if cached:
+            return cached
 
-Reasoning:"""
+        if self.mode == "json":
+            result = self._summarize_json(title, link, content_for_llm, system_prompt,
+                                          artifact_id, session_id, turn_id)
+            if result:
+                self._store_summary(store_key, result["technical_summary"],
+                                    result["lay_explanation"], result["tags"])
+                return result
 
         # Log reasoning graph edge: feed_monitor → summarizer
         if self.client.research_logger and RKL_LOGGING_AVAILABLE:
@@ -330,12 +1284,9 @@ Reasoning:"""
 
         # PROCESSING: Local Ollama generates summary (Type III: raw data processed locally)
         step_start = int(time.time() * 1000)
-        technical_summary = self.client.generate(
-            tech_prompt, system_prompt,
-            agent_id="summarizer",
-            session_id=session_id,
-            turn_id=turn_id,
-            artifact_id=artifact_id
+        technical_summary = self._generate_step(
+            "summarizer", tech_prompt, system_prompt,
+            artifact_id, session_id, turn_id, prefill
         )
         step_end = int(time.time() * 1000)
         step_timings.append({
@@ -346,15 +1297,6 @@ Reasoning:"""
             "duration_ms": step_end - step_start
         })
 
-        # Lay explanation prompt
-        lay_prompt = f"""Based on this article, explain in 2-3 sentences what this means for
-organizations adopting AI systems. Focus on practical implications, risks, or opportunities.
-
-Title: {title}
-Content: {content_for_llm}
-
-Provide only the explanation, no preamble."""
-
         # Log reasoning graph edge: summarizer → lay_translator
         if self.client.research_logger and RKL_LOGGING_AVAILABLE:
             self.client.research_logger.log("reasoning_graph_edge", {
@@ -375,12 +1317,10 @@ Provide only the explanation, no preamble."""
             })
 
         step_start = int(time.time() * 1000)
-        lay_explanation = self.client.generate(
-            lay_prompt, system_prompt,
-            agent_id="lay_translator",
-            session_id=session_id,
-            turn_id=turn_id,
-            artifact_id=artifact_id
+        lay_explanation = self._generate_step(
+            "lay_translator", lay_prompt, system_prompt,
+            artifact_id, session_id, turn_id, prefill,
+            instruction=self.LAY_INSTRUCTION
         )
         step_end = int(time.time() * 1000)
         step_timings.append({
@@ -391,17 +1331,6 @@ Provide only the explanation, no preamble."""
             "duration_ms": step_end - step_start
         })
 
-        # Tag extraction prompt (use less content for speed since tags don't need full article)
-        tag_prompt = f"""Extract 3-5 relevant tags from this article. Choose from:
-verifiable AI, trustworthy AI, AI governance, AI safety, interpretability, alignment,
-responsible AI, AI policy, secure reasoning, formal verification, machine learning,
-deep learning, neural networks, bias, fairness, transparency, accountability.
-
-Title: {title}
-Content: {content_for_llm[:2000]}
-
-Return only comma-separated tags, no explanation."""
-
         # Log reasoning graph edge: lay_translator → metadata_extractor
         if self.client.research_logger and RKL_LOGGING_AVAILABLE:
             self.client.research_logger.log("reasoning_graph_edge", {
@@ -422,12 +1351,10 @@ Return only comma-separated tags, no explanation."""
             })
 
         step_start = int(time.time() * 1000)
-        tags_raw = self.client.generate(
-            tag_prompt, system_prompt,
-            agent_id="metadata_extractor",
-            session_id=session_id,
-            turn_id=turn_id,
-            artifact_id=artifact_id
+        tags_raw = self._generate_step(
+            "metadata_extractor", tag_prompt, system_prompt,
+            artifact_id, session_id, turn_id, prefill,
+            instruction=self.TAG_INSTRUCTION
         )
         step_end = int(time.time() * 1000)
         step_timings.append({
@@ -439,6 +1366,8 @@ Return only comma-separated tags, no explanation."""
         })
         tags = [tag.strip() for tag in tags_raw.split(",") if tag.strip()]
 
+        self._store_summary(store_key, technical_summary, lay_explanation, tags)
+
         return {
             "title": title,
             "link": link,
@@ -468,11 +1397,21 @@ class FeedFetcher:
     This is the entry point for Type III workflow - raw data acquisition
     under local control before any processing begins.
 
+    Feeds are fetched concurrently (BRIEF_FETCH_CONCURRENCY workers, default 8)
+    over a shared, pooled HTTP session, so discovery time is bounded by the
+    slowest feed rather than the sum of all feeds. Output order is the
+    feeds.json order regardless of which feed finishes first.
+
     Attributes:
         feeds_config (Dict): Feed configuration from feeds.json
         keywords (List[str]): Keywords to filter articles by
         days_back (int): How many days back to fetch articles (default 7)
         cutoff_date (datetime): Calculated cutoff date for filtering
+        max_workers (int): Max feeds fetched at once (BRIEF_FETCH_CONCURRENCY)
+        feed_timeout (float): Per-feed timeout in seconds (BRIEF_FEED_TIMEOUT)
+        feed_cache (DiskCache): Optional per-URL cache of validators + parsed entries.
+            Feeds are re-requested conditionally (If-None-Match / If-Modified-Since);
+            a 304, or a body identical to the cached one, is served without parsing.
 
     Example:
         >>> config = {"feeds": [{"name": "ArXiv", "url": "...", "enabled": true}]}
@@ -482,7 +1421,7 @@ class FeedFetcher:
 
     def __init__(self, feeds_config: Dict, keywords: List[str], days_back: int = 7,
                  research_logger: Optional['StructuredLogger'] = None,
-                 session_id: str = "unknown"):
+                 session_id: str = "unknown", feed_cache: Optional[DiskCache] = None):
         self.feeds_config = feeds_config
         ignore_kw = os.getenv("BRIEF_IGNORE_KEYWORDS", "false").lower() in ("1", "true", "yes")
         self.keywords = [] if ignore_kw else [kw.lower() for kw in keywords]
@@ -492,6 +1431,16 @@ class FeedFetcher:
         self.session_id = session_id
         self.remote_fetch_host = os.getenv("REMOTE_FETCH_HOST", "").strip()
         self.remote_fetch_user = os.getenv("REMOTE_FETCH_USER", "").strip()
+        self.feed_cache = feed_cache
+        self.max_workers = max(1, int(os.getenv("BRIEF_FETCH_CONCURRENCY", "8")))
+        self.feed_timeout = float(os.getenv("BRIEF_FEED_TIMEOUT", "30"))
+
+        # Shared keep-alive session: one connection pool per host, reused across feeds
+        self.session = requests.Session()
+        self.session.headers["User-Agent"] = "RKL-SecureReasoningBrief/1.0 (+feedparser)"
+        adapter = HTTPAdapter(pool_connections=self.max_workers, pool_maxsize=self.max_workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
 
     def fetch_feeds(self) -> List[Dict]:
         """
@@ -518,16 +1467,28 @@ class FeedFetcher:
             >>> articles = fetcher.fetch_feeds()
             >>> print(f"Found {len(articles)} articles")
         """
-        all_articles = []
-
+        enabled_feeds = []
         for feed in self.feeds_config.get("feeds", []):
             if not feed.get("enabled", True):
                 logger.info(f"Skipping disabled feed: {feed['name']}")
                 continue
+            enabled_feeds.append(feed)
+
+        if not enabled_feeds:
+            return []
+
+        # Fetch concurrently; collect results in config order for deterministic output
+        workers = min(self.max_workers, len(enabled_feeds))
+        logger.info(f"Fetching {len(enabled_feeds)} feeds with {workers} worker(s)")
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="feed") as pool:
+            futures = [pool.submit(self._fetch_single_feed, feed) for feed in enabled_feeds]
+            all_articles = []
+            for future in futures:
+                all_articles.extend(future.result())
 
-            logger.info(f"Fetching feed: {feed['name']}")
-            articles = self._fetch_single_feed(feed)
-            all_articles.extend(articles)
+        if self.feed_cache:
+            self.feed_cache.prune()
+            logger.info(f"Feed cache: {self.feed_cache.get_stats()}")
 
         # Remove duplicates based on link
         unique_articles = {article["link"]: article for article in all_articles}
@@ -559,11 +1520,14 @@ class FeedFetcher:
         and date parsing automatically.
         """
         articles = []
+        logger.info(f"Fetching feed: {feed['name']}")
 
         try:
-            parsed = self._fetch_parsed_feed(feed["url"])
+            fetch_start = time.time()
+            entries, cache_status = self._fetch_feed_entries(feed["url"])
+            fetch_latency_ms = int((time.time() - fetch_start) * 1000)
 
-            for entry in parsed.entries:
+            for entry in entries:
                 # Get article date
                 published = entry.get("published_parsed") or entry.get("updated_parsed")
                 if published:
@@ -600,7 +1564,7 @@ class FeedFetcher:
             if self.research_logger and RKL_LOGGING_AVAILABLE:
                 candidate_hashes = [
                     sha256_text(entry.get("link", "") or entry.get("id", ""))
-                    for entry in parsed.entries
+                    for entry in entries
                 ]
                 selected_hashes = [sha256_text(a["link"]) for a in articles]
                 self.research_logger.log("retrieval_provenance", {
@@ -612,7 +1576,9 @@ class FeedFetcher:
                     "candidate_hashes": candidate_hashes[:50],
                     "selected_hashes": selected_hashes[:50],
                     "cutoff_date": self.cutoff_date.strftime("%Y-%m-%d"),
-                    "category": feed.get("category", "general")
+                    "category": feed.get("category", "general"),
+                    "fetch_latency_ms": fetch_latency_ms,
+                    "feed_cache": cache_status
                 })
 
         except Exception as e:
@@ -620,33 +1586,163 @@ class FeedFetcher:
 
         return articles
 
-    def _fetch_parsed_feed(self, url: str):
+    def _fetch_feed_entries(self, url: str):
         """
-        Fetch and parse an RSS feed. If REMOTE_FETCH_HOST is set, fetch via SSH curl on that host.
+        Return (entries, cache_status) for a feed URL.
+
+        cache_status is one of:
+        - "disabled": no feed cache configured
+        - "miss": fetched and parsed (cache updated)
+        - "not_modified": server answered 304, cached entries reused, no parse
+        - "unchanged": body identical to the cached one, no parse
+        - "stale": fetch failed, last cached entries reused
+
+        Entries are plain dicts (see _simplify_entry), whether cached or fresh.
         """
+        cached = self.feed_cache.get(url) if self.feed_cache else None
+
+        headers = {}
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("modified"):
+                headers["If-Modified-Since"] = cached["modified"]
+
         if self.remote_fetch_host:
-            try:
-                host_target = self.remote_fetch_host
-                if self.remote_fetch_user:
-                    host_target = f"{self.remote_fetch_user}@{self.remote_fetch_host}"
-                cmd = [
-                    "ssh",
-                    "-o", "BatchMode=yes",
-                    "-o", "StrictHostKeyChecking=accept-new",
-                    host_target,
-                    "curl", "-L", "-s", url
-                ]
-                proc = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-                if proc.returncode != 0:
-                    logger.error(f"Remote fetch via {host_target} failed for {url}: rc={proc.returncode}, stderr={proc.stderr.strip()}")
-                    return feedparser.parse("")
-                return feedparser.parse(proc.stdout)
-            except Exception as e:
-                logger.error(f"Remote fetch via {self.remote_fetch_host} failed for {url}: {e}")
-                return feedparser.parse("")  # empty
-        # Local fetch
+            status, body, response_headers = self._fetch_remote(url, headers)
+        else:
+            status, body, response_headers = self._fetch_local(url, headers)
+
+        if status is None:
+            if cached:
+                logger.warning(f"Using cached entries for {url} after fetch failure")
+                return cached.get("entries", []), "stale"
+            return [], "disabled" if not self.feed_cache else "miss"
+
+        if status == 304 and cached:
+            logger.info(f"Feed not modified (304): {url}")
+            return cached.get("entries", []), "not_modified"
+
+        body_hash = hashlib.sha256(body).hexdigest()
+        if cached and cached.get("body_hash") == body_hash:
+            logger.info(f"Feed body unchanged: {url}")
+            return cached.get("entries", []), "unchanged"
+
+        parsed = feedparser.parse(body, response_headers=response_headers)
+        entries = [self._simplify_entry(entry) for entry in parsed.entries]
+
+        if not self.feed_cache:
+            return entries, "disabled"
+        if parsed.entries or not parsed.get("bozo"):
+            self.feed_cache.set(url, {
+                "etag": response_headers.get("etag"),
+                "modified": response_headers.get("last-modified"),
+                "body_hash": body_hash,
+                "entries": entries
+            })
+        return entries, "miss"
+
+    @staticmethod
+    def _simplify_entry(entry) -> Dict:
+        """Keep only the entry fields _fetch_single_feed reads, in JSON-safe form."""
+        simplified = {
+            "title": entry.get("title", ""),
+            "summary": entry.get("summary", ""),
+            "link": entry.get("link", ""),
+            "id": entry.get("id", "")
+        }
+        content = entry.get("content")
+        if content:
+            simplified["content"] = [{"value": content[0].get("value", "")}]
+        for key in ("published_parsed", "updated_parsed"):
+            if entry.get(key):
+                simplified[key] = list(entry[key])[:6]
+        return simplified
+
+    def _fetch_local(self, url: str, headers: Dict):
+        """
+        Fetch a feed over the shared pooled session (timeout bounds each feed).
+
+        Returns:
+            (status, body_bytes, lowercase_headers), or (None, b"", {}) on failure
+        """
         logger.info(f"Fetching feed locally: {url}")
-        return feedparser.parse(url)
+        try:
+            response = self.session.get(
+                url, headers=headers,
+                timeout=(min(10.0, self.feed_timeout), self.feed_timeout)
+            )
+            if response.status_code != 304:
+                response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Local fetch failed for {url}: {e}")
+            return None, b"", {}
+        return (
+            response.status_code,
+            response.content,
+            {k.lower(): v for k, v in response.headers.items()}
+        )
+
+    def _fetch_remote(self, url: str, headers: Dict):
+        """
+        Fetch a feed via SSH curl on REMOTE_FETCH_HOST.
+
+        curl dumps response headers ahead of the body (-D -) so the ETag,
+        Last-Modified and status survive the SSH hop. Arguments are quoted
+        because ssh hands the command line to the remote shell.
+
+        Returns:
+            (status, body_bytes, lowercase_headers), or (None, b"", {}) on failure
+        """
+        host_target = self.remote_fetch_host
+        if self.remote_fetch_user:
+            host_target = f"{self.remote_fetch_user}@{self.remote_fetch_host}"
+        curl_args = ["curl", "-L", "-s", "-D", "-"]
+        for name, value in headers.items():
+            curl_args += ["-H", f"{name}: {value}"]
+        curl_args.append(url)
+        cmd = [
+            "ssh",
+            "-o", "BatchMode=yes",
+            "-o", "StrictHostKeyChecking=accept-new",
+            host_target,
+            " ".join(shlex.quote(arg) for arg in curl_args)
+        ]
+        try:
+            proc = subprocess.run(cmd, capture_output=True, timeout=self.feed_timeout)
+        except Exception as e:
+            logger.error(f"Remote fetch via {host_target} failed for {url}: {e}")
+            return None, b"", {}
+        if proc.returncode != 0:
+            logger.error(f"Remote fetch via {host_target} failed for {url}: rc={proc.returncode}, stderr={proc.stderr.decode(errors='replace').strip()}")
+            return None, b"", {}
+        return self._split_curl_output(proc.stdout)
+
+    @staticmethod
+    def _split_curl_output(output: bytes):
+        """
+        Split `curl -L -D -` output into (status, body, headers).
+
+        With -L there is one header block per redirect hop; the last one
+        describes the body.
+        """
+        status, response_headers, rest = None, {}, output
+        while rest.startswith(b"HTTP/"):
+            sep = b"\r\n\r\n" if b"\r\n\r\n" in rest else b"\n\n"
+            block, _, rest = rest.partition(sep)
+            lines = block.decode("iso-8859-1").splitlines()
+            try:
+                status = int(lines[0].split()[1])
+            except (IndexError, ValueError):
+                status = None
+            response_headers = {}
+            for line in lines[1:]:
+                name, _, value = line.partition(":")
+                response_headers[name.strip().lower()] = value.strip()
+        if status is not None and status >= 400:
+            logger.error(f"Remote fetch returned HTTP {status}")
+            return None, b"", {}
+        return status or 200, rest, response_headers
 
 
 def generate_readable_markdown(articles, session_id, output_path):
@@ -833,6 +1929,276 @@ Include at the end:
         f.write(blog_content)
 
 
+def run_gemini_qa(summaries: List[Dict], session_id: str,
+                  research_logger: Optional["StructuredLogger"] = None) -> None:
+    """
+    Optional Gemini QA pass over summarized articles (ENABLE_GEMINI_QA=true).
+
+    Adds "gemini_analysis" to each article that gets a verdict, logs one
+    hallucination_matrix record per article and marks articles below
+    GEMINI_THEME_THRESHOLD with "_drop". GEMINI_QA_BATCH_SIZE > 1 reviews
+    several articles per request; anything missing from a batch is retried
+    individually.
+
+    Args:
+        summaries: Summarized articles (modified in place)
+        session_id: Session identifier for telemetry
+        research_logger: Optional StructuredLogger for research telemetry
+    """
+    if not GEMINI_CLIENT_AVAILABLE:
+        return
+    if os.getenv("ENABLE_GEMINI_QA", "false").lower() not in ("1", "true", "yes"):
+        return
+    try:
+        gem_qamodel = os.getenv("GEMINI_QA_MODEL", "gemini-2.0-flash")
+        gem_client = GeminiClient(model_name=gem_qamodel, research_logger=research_logger)
+        theme_threshold = float(os.getenv("GEMINI_THEME_THRESHOLD", "0.6"))
+        batch_size = max(1, int(os.getenv("GEMINI_QA_BATCH_SIZE", "1")))
+        logger.info(f"Gemini QA enabled: processing {len(summaries)} articles with {gem_qamodel}")
+    except Exception as e:
+        logger.warning(f"Gemini QA unavailable: {e}")
+        return
+
+    qa_system_prompt = "You are a senior AI safety researcher specializing in secure reasoning, AI alignment, and governance. You provide expert analysis of research relevance to building trustworthy, auditable AI systems."
+    qa_task = """Your task has TWO parts:
+
+PART A: QUALITY VALIDATION
+1. Do summaries accurately reflect the abstract/excerpt?
+2. Any hallucinations or misrepresentations?
+
+PART B: ORIGINAL SECURE REASONING ANALYSIS
+Secure reasoning encompasses: reasoning provenance, auditability, interpretability, alignment, verification, governance.
+
+Analyze:
+1. Which secure reasoning aspects does this address?
+2. What specific problem does it tackle?
+3. What capability does it enable for practitioners?
+4. How does it connect to secure reasoning challenges?
+5. WHY does this matter (2-3 sentences)?"""
+    qa_fields = """  "quality_verdict": "pass|fail|uncertain",
+  "quality_confidence": 0.0-1.0,
+  "error_type": "none|hallucination|omission|misrepresentation",
+  "confidence_factors": {
+    "summary_completeness": 0.0-1.0,
+    "technical_accuracy": 0.0-1.0,
+    "clarity": 0.0-1.0,
+    "source_alignment": 0.0-1.0
+  },
+  "confidence_reasoning": "Explanation of confidence factors",
+
+  "relevance_score": 0.0-1.0,
+  "relevance_rationale": "Which secure reasoning aspects this addresses",
+  "key_insight": "2-3 sentences on why this matters to secure reasoning",
+  "practical_value": "What this enables for practitioners",
+  "significance": "breakthrough|important|useful|incremental|tangential",
+  "recommendation": "must-include|include|consider|exclude\""""
+    qa_context = "IMPORTANT CONTEXT: These summaries are based on article ABSTRACTS (ArXiv) or partial content (first 1500 chars), not full papers."
+
+    # Short artifact_id prefixes label articles inside a batched prompt
+    qa_ids = [hashlib.sha256(a.get("link", "").encode("utf-8")).hexdigest()[:12] for a in summaries]
+
+    def article_block(article: Dict) -> str:
+        return (
+            f"Article: {article.get('title', 'Unknown')}\n"
+            f"Source: {article.get('source', 'Unknown')}\n"
+            f"Technical Summary: {article.get('technical_summary','')}\n"
+            f"Lay Explanation: {article.get('lay_explanation','')}"
+        )
+
+    def single_request(pos: int) -> Dict:
+        prompt = f"{qa_context}\n\n{article_block(summaries[pos])}\n\n{qa_task}\n\nReturn JSON only:\n{{\n{qa_fields}\n}}"
+        return {
+            "prompt": prompt,
+            "system_prompt": qa_system_prompt,
+            "temperature": 0.2,
+            "max_tokens": 512,
+            "agent_id": "gemini_qa",
+            "session_id": session_id,
+            "turn_id": pos + 1,
+            "task_type": "secure_reasoning_analysis"
+        }
+
+    def batch_request(positions: List[int]) -> Dict:
+        # The instructions and system prompt are sent once for the whole batch
+        articles = "\n\n".join(
+            f"### artifact_id: {qa_ids[pos]}\n{article_block(summaries[pos])}" for pos in positions
+        )
+        fields = "\n".join("  " + line if line else line for line in qa_fields.splitlines())
+        prompt = (
+            f"{qa_context}\n\nReview each of the {len(positions)} articles below independently.\n\n"
+            f"{articles}\n\n{qa_task}\n\n"
+            f"Return a JSON array only, with exactly one object per article, each echoing its artifact_id:\n"
+            f"[\n  {{\n    \"artifact_id\": \"<artifact_id from the article header>\",\n{fields}\n  }}\n]"
+        )
+        return {
+            "prompt": prompt,
+            "system_prompt": qa_system_prompt,
+            "temperature": 0.2,
+            "max_tokens": 512 * len(positions),
+            "agent_id": "gemini_qa",
+            "session_id": session_id,
+            "turn_id": positions[0] + 1,
+            "task_type": "secure_reasoning_analysis_batch"
+        }
+
+    def parse_json_response(resp: str):
+        # Strip markdown code fences if present (Gemini often wraps JSON in ```json...```)
+        cleaned_resp = resp.strip()
+        if cleaned_resp.startswith("```"):
+            # Extract content between code fences
+            match = re.search(r'```(?:json)?\s*\n?(.*?)\n?```', cleaned_resp, re.DOTALL)
+            if match:
+                cleaned_resp = match.group(1).strip()
+        return json.loads(cleaned_resp)
+
+    def verdict_usable(item: Dict) -> bool:
+        """A batch item needs a verdict and numeric scores; otherwise it is retried alone."""
+        if not item.get("quality_verdict"):
+            return False
+        try:
+            float(item.get("quality_confidence"))
+            if item.get("relevance_score") is not None:
+                float(item["relevance_score"])
+        except (TypeError, ValueError):
+            return False
+        return True
+
+    def parse_batch_response(resp: str, positions: List[int]) -> Dict[int, Dict]:
+        """
+        Map batch positions to verdict objects.
+
+        Unknown or duplicate ids are ignored and incomplete items are dropped,
+        so those articles fall through to the per-article retry.
+        """
+        parsed = parse_json_response(resp)
+        if isinstance(parsed, dict):
+            parsed = next((v for v in parsed.values() if isinstance(v, list)), [parsed])
+        if not isinstance(parsed, list):
+            raise ValueError("expected a JSON array")
+        by_id = {qa_ids[pos]: pos for pos in positions}
+        found = {}
+        for item in parsed:
+            if not isinstance(item, dict):
+                continue
+            pos = by_id.get(str(item.get("artifact_id", "")).strip()[:12])
+            if pos is not None and pos not in found and verdict_usable(item):
+                found[pos] = item
+        return found
+
+    qa_concurrency = os.getenv("GEMINI_QA_CONCURRENCY")
+    max_concurrency = int(qa_concurrency) if qa_concurrency else None
+    qa_parsed: List[Optional[Dict]] = [None] * len(summaries)
+
+    # Batched pass; anything missing or malformed falls through to a per-article retry
+    pending = list(range(len(summaries)))
+    if batch_size > 1 and len(summaries) > 1:
+        batches = [pending[o:o + batch_size] for o in range(0, len(pending), batch_size)]
+        batch_results = gem_client.generate_many(
+            [batch_request(positions) for positions in batches],
+            max_concurrency=max_concurrency
+        )
+        for positions, (resp, qa_error) in zip(batches, batch_results):
+            try:
+                if qa_error is not None:
+                    raise qa_error
+                for pos, item in parse_batch_response(resp, positions).items():
+                    qa_parsed[pos] = item
+            except Exception as e:
+                logger.warning(f"Gemini QA batch failure on articles {positions[0] + 1}-{positions[-1] + 1}: {e}")
+        pending = [pos for pos in pending if qa_parsed[pos] is None]
+        logger.info(
+            f"Gemini QA batches: {len(batches)} requests for {len(summaries)} articles, "
+            f"{len(pending)} retried individually"
+        )
+
+    # Per-article requests run concurrently under the client's shared rate limiter
+    single_results = gem_client.generate_many(
+        [single_request(pos) for pos in pending],
+        max_concurrency=max_concurrency
+    ) if pending else []
+    for pos, (resp, qa_error) in zip(pending, single_results):
+        try:
+            if qa_error is not None:
+                raise qa_error
+            if resp:
+                qa_parsed[pos] = parse_json_response(resp)
+        except Exception as e:
+            logger.warning(f"Gemini QA parse failure on article {pos + 1}: {e}")
+
+    for idx, (article, parsed) in enumerate(zip(summaries, qa_parsed), 1):
+        verdict = "uncertain"
+        confidence = 0.0
+        error_type = "none"
+        notes = ""
+        theme_score = None
+        theme_verdict = "keep"
+        try:
+            if parsed is not None:
+                # PART A: Quality validation
+                verdict = str(parsed.get("quality_verdict", verdict)).lower()
+                confidence = float(parsed.get("quality_confidence", confidence))
+                error_type = parsed.get("error_type", error_type)
+                # Phase 1+: Confidence breakdown
+                confidence_factors = parsed.get("confidence_factors", {})
+                confidence_reasoning = parsed.get("confidence_reasoning", "")
+
+                # PART B: Original analysis
+                theme_score = parsed.get("relevance_score", theme_score)
+                relevance_rationale = parsed.get("relevance_rationale", "")
+                key_insight = parsed.get("key_insight", "")
+                practical_value = parsed.get("practical_value", "")
+                significance = parsed.get("significance", "")
+                recommendation = parsed.get("recommendation", "")
+
+                # Add Gemini analysis to article
+                article["gemini_analysis"] = {
+                    "relevance_score": theme_score,
+                    "relevance_rationale": relevance_rationale,
+                    "key_insight": key_insight,
+                    "practical_value": practical_value,
+                    "significance": significance,
+                    "recommendation": recommendation,
+                    "quality_verdict": verdict,
+                    "quality_confidence": confidence,
+                    # Phase 1+: Enhanced confidence metrics
+                    "confidence_factors": confidence_factors,
+                    "confidence_reasoning": confidence_reasoning
+                }
+
+                # Legacy fields for filtering
+                theme_verdict = "keep" if recommendation in ["must-include", "include"] else "consider"
+                notes = key_insight[:200] if key_insight else ""
+        except Exception as e:
+            logger.warning(f"Gemini QA parse failure on article {idx}: {e}")
+
+        # Apply theme gate if score present
+        keep_article = True
+        if theme_score is not None:
+            try:
+                keep_article = float(theme_score) >= theme_threshold
+            except Exception:
+                keep_article = True
+
+        if research_logger and RKL_LOGGING_AVAILABLE:
+            research_logger.log("hallucination_matrix", {
+                "session_id": session_id,
+                "artifact_id": sha256_text(article.get("link","")),
+                "verdict": verdict,
+                "method": "gemini_qa",
+                "confidence": confidence,
+                "error_type": error_type,
+                "notes": notes,
+                "theme_score": theme_score,
+                "theme_verdict": theme_verdict,
+                "theme_threshold": theme_threshold
+            })
+
+        # Drop articles that fail the secure reasoning theme gate
+        if not keep_article:
+            logger.info(f"Dropping article {idx} for secure reasoning theme score {theme_score}")
+            summaries[idx-1]["_drop"] = True
+
+
 def main():
     """
     Main entry point for RSS feed processing and article summarization.
@@ -872,9 +2238,30 @@ def main():
 
     Environment Variables:
         OLLAMA_ENDPOINT: Ollama API endpoint (default: http://localhost:11434/api/generate)
+        OLLAMA_ENDPOINTS: Comma-separated endpoints to load-balance across (overrides OLLAMA_ENDPOINT)
+        OLLAMA_HEALTH_INTERVAL_S: Re-probe interval for failed pool endpoints (default: 30)
         OLLAMA_MODEL: Model to use (default: llama3.2)
+        BRIEF_FEEDS_CONFIG: Feeds configuration file (default: config/feeds.json)
+        GEMINI_STANDIN: Use model_standin.StandinGeminiClient for QA (offline load tests) (default: false)
         BRIEF_MAX_ARTICLES: Max articles to process (default: 20)
         BRIEF_SUMMARY_MAX_WORDS: Max words per summary (default: 80)
+        BRIEF_SUMMARY_CONCURRENCY: Articles summarized at once (default: OLLAMA_NUM_PARALLEL x endpoints)
+        BRIEF_SUMMARY_MODE: "multi" (3 calls/article) or "json" (1 call/article) (default: multi)
+        BRIEF_PROMPT_CONTEXT_REUSE: Chain an article's calls via Ollama context (default: false)
+        OLLAMA_KEEP_ALIVE: How long Ollama keeps the model loaded between calls (default: 10m)
+        OLLAMA_CONNECT_TIMEOUT / OLLAMA_READ_TIMEOUT: Per-call timeouts in seconds (5 / 120)
+        OLLAMA_MAX_RETRIES / OLLAMA_RETRY_BACKOFF: Retries on 5xx/connection errors (3 / 1.0s base)
+        OLLAMA_STREAM: Stream tokens (TTFT, tokens/sec, early stop) (default: false)
+        BRIEF_FEED_CACHE: Conditional-request feed cache on/off (default: true)
+        BRIEF_FEED_CACHE_DIR: Feed cache location (default: data/cache/feeds)
+        BRIEF_FEED_CACHE_TTL_DAYS: Drop cached feeds not seen for this long (default: 14)
+        BRIEF_SUMMARY_CACHE: Reuse summaries of already-seen articles (default: true)
+        BRIEF_SUMMARY_CACHE_DIR: Summary store location (default: data/cache/summaries)
+        BRIEF_SUMMARY_CACHE_TTL_DAYS / _MAX_ENTRIES / _MAX_MB: Eviction limits (30 / 5000 / 200)
+        GEMINI_RPM / GEMINI_TPM / GEMINI_BURST: Shared Gemini rate limits (AI Studio: 13 / 1M / 1; Vertex: unlimited)
+        GEMINI_QA_CONCURRENCY: Concurrent Gemini QA calls (default: GEMINI_CONCURRENCY)
+        GEMINI_QA_BATCH_SIZE: Articles reviewed per Gemini QA request (default: 1 = one per article)
+        GEMINI_RESPONSE_CACHE: Reuse identical Gemini responses from data/cache/gemini (default: false)
 
     Outputs:
         content/briefs/{YYYY-MM-DD}_articles.json containing:
@@ -900,7 +2287,13 @@ def main():
         research_logger = StructuredLogger(
             base_dir=str(research_data_dir),
             rkl_version="1.0",
-            batch_size=50  # Write after 50 records
+            batch_size=50,  # Write after 50 records
+            async_writes=True,  # Agents only enqueue; a writer thread does the Parquet I/O
+            backpressure=os.getenv("RKL_LOG_BACKPRESSURE", "block"),
+            # Opt-in: rolling files keep rows in an unreadable .tmp until close(),
+            # so a killed run would lose its telemetry; per-batch files are
+            # compacted after each run instead (see compact_telemetry.py)
+            rolling_files=os.getenv("RKL_LOG_ROLLING_FILES", "false").lower() in ("1", "true", "yes")
         )
         logger.info(f"Research telemetry enabled: {research_data_dir}")
     else:
@@ -911,7 +2304,7 @@ def main():
     logger.info(f"Session ID: {session_id}")
 
     # Load feeds configuration
-    feeds_config_path = config_dir / "feeds.json"
+    feeds_config_path = Path(os.getenv("BRIEF_FEEDS_CONFIG", str(config_dir / "feeds.json")))
     if not feeds_config_path.exists():
         logger.error(f"Feeds configuration not found: {feeds_config_path}")
         sys.exit(1)
@@ -921,19 +2314,46 @@ def main():
 
     # Initialize Ollama client with research logger
     ollama_endpoint = os.getenv("OLLAMA_ENDPOINT", "http://localhost:11434/api/generate")
+    ollama_endpoints = [u.strip() for u in os.getenv("OLLAMA_ENDPOINTS", "").split(",") if u.strip()]
     ollama_model = os.getenv("OLLAMA_MODEL", "llama3.2")
 
-    logger.info(f"Using Ollama endpoint: {ollama_endpoint}")
+    if ollama_endpoints:
+        logger.info(f"Using Ollama endpoint pool: {', '.join(ollama_endpoints)}")
+    else:
+        logger.info(f"Using Ollama endpoint: {ollama_endpoint}")
     logger.info(f"Using model: {ollama_model}")
 
-    ollama_client = OllamaClient(ollama_endpoint, ollama_model, research_logger)
+    if ollama_endpoints:
+        ollama_client = OllamaEndpointPool(ollama_endpoints, ollama_model, research_logger)
+    else:
+        ollama_client = OllamaClient(ollama_endpoint, ollama_model, research_logger)
 
     # Initialize components
     max_words = int(os.getenv("BRIEF_SUMMARY_MAX_WORDS", "80"))
-    summarizer = ArticleSummarizer(ollama_client, max_words)
+    summary_store = None
+    if os.getenv("BRIEF_SUMMARY_CACHE", "true").lower() in ("1", "true", "yes"):
+        summary_store = DiskCache(
+            os.getenv("BRIEF_SUMMARY_CACHE_DIR", str(script_dir / "data" / "cache" / "summaries")),
+            ttl_seconds=float(os.getenv("BRIEF_SUMMARY_CACHE_TTL_DAYS", "30")) * 86400,
+            max_entries=int(os.getenv("BRIEF_SUMMARY_CACHE_MAX_ENTRIES", "5000")),
+            max_bytes=int(os.getenv("BRIEF_SUMMARY_CACHE_MAX_MB", "200")) * 1024 * 1024
+        )
+    summarizer = ArticleSummarizer(
+        ollama_client, max_words, summary_store=summary_store,
+        mode=os.getenv("BRIEF_SUMMARY_MODE", "multi").lower(),
+        context_reuse=os.getenv("BRIEF_PROMPT_CONTEXT_REUSE", "false").lower() in ("1", "true", "yes")
+    )
 
     keywords = feeds_config.get("keywords", [])
-    fetcher = FeedFetcher(feeds_config, keywords, research_logger=research_logger, session_id=session_id)
+    feed_cache = None
+    if os.getenv("BRIEF_FEED_CACHE", "true").lower() in ("1", "true", "yes"):
+        feed_cache = DiskCache(
+            os.getenv("BRIEF_FEED_CACHE_DIR", str(script_dir / "data" / "cache" / "feeds")),
+            ttl_seconds=float(os.getenv("BRIEF_FEED_CACHE_TTL_DAYS", "14")) * 86400,
+            max_entries=int(os.getenv("BRIEF_FEED_CACHE_MAX_ENTRIES", "500"))
+        )
+    fetcher = FeedFetcher(feeds_config, keywords, research_logger=research_logger,
+                          session_id=session_id, feed_cache=feed_cache)
 
     def log_human_intervention(intervention_type: str, human_role: str = "operator", target_turn_id: int = 0, rationale_tag: str = "") -> None:
         """Manually log a human intervention event (use during reruns/approvals)."""
@@ -1082,9 +2502,9 @@ def main():
 
     # Summarize articles
     logger.info(f"Summarizing {len(articles)} articles...")
-    summarized_articles = []
 
-    for i, article in enumerate(articles, 1):
+    def process_article(i: int, article: Dict) -> Dict:
+        """Summarize one article and log its per-article telemetry (runs on a worker thread)."""
         logger.info(f"Processing article {i}/{len(articles)}: {article['title'][:60]}...")
 
         summary = summarizer.summarize_article(
@@ -1104,8 +2524,6 @@ def main():
             # llama3.2:3b supports 128K context, so could go much higher
         })
 
-        summarized_articles.append(summary)
-
         # Telemetry: secure reasoning trace bundle (structural)
         # Phase 2 Enhancement: Include timing data for each step
         if research_logger and RKL_LOGGING_AVAILABLE:
@@ -1196,158 +2614,28 @@ def main():
                 }
             })
 
-    # Optional Gemini QA / hallucination matrix logging
-    def run_gemini_qa(summaries: List[Dict]) -> None:
-        if not GEMINI_CLIENT_AVAILABLE:
-            return
-        if os.getenv("ENABLE_GEMINI_QA", "false").lower() not in ("1", "true", "yes"):
-            return
-        try:
-            gem_qamodel = os.getenv("GEMINI_QA_MODEL", "gemini-2.0-flash")
-            gem_client = GeminiClient(model_name=gem_qamodel, research_logger=research_logger)
-            theme_threshold = float(os.getenv("GEMINI_THEME_THRESHOLD", "0.6"))
-            logger.info(f"Gemini QA enabled: processing {len(summaries)} articles with {gem_qamodel}")
-        except Exception as e:
-            logger.warning(f"Gemini QA unavailable: {e}")
-            return
-
-        for idx, article in enumerate(summaries, 1):
-            prompt = f"""IMPORTANT CONTEXT: These summaries are based on article ABSTRACTS (ArXiv) or partial content (first 1500 chars), not full papers.
-
-Article: {article.get('title', 'Unknown')}
-Source: {article.get('source', 'Unknown')}
-Technical Summary: {article.get('technical_summary','')}
-Lay Explanation: {article.get('lay_explanation','')}
-
-Your task has TWO parts:
-
-PART A: QUALITY VALIDATION
-1. Do summaries accurately reflect the abstract/excerpt?
-2. Any hallucinations or misrepresentations?
-
-PART B: ORIGINAL SECURE REASONING ANALYSIS
-Secure reasoning encompasses: reasoning provenance, auditability, interpretability, alignment, verification, governance.
-
-Analyze:
-1. Which secure reasoning aspects does this address?
-2. What specific problem does it tackle?
-3. What capability does it enable for practitioners?
-4. How does it connect to secure reasoning challenges?
-5. WHY does this matter (2-3 sentences)?
-
-Return JSON only:
-{{
-  "quality_verdict": "pass|fail|uncertain",
-  "quality_confidence": 0.0-1.0,
-  "error_type": "none|hallucination|omission|misrepresentation",
-  "confidence_factors": {{
-    "summary_completeness": 0.0-1.0,
-    "technical_accuracy": 0.0-1.0,
-    "clarity": 0.0-1.0,
-    "source_alignment": 0.0-1.0
-  }},
-  "confidence_reasoning": "Explanation of confidence factors",
+        return summary
 
-  "relevance_score": 0.0-1.0,
-  "relevance_rationale": "Which secure reasoning aspects this addresses",
-  "key_insight": "2-3 sentences on why this matters to secure reasoning",
-  "practical_value": "What this enables for practitioners",
-  "significance": "breakthrough|important|useful|incremental|tangential",
-  "recommendation": "must-include|include|consider|exclude"
-}}"""
-            verdict = "uncertain"
-            confidence = 0.0
-            error_type = "none"
-            notes = ""
-            theme_score = None
-            theme_verdict = "keep"
-            try:
-                resp = gem_client.generate(
-                    prompt,
-                    system_prompt="You are a senior AI safety researcher specializing in secure reasoning, AI alignment, and governance. You provide expert analysis of research relevance to building trustworthy, auditable AI systems.",
-                    temperature=0.2,
-                    max_tokens=512,
-                    agent_id="gemini_qa",
-                    session_id=session_id,
-                    turn_id=idx,
-                    task_type="secure_reasoning_analysis"
-                )
-                if resp:
-                    import json as _json
-                    import re
-                    # Strip markdown code fences if present (Gemini often wraps JSON in ```json...```)
-                    cleaned_resp = resp.strip()
-                    if cleaned_resp.startswith("```"):
-                        # Extract content between code fences
-                        match = re.search(r'```(?:json)?\s*\n?(.*?)\n?```', cleaned_resp, re.DOTALL)
-                        if match:
-                            cleaned_resp = match.group(1).strip()
-                    parsed = _json.loads(cleaned_resp)
-                    # PART A: Quality validation
-                    verdict = str(parsed.get("quality_verdict", verdict)).lower()
-                    confidence = float(parsed.get("quality_confidence", confidence))
-                    error_type = parsed.get("error_type", error_type)
-                    # Phase 1+: Confidence breakdown
-                    confidence_factors = parsed.get("confidence_factors", {})
-                    confidence_reasoning = parsed.get("confidence_reasoning", "")
-
-                    # PART B: Original analysis
-                    theme_score = parsed.get("relevance_score", theme_score)
-                    relevance_rationale = parsed.get("relevance_rationale", "")
-                    key_insight = parsed.get("key_insight", "")
-                    practical_value = parsed.get("practical_value", "")
-                    significance = parsed.get("significance", "")
-                    recommendation = parsed.get("recommendation", "")
-
-                    # Add Gemini analysis to article
-                    article["gemini_analysis"] = {
-                        "relevance_score": theme_score,
-                        "relevance_rationale": relevance_rationale,
-                        "key_insight": key_insight,
-                        "practical_value": practical_value,
-                        "significance": significance,
-                        "recommendation": recommendation,
-                        "quality_verdict": verdict,
-                        "quality_confidence": confidence,
-                        # Phase 1+: Enhanced confidence metrics
-                        "confidence_factors": confidence_factors,
-                        "confidence_reasoning": confidence_reasoning
-                    }
-
-                    # Legacy fields for filtering
-                    theme_verdict = "keep" if recommendation in ["must-include", "include"] else "consider"
-                    notes = key_insight[:200] if key_insight else ""
-            except Exception as e:
-                logger.warning(f"Gemini QA parse failure on article {idx}: {e}")
-
-            # Apply theme gate if score present
-            keep_article = True
-            if theme_score is not None:
-                try:
-                    keep_article = float(theme_score) >= theme_threshold
-                except Exception:
-                    keep_article = True
-
-            if research_logger and RKL_LOGGING_AVAILABLE:
-                research_logger.log("hallucination_matrix", {
-                    "session_id": session_id,
-                    "artifact_id": sha256_text(article.get("link","")),
-                    "verdict": verdict,
-                    "method": "gemini_qa",
-                    "confidence": confidence,
-                    "error_type": error_type,
-                    "notes": notes,
-                    "theme_score": theme_score,
-                    "theme_verdict": theme_verdict,
-                    "theme_threshold": theme_threshold
-                })
+    # Ollama serves OLLAMA_NUM_PARALLEL requests per model at once (per endpoint in a
+    # pool); match it by default. Results are collected in input order, so the
+    # output JSON is deterministic.
+    endpoint_count = len(getattr(ollama_client, "endpoints", [ollama_endpoint]))
+    default_concurrency = int(os.getenv("OLLAMA_NUM_PARALLEL", "1")) * endpoint_count
+    concurrency = max(1, int(os.getenv("BRIEF_SUMMARY_CONCURRENCY", str(default_concurrency))))
+    if concurrency == 1:
+        summarized_articles = [process_article(i, article) for i, article in enumerate(articles, 1)]
+    else:
+        logger.info(f"Summarizing with {concurrency} concurrent workers")
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="summarize") as pool:
+            futures = [pool.submit(process_article, i, article) for i, article in enumerate(articles, 1)]
+            summarized_articles = [future.result() for future in futures]
 
-            # Drop articles that fail the secure reasoning theme gate
-            if not keep_article:
-                logger.info(f"Dropping article {idx} for secure reasoning theme score {theme_score}")
-                summaries[idx-1]["_drop"] = True
+    if summary_store:
+        summary_store.prune()
+        logger.info(f"Summary store: {summary_store.get_stats()}")
 
-    run_gemini_qa(summarized_articles)
+    # Optional Gemini QA / hallucination matrix logging
+    run_gemini_qa(summarized_articles, session_id, research_logger)
 
     # Filter out dropped articles if theme gate marked them
     summarized_articles = [a for a in summarized_articles if not a.get("_drop")]
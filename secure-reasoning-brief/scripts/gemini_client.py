@@ -8,20 +8,33 @@ This module demonstrates the use of Google's Gemini API as learned in the
 processing philosophy through intelligent fallback mechanisms.
 """
 
+import hashlib
+import json
 import os
+import re
 import sys
 import logging
+import threading
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 from dotenv import load_dotenv
 
+from circuit_breaker import CircuitBreaker, OPEN
+from disk_cache import DiskCache
+from model_router import (
+    Backend, Router, RoutingPolicy, load_quality_from_telemetry, policy_from_env
+)
+from rate_limiter import RateLimiter, shared_limiter
+
 # Import RKL logging for research telemetry
 try:
     sys.path.insert(0, str(Path(__file__).parent.parent))
-    from rkl_logging import sha256_text
+    from rkl_logging import record_class, sha256_text
+    ExecutionContext = record_class("execution_context")
     RKL_LOGGING_AVAILABLE = True
 except ImportError:
     RKL_LOGGING_AVAILABLE = False
@@ -56,6 +69,42 @@ if USE_VERTEX_AI:
 else:
     VERTEX_AI_AVAILABLE = False
 
+# Response caches already pruned in this process (prune once per directory)
+_PRUNED_CACHE_DIRS = set()
+_PRUNED_CACHE_LOCK = threading.Lock()
+
+
+def response_cache_from_env() -> Optional[DiskCache]:
+    """
+    Build the opt-in Gemini response cache from environment variables.
+
+    GEMINI_RESPONSE_CACHE: Enable caching (default: false)
+    GEMINI_RESPONSE_CACHE_DIR: Location (default: data/cache/gemini)
+    GEMINI_RESPONSE_CACHE_TTL_DAYS / _MAX_ENTRIES / _MAX_MB: Eviction limits (30 / 2000 / 100)
+
+    Returns:
+        DiskCache, or None when caching is disabled
+    """
+    if os.getenv("GEMINI_RESPONSE_CACHE", "false").lower() not in ("1", "true", "yes"):
+        return None
+    cache_dir = os.getenv(
+        "GEMINI_RESPONSE_CACHE_DIR",
+        str(Path(__file__).parent.parent / "data" / "cache" / "gemini")
+    )
+    cache = DiskCache(
+        cache_dir,
+        ttl_seconds=float(os.getenv("GEMINI_RESPONSE_CACHE_TTL_DAYS", "30")) * 86400,
+        max_entries=int(os.getenv("GEMINI_RESPONSE_CACHE_MAX_ENTRIES", "2000")),
+        max_bytes=int(float(os.getenv("GEMINI_RESPONSE_CACHE_MAX_MB", "100")) * 1024 * 1024)
+    )
+    with _PRUNED_CACHE_LOCK:
+        if cache_dir not in _PRUNED_CACHE_DIRS:
+            _PRUNED_CACHE_DIRS.add(cache_dir)
+            removed = cache.prune()
+            if removed:
+                logger.info(f"Gemini response cache: evicted {removed} entries")
+    return cache
+
 
 class GeminiClient:
     """
@@ -67,14 +116,32 @@ class GeminiClient:
     - Token usage tracking
     - Integration with RKL's audit framework
 
+    Rate limiting:
+    - All clients for the same API + model share one RateLimiter (rate_limiter.py)
+      configured by GEMINI_RPM / GEMINI_TPM / GEMINI_BURST. Defaults: AI Studio
+      free tier 13 RPM (the old 4.5s spacing) and 1M TPM; Vertex AI unlimited.
+    - 429 / quota errors halve the shared rate, pause every caller and are
+      retried up to GEMINI_MAX_RETRIES times.
+    - generate_many() runs requests concurrently (GEMINI_CONCURRENCY) while the
+      limiter keeps the aggregate rate within quota.
+
+    Response cache (opt-in, GEMINI_RESPONSE_CACHE=true):
+    - generate() results are stored in a DiskCache keyed on model, temperature,
+      max_tokens, extra generation params and sha256(system_prompt + prompt),
+      so reruns and backfills over the same inputs make no API calls.
+    - Hits are logged to execution_context with cache_hit=True.
+
     Attributes:
         model_name (str): Gemini model to use (e.g., 'gemini-2.0-flash')
         api_key (str): Google AI Studio API key
         model: Configured Gemini model instance
+        limiter (RateLimiter): Shared RPM/TPM limiter for this API + model
+        response_cache (DiskCache): Response cache, or None when disabled
     """
 
     def __init__(self, model_name: str = "gemini-2.0-flash", api_key: Optional[str] = None,
-                 research_logger: Optional['StructuredLogger'] = None):
+                 research_logger: Optional['StructuredLogger'] = None,
+                 response_cache: Optional[DiskCache] = None):
         """
         Initialize Gemini client (AI Studio or Vertex AI).
 
@@ -82,6 +149,7 @@ class GeminiClient:
             model_name: Name of Gemini model to use
             api_key: Optional API key (defaults to GOOGLE_API_KEY env var, ignored if Vertex AI)
             research_logger: Optional StructuredLogger for research telemetry
+            response_cache: Optional DiskCache for responses (default: from GEMINI_RESPONSE_CACHE)
 
         Raises:
             ImportError: If required SDK not installed
@@ -91,9 +159,17 @@ class GeminiClient:
         self.research_logger = research_logger
         self.use_vertex_ai = USE_VERTEX_AI
 
-        # Rate limiting (only for free tier AI Studio)
-        self.last_request_time = 0
-        self.min_request_interval = 0 if USE_VERTEX_AI else 4.5  # No limit for Vertex AI paid tier
+        # Rate limiting: shared per API + model so concurrent clients split one quota
+        default_rpm, default_tpm = ("0", "0") if USE_VERTEX_AI else ("13", "1000000")
+        self.limiter: RateLimiter = shared_limiter(
+            ("vertex" if USE_VERTEX_AI else "studio", model_name),
+            rpm=float(os.getenv("GEMINI_RPM", default_rpm)),
+            tpm=float(os.getenv("GEMINI_TPM", default_tpm)),
+            burst=float(os.getenv("GEMINI_BURST", "1"))
+        )
+        self.max_retries = max(0, int(os.getenv("GEMINI_MAX_RETRIES", "3")))
+        self.max_concurrency = max(1, int(os.getenv("GEMINI_CONCURRENCY", "8" if USE_VERTEX_AI else "2")))
+        self.response_cache = response_cache if response_cache is not None else response_cache_from_env()
 
         if USE_VERTEX_AI and VERTEX_AI_AVAILABLE:
             # Vertex AI paid tier setup
@@ -113,7 +189,7 @@ class GeminiClient:
             vertexai.init(project=project_id, location=location)
             self.model = GenerativeModel(self.model_name)
 
-            logger.info(f"✅ Initialized Vertex AI client (PAID TIER - NO RATE LIMITING)")
+            logger.info(f"✅ Initialized Vertex AI client (PAID TIER)")
             logger.info(f"   Project: {project_id}, Location: {location}, Model: {self.model_name}")
 
         else:
@@ -136,7 +212,10 @@ class GeminiClient:
             self.model = genai.GenerativeModel(self.model_name)
 
             logger.info(f"Initialized AI Studio client (FREE TIER - Rate limited)")
-            logger.info(f"Rate limiting: {self.min_request_interval}s between requests")
+        if self.limiter.unlimited:
+            logger.info("Rate limiting: none (set GEMINI_RPM / GEMINI_TPM to cap)")
+        else:
+            logger.info(f"Rate limiting: {self.limiter.rpm or 'unlimited'} RPM, {self.limiter.tpm or 'unlimited'} TPM (shared)")
 
     def generate(
         self,
@@ -172,6 +251,23 @@ class GeminiClient:
         """
         start_time = time.time()
 
+        # Cached response: no external call, so no boundary crossing to log
+        cache_key = None
+        if self.response_cache is not None:
+            cache_key = self.response_cache_key(prompt, system_prompt, temperature, max_tokens, kwargs)
+            cached = self.response_cache.get(cache_key)
+            if cached and cached.get("text"):
+                self._log_execution(
+                    prompt, system_prompt, agent_id, session_id, turn_id, temperature,
+                    latency_ms=int((time.time() - start_time) * 1000),
+                    prompt_tokens=cached.get("prompt_tokens") or len(f"{system_prompt or ''} {prompt}".split()),
+                    gen_tokens=0,
+                    cache_hit=True,
+                    token_estimation="cache"
+                )
+                logger.info(f"Gemini cache hit ({len(cached['text'])} chars)")
+                return cached["text"]
+
         # Log boundary event: external API call (Type III)
         if self.research_logger and RKL_LOGGING_AVAILABLE:
             self.research_logger.log("boundary_event", {
@@ -187,14 +283,6 @@ class GeminiClient:
             })
 
         try:
-            # Rate limiting: only for free tier AI Studio
-            if self.min_request_interval > 0:
-                time_since_last_request = time.time() - self.last_request_time
-                if time_since_last_request < self.min_request_interval:
-                    sleep_time = self.min_request_interval - time_since_last_request
-                    logger.info(f"Rate limiting: sleeping {sleep_time:.2f}s before API call")
-                    time.sleep(sleep_time)
-
             # Combine system prompt and user prompt if both provided
             full_prompt = prompt
             if system_prompt:
@@ -216,14 +304,27 @@ class GeminiClient:
                     **kwargs
                 )
 
-            # Generate response
+            # Generate response (rate limited; 429s slow the shared limiter and retry)
             api_type = "Vertex AI" if self.use_vertex_ai else "AI Studio"
             logger.debug(f"Calling {api_type} with prompt length: {len(full_prompt)} chars")
-            self.last_request_time = time.time()  # Update timestamp before call
-            response = self.model.generate_content(
-                full_prompt,
-                generation_config=generation_config
-            )
+            estimated_tokens = len(full_prompt) // 4 + (max_tokens or 512)
+            rate_limit_wait_s = 0.0
+            retry_count = 0
+            while True:
+                rate_limit_wait_s += self.limiter.acquire(estimated_tokens)
+                try:
+                    response = self.model.generate_content(
+                        full_prompt,
+                        generation_config=generation_config
+                    )
+                    self.limiter.success()
+                    break
+                except Exception as e:
+                    if not self.is_rate_limit_error(e) or retry_count >= self.max_retries:
+                        raise
+                    retry_count += 1
+                    self.limiter.throttled(self.retry_after(e))
+                    logger.warning(f"{api_type} rate limited; retry {retry_count}/{self.max_retries} at reduced rate")
 
             # Extract text from response
             if not response or not response.text:
@@ -239,25 +340,28 @@ class GeminiClient:
             if hasattr(response, 'usage_metadata') and response.usage_metadata:
                 prompt_tokens = getattr(response.usage_metadata, 'prompt_token_count', None)
                 gen_tokens = getattr(response.usage_metadata, 'candidates_token_count', None)
+            if prompt_tokens is not None:
+                self.limiter.reconcile(estimated_tokens, prompt_tokens + (gen_tokens or 0))
+
+            if cache_key is not None:
+                self.response_cache.set(cache_key, {
+                    "text": response.text,
+                    "model": self.model_name,
+                    "prompt_tokens": prompt_tokens,
+                    "gen_tokens": gen_tokens
+                })
 
             # Log execution context for research
-            if self.research_logger and RKL_LOGGING_AVAILABLE:
-                self.research_logger.log("execution_context", {
-                    "timestamp": datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
-                    "session_id": session_id or "unknown",
-                    "turn_id": turn_id or 0,
-                    "agent_id": agent_id,
-                    "model_id": self.model_name,
-                    "model_rev": "api",
-                    "temp": temperature,
-                    "top_p": None,
-                    "ctx_tokens_used": prompt_tokens if prompt_tokens else len(full_prompt.split()),
-                    "gen_tokens": gen_tokens if gen_tokens else len(response.text.split()),
-                    "tool_lat_ms": latency_ms,
-                    "prompt_id_hash": sha256_text(prompt) if RKL_LOGGING_AVAILABLE else "",
-                    "system_prompt_hash": sha256_text(system_prompt) if system_prompt and RKL_LOGGING_AVAILABLE else "",
-                    "token_estimation": "api" if prompt_tokens else "word_count"
-                })
+            self._log_execution(
+                prompt, system_prompt, agent_id, session_id, turn_id, temperature,
+                latency_ms=latency_ms,
+                prompt_tokens=prompt_tokens if prompt_tokens else len(full_prompt.split()),
+                gen_tokens=gen_tokens if gen_tokens else len(response.text.split()),
+                cache_hit=False,
+                token_estimation="api" if prompt_tokens else "word_count",
+                retry_count=retry_count,
+                rate_limit_wait_ms=int(rate_limit_wait_s * 1000)
+            )
 
             logger.info(f"Gemini generated {len(response.text)} chars in {latency_ms}ms")
             return response.text
@@ -281,10 +385,86 @@ class GeminiClient:
 
             raise  # Re-raise to allow caller to handle fallback
 
+    def response_cache_key(self, prompt: str, system_prompt: Optional[str], temperature: float,
+                           max_tokens: Optional[int], params: Optional[Dict[str, Any]] = None) -> str:
+        """Cache key: model | temperature | max_tokens | params | sha256(system_prompt + prompt)."""
+        prompt_hash = hashlib.sha256(f"{system_prompt or ''}\n\n{prompt}".encode("utf-8")).hexdigest()
+        params_json = json.dumps(params or {}, sort_keys=True, default=str)
+        return f"{self.model_name}|{temperature}|{max_tokens}|{params_json}|{prompt_hash}"
+
+    def _log_execution(self, prompt: str, system_prompt: Optional[str], agent_id: str,
+                       session_id: Optional[str], turn_id: Optional[int], temperature: float,
+                       latency_ms: int, prompt_tokens: Optional[int], gen_tokens: Optional[int],
+                       cache_hit: bool, **extra) -> None:
+        """Log one execution_context record for a generate() call."""
+        if not (self.research_logger and RKL_LOGGING_AVAILABLE):
+            return
+        self.research_logger.log("execution_context", ExecutionContext(
+            timestamp=datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
+            session_id=session_id or "unknown",
+            turn_id=turn_id or 0,
+            agent_id=agent_id,
+            model_id=self.model_name,
+            model_rev="api",
+            temp=temperature,
+            top_p=None,
+            ctx_tokens_used=prompt_tokens,
+            gen_tokens=gen_tokens,
+            tool_lat_ms=latency_ms,
+            cache_hit=cache_hit,
+            prompt_id_hash=sha256_text(prompt),
+            system_prompt_hash=sha256_text(system_prompt) if system_prompt else "",
+            **extra
+        ))
+
+    @staticmethod
+    def is_rate_limit_error(error: Exception) -> bool:
+        """True for HTTP 429 / quota exhaustion from either SDK."""
+        if type(error).__name__ in ("ResourceExhausted", "TooManyRequests"):
+            return True
+        if getattr(error, "code", None) == 429:
+            return True
+        message = str(error).lower()
+        return "429" in message or "resource exhausted" in message or "quota" in message
+
+    @staticmethod
+    def retry_after(error: Exception) -> Optional[float]:
+        """Server-suggested delay in seconds, if the error carries one."""
+        match = re.search(r"retry(?:[ _-]after|_delay)[^0-9]{0,20}(\d+(?:\.\d+)?)", str(error), re.IGNORECASE)
+        return float(match.group(1)) if match else None
+
+    def generate_many(self, requests: List[Dict[str, Any]],
+                      max_concurrency: Optional[int] = None) -> List[Tuple[str, Optional[Exception]]]:
+        """
+        Run several generate() calls concurrently under the shared rate limit.
+
+        Args:
+            requests: One dict of generate() keyword arguments per call
+            max_concurrency: Worker threads (default GEMINI_CONCURRENCY)
+
+        Returns:
+            (response_text, error) per request, in input order; error is the
+            exception generate() raised (text is then "")
+        """
+        def run(kwargs: Dict[str, Any]) -> Tuple[str, Optional[Exception]]:
+            try:
+                return self.generate(**kwargs), None
+            except Exception as e:
+                return "", e
+
+        workers = min(max_concurrency or self.max_concurrency, max(len(requests), 1))
+        if workers == 1:
+            return [run(kwargs) for kwargs in requests]
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="gemini") as pool:
+            return list(pool.map(run, requests))
+
     def check_availability(self) -> bool:
         """
         Test if Gemini API is available and working.
 
+        This makes a real (rate-limited) generation request. HybridModelClient
+        does not call it; its circuit breaker treats live calls as the probe.
+
         Returns:
             True if API is accessible, False otherwise
         """
@@ -296,6 +476,27 @@ class GeminiClient:
             return False
 
 
+def breaker_from_env(name: str) -> CircuitBreaker:
+    """
+    CircuitBreaker configured from environment variables.
+
+    HYBRID_BREAKER_FAILURES: Consecutive failures that open the circuit (default: 3)
+    HYBRID_BREAKER_COOLDOWN_S: Seconds before a trial call is allowed (default: 60)
+    HYBRID_BREAKER_WINDOW: Calls in the rolling success-rate/latency window (default: 20)
+    HYBRID_BREAKER_MIN_SUCCESS_RATE: Open below this rolling success rate (default: 0.5)
+    HYBRID_BREAKER_SLOW_MS: Successes slower than this count as unhealthy (default: off)
+    """
+    slow_ms = os.getenv("HYBRID_BREAKER_SLOW_MS")
+    return CircuitBreaker(
+        name,
+        failure_threshold=int(os.getenv("HYBRID_BREAKER_FAILURES", "3")),
+        cooldown_s=float(os.getenv("HYBRID_BREAKER_COOLDOWN_S", "60")),
+        window=int(os.getenv("HYBRID_BREAKER_WINDOW", "20")),
+        min_success_rate=float(os.getenv("HYBRID_BREAKER_MIN_SUCCESS_RATE", "0.5")),
+        slow_call_ms=float(slow_ms) if slow_ms else None
+    )
+
+
 class HybridModelClient:
     """
     Hybrid client that uses Gemini for critical tasks with Ollama fallback.
@@ -305,11 +506,26 @@ class HybridModelClient:
     - Ollama (local): For bulk processing, summarization, metadata extraction
 
     Provides automatic fallback if Gemini is unavailable or rate-limited.
+    Availability is not probed at startup: a circuit breaker tracks the
+    rolling success rate and latency of live Gemini calls, stops routing to
+    Gemini after repeated failures, and lets a single trial call through
+    once its cooldown expires (see circuit_breaker.py).
+
+    Routing is delegated to a model_router.Router. HYBRID_ROUTING_POLICY
+    selects the policy: "static" (default, the task-type rule above) or
+    "latency" (fastest healthy backend that meets the task's quality bar and
+    optional deadline, using rolling p50/p95, queue depth, error rate and
+    hallucination_matrix quality). Each decision and its reason is logged to
+    reasoning_graph_edge.
 
     Attributes:
         gemini_client: GeminiClient instance (or None if unavailable)
         ollama_client: OllamaClient instance for fallback
         use_gemini_for: List of task types to prefer Gemini
+        gemini_breaker: CircuitBreaker guarding Gemini calls
+        ollama_health: CircuitBreaker recording Ollama outcomes (Ollama is the
+            last resort so it is never refused)
+        router: Router holding the backends and routing policy
     """
 
     def __init__(
@@ -317,7 +533,10 @@ class HybridModelClient:
         ollama_client,
         gemini_model: str = "gemini-2.0-flash",
         use_gemini_for: Optional[list] = None,
-        research_logger: Optional['StructuredLogger'] = None
+        research_logger: Optional['StructuredLogger'] = None,
+        routing_policy: Optional[RoutingPolicy] = None,
+        extra_ollama_clients: Optional[list] = None,
+        quality_dir: Optional[str] = None
     ):
         """
         Initialize hybrid client with both Gemini and Ollama.
@@ -328,19 +547,23 @@ class HybridModelClient:
             use_gemini_for: List of task types to prefer Gemini for
                            (e.g., ['qa_review', 'fact_check', 'governance'])
             research_logger: Optional StructuredLogger for research telemetry
+            routing_policy: RoutingPolicy (default: from HYBRID_ROUTING_POLICY)
+            extra_ollama_clients: Additional OllamaClients routed as separate backends
+            quality_dir: Research telemetry dir used to seed local quality
+                (default: HYBRID_QUALITY_DIR or data/research)
         """
         self.ollama_client = ollama_client
         self.research_logger = research_logger
+        self.gemini_breaker = breaker_from_env("gemini")
+        self.ollama_health = breaker_from_env("ollama")
 
-        # Try to initialize Gemini (may fail if not available)
+        # Try to initialize Gemini (may fail if not configured); no network call here
         try:
             self.gemini_client = GeminiClient(model_name=gemini_model, research_logger=research_logger)
-            self.gemini_available = self.gemini_client.check_availability()
-            logger.info("Gemini client initialized and available")
+            logger.info("Gemini client initialized (availability checked lazily)")
         except Exception as e:
             logger.warning(f"Gemini initialization failed: {e}. Using Ollama only.")
             self.gemini_client = None
-            self.gemini_available = False
 
         # Default task types for Gemini (critical tasks)
         self.use_gemini_for = use_gemini_for or [
@@ -350,6 +573,74 @@ class HybridModelClient:
             'compliance_check'
         ]
 
+        self.router = self._build_router(routing_policy, extra_ollama_clients or [], quality_dir)
+
+    def _build_router(self, routing_policy: Optional[RoutingPolicy],
+                      extra_ollama_clients: list, quality_dir: Optional[str]) -> Router:
+        """Wrap the clients as Backends with priors from env and past telemetry."""
+        quality_dir = quality_dir or os.getenv(
+            "HYBRID_QUALITY_DIR", str(Path(__file__).parent.parent / "data" / "research")
+        )
+        local_quality = load_quality_from_telemetry(quality_dir)
+        if local_quality is None:
+            local_quality = float(os.getenv("HYBRID_OLLAMA_QUALITY", "0.7"))
+        else:
+            logger.info(f"Local model quality from hallucination_matrix: {local_quality:.2f}")
+        ollama_parallel = int(os.getenv("OLLAMA_NUM_PARALLEL", "1"))
+
+        backends = []
+        if self.gemini_client is not None:
+            backends.append(Backend(
+                "gemini", "gemini", self.gemini_client,
+                breaker=self.gemini_breaker,
+                capacity=getattr(self.gemini_client, "max_concurrency", 1),
+                prior_latency_ms=float(os.getenv("HYBRID_GEMINI_PRIOR_MS", "3000")),
+                default_quality=float(os.getenv("HYBRID_GEMINI_QUALITY", "0.9"))
+            ))
+        for n, client in enumerate([self.ollama_client] + extra_ollama_clients):
+            backends.append(Backend(
+                "ollama" if n == 0 else f"ollama-{n + 1}", "ollama", client,
+                breaker=self.ollama_health if n == 0 else breaker_from_env(f"ollama-{n + 1}"),
+                capacity=ollama_parallel,
+                prior_latency_ms=float(os.getenv("HYBRID_OLLAMA_PRIOR_MS", "8000")),
+                default_quality=local_quality
+            ))
+
+        critical_bar = float(os.getenv("HYBRID_CRITICAL_MIN_QUALITY", "0.85"))
+        return Router(
+            backends,
+            routing_policy or policy_from_env(self.use_gemini_for),
+            min_quality={task: critical_bar for task in self.use_gemini_for},
+            default_min_quality=float(os.getenv("HYBRID_MIN_QUALITY", "0.0"))
+        )
+
+    @property
+    def gemini_available(self) -> bool:
+        """Gemini is configured and its circuit is not open."""
+        return self.gemini_client is not None and self.gemini_breaker.state != OPEN
+
+    def _log_route(self, agent_id: str, session_id: Optional[str], task_type: Optional[str],
+                   backend: Backend, msg_type: str, reason: str,
+                   deadline_ms: Optional[float]) -> None:
+        """Log a routing decision (plan) or fallback as a reasoning_graph_edge."""
+        if not (self.research_logger and RKL_LOGGING_AVAILABLE):
+            return
+        edge = {
+            "session_id": session_id or "unknown",
+            "edge_id": str(uuid.uuid4()),
+            "timestamp": datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "t": int(time.time() * 1000),
+            "from_agent": agent_id,
+            "to_agent": backend.name,
+            "msg_type": msg_type,
+            "intent_tag": task_type or "unknown",
+            "content_hash": sha256_text(task_type or "routing"),
+            "route_reason": reason
+        }
+        if deadline_ms is not None:
+            edge["deadline_ms"] = int(deadline_ms)
+        self.research_logger.log("reasoning_graph_edge", edge)
+
     def generate(
         self,
         prompt: str,
@@ -359,6 +650,7 @@ class HybridModelClient:
         agent_id: str = "hybrid_qa",
         session_id: Optional[str] = None,
         turn_id: Optional[int] = None,
+        deadline_ms: Optional[float] = None,
         **kwargs
     ) -> Dict[str, Any]:
         """
@@ -372,77 +664,88 @@ class HybridModelClient:
             agent_id: Agent identifier for telemetry
             session_id: Session identifier for telemetry
             turn_id: Turn number for telemetry
+            deadline_ms: Latency budget; the latency policy picks the fastest
+                backend expected to meet it
             **kwargs: Additional generation parameters
 
         Returns:
             Dict with keys:
                 - response: Generated text
-                - model_used: 'gemini' or 'ollama'
-                - success: bool
+                - model_used: 'gemini (model)' or 'ollama (model)'
+                - backend: Name of the backend that answered
+                - route_reason: Why that backend was chosen
+                - success: bool (False if every backend failed or the last returned nothing)
+                - error: Why it failed (only when success is False)
         """
-        # Determine which model to use
-        should_use_gemini = (
-            self.gemini_available and (
-                prefer_gemini or
-                task_type in self.use_gemini_for
-            )
-        )
-
-        # Log reasoning graph edge: route decision
-        if self.research_logger and RKL_LOGGING_AVAILABLE:
-            self.research_logger.log("reasoning_graph_edge", {
-                "session_id": session_id or "unknown",
-                "edge_id": str(uuid.uuid4()),
-                "timestamp": datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
-                "t": int(time.time() * 1000),
-                "from_agent": agent_id,
-                "to_agent": "gemini" if should_use_gemini else "ollama",
-                "msg_type": "plan",
-                "intent_tag": task_type or "unknown",
-                "content_hash": sha256_text(task_type or "routing") if RKL_LOGGING_AVAILABLE else ""
-            })
-
-        if should_use_gemini:
+        ordered, reason = self.router.route(task_type, prefer_gemini, deadline_ms)
+        last_error = None
+        msg_type = "plan"
+
+        for position, backend in enumerate(ordered):
+            is_last = position == len(ordered) - 1
+            # An open (or busy half-open) circuit skips the backend without calling it;
+            # Ollama is the local last resort and is always tried (its breaker is not
+            # consulted, so no trial slot is reserved and no rejection counted)
+            if backend.kind != "ollama" and not backend.breaker.allow_request():
+                continue
+
+            # Log reasoning graph edge: route decision (or fallback)
+            self._log_route(agent_id, session_id, task_type, backend, msg_type, reason, deadline_ms)
+
+            backend.acquire()
+            start_time = time.time()
             try:
-                response = self.gemini_client.generate(
-                    prompt=prompt,
-                    system_prompt=system_prompt,
-                    agent_id=agent_id,
-                    session_id=session_id,
-                    turn_id=turn_id,
-                    task_type=task_type,
-                    **kwargs
+                response = backend.generate(
+                    prompt, system_prompt, agent_id, session_id, turn_id, task_type, **kwargs
                 )
+            except Exception as e:
+                backend.breaker.record_failure()
+                last_error = e
+                logger.warning(f"{backend.model_label} failed, trying next backend: {e}")
+                msg_type, reason = "fallback", f"fallback:{backend.name}_error"
+                continue
+            finally:
+                backend.release()
+
+            if response:
+                backend.breaker.record_success((time.time() - start_time) * 1000)
+            else:
+                backend.breaker.record_failure()
+                if not is_last:
+                    msg_type, reason = "fallback", f"fallback:{backend.name}_empty"
+                    continue
+                logger.error(f"{backend.model_label} returned an empty response")
                 return {
-                    'response': response,
-                    'model_used': f'gemini ({self.gemini_client.model_name})',
-                    'success': True
+                    'response': '',
+                    'model_used': f'{backend.kind} ({backend.model})',
+                    'backend': backend.name,
+                    'route_reason': reason,
+                    'success': False,
+                    'error': f"empty response from {backend.name}"
                 }
-            except Exception as e:
-                logger.warning(f"Gemini failed, falling back to Ollama: {e}")
-                # Fall through to Ollama
-
-        # Use Ollama (fallback or default)
-        try:
-            response = self.ollama_client.generate(
-                prompt, system_prompt,
-                agent_id=agent_id,
-                session_id=session_id,
-                turn_id=turn_id
-            )
             return {
                 'response': response,
-                'model_used': f'ollama ({self.ollama_client.model})',
+                'model_used': f'{backend.kind} ({backend.model})',
+                'backend': backend.name,
+                'route_reason': reason,
                 'success': True
             }
-        except Exception as e:
-            logger.error(f"Both Gemini and Ollama failed: {e}")
-            return {
-                'response': '',
-                'model_used': 'none',
-                'success': False,
-                'error': str(e)
-            }
+
+        logger.error(f"All model backends failed: {last_error}")
+        return {
+            'response': '',
+            'model_used': 'none',
+            'backend': None,
+            'route_reason': reason,
+            'success': False,
+            'error': str(last_error) if last_error else "no backend available"
+        }
+
+    def record_quality(self, backend_name: str, task_type: Optional[str], score: float) -> None:
+        """Feed a quality judgement (0-1) for a backend's output back into routing."""
+        backend = self.router.get(backend_name)
+        if backend is not None:
+            backend.record_quality(task_type, score)
 
     def get_status(self) -> Dict[str, Any]:
         """
@@ -456,7 +759,11 @@ class HybridModelClient:
             'gemini_model': self.gemini_client.model_name if self.gemini_client else None,
             'ollama_available': bool(self.ollama_client),
             'ollama_model': self.ollama_client.model if self.ollama_client else None,
-            'preferred_for_critical': self.use_gemini_for
+            'preferred_for_critical': self.use_gemini_for,
+            'gemini_circuit': self.gemini_breaker.get_stats(),
+            'ollama_health': self.ollama_health.get_stats(),
+            'routing_policy': self.router.policy.name,
+            'backends': {b.name: b.snapshot() for b in self.router.backends}
         }
 
 
@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+"""
+Routing engine for HybridModelClient.
+
+A Router picks one of several Backends (Gemini, one or more Ollama
+endpoints) for each request using a pluggable RoutingPolicy:
+
+- StaticPolicy:       the original rule - Gemini for task types in
+                      use_gemini_for (or prefer_gemini), Ollama otherwise
+- LatencyAwarePolicy: drop backends whose circuit is open or whose quality
+                      for the task is below the bar, estimate each one's
+                      latency from rolling p50/p95 and its queue depth, and
+                      pick the fastest that meets the deadline (if any)
+
+Backend stats come from live calls (CircuitBreaker rolling success rate and
+latency, in-flight count). Per-task quality starts from priors and is
+seeded from past hallucination_matrix verdicts on local summaries
+(load_quality_from_telemetry), then updated with record_quality().
+
+Every decision returns an ordered fallback list plus a short reason string
+that HybridModelClient logs to reasoning_graph_edge.
+"""
+
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from circuit_breaker import CircuitBreaker, OPEN
+
+try:
+    import pandas as pd
+    PANDAS_AVAILABLE = True
+except ImportError:
+    PANDAS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# hallucination_matrix verdict -> quality score
+VERDICT_SCORES = {"pass": 1.0, "uncertain": 0.5, "fail": 0.0}
+
+
+class Backend:
+    """
+    One routable model backend with live health, load and quality stats.
+
+    Attributes:
+        name: Unique name used in routing decisions and telemetry
+        kind: "gemini" or "ollama" (selects the client call convention)
+        client: GeminiClient or OllamaClient
+        breaker: CircuitBreaker fed by every call through this backend
+        capacity: Requests the backend serves in parallel (for queue estimates)
+        prior_latency_ms: Latency assumed before any call has been measured
+    """
+
+    def __init__(
+        self,
+        name: str,
+        kind: str,
+        client,
+        breaker: Optional[CircuitBreaker] = None,
+        capacity: int = 1,
+        prior_latency_ms: float = 5000.0,
+        quality: Optional[Dict[str, float]] = None,
+        default_quality: float = 0.7
+    ):
+        """
+        Initialize Backend.
+
+        Args:
+            name: Backend name (e.g., 'gemini', 'ollama')
+            kind: 'gemini' or 'ollama'
+            client: Configured client instance
+            breaker: CircuitBreaker (default: a fresh one named after the backend)
+            capacity: Parallel request slots
+            prior_latency_ms: Latency estimate before measurements exist
+            quality: Per-task quality scores (0-1)
+            default_quality: Quality for task types without a score
+        """
+        if kind not in ("gemini", "ollama"):
+            raise ValueError(f"Unknown backend kind: {kind}")
+        self.name = name
+        self.kind = kind
+        self.client = client
+        self.breaker = breaker or CircuitBreaker(name)
+        self.capacity = max(1, capacity)
+        self.prior_latency_ms = prior_latency_ms
+        self.quality = dict(quality or {})
+        self.default_quality = default_quality
+        self.inflight = 0
+        self._lock = threading.Lock()
+
+    @property
+    def model(self) -> str:
+        """Model served by the client (GeminiClient.model_name / OllamaClient.model)."""
+        return getattr(self.client, "model_name", None) or getattr(self.client, "model", "")
+
+    @property
+    def model_label(self) -> str:
+        """Display label, e.g. 'gemini (gemini-2.0-flash)'."""
+        return f"{self.name} ({self.model})"
+
+    def healthy(self) -> bool:
+        """Circuit not open (does not reserve a half-open trial slot)."""
+        return self.breaker.state != OPEN
+
+    def quality_for(self, task_type: Optional[str]) -> float:
+        return self.quality.get(task_type or "", self.quality.get("*", self.default_quality))
+
+    def record_quality(self, task_type: Optional[str], score: float, weight: float = 0.2) -> None:
+        """Fold a new quality observation into the task's score (EWMA)."""
+        with self._lock:
+            key = task_type or "*"
+            current = self.quality.get(key, self.quality.get("*", self.default_quality))
+            self.quality[key] = (1 - weight) * current + weight * score
+
+    def expected_latency_ms(self, q: float = 0.95) -> float:
+        """
+        Latency a new request should expect: the rolling percentile scaled by
+        how many full rounds of queued work are ahead of it.
+        """
+        measured = self.breaker.latency_ms(q)
+        base = measured if measured is not None else self.prior_latency_ms
+        queued_rounds = self.inflight // self.capacity
+        return base * (1 + queued_rounds)
+
+    def error_rate(self) -> float:
+        rate = self.breaker.success_rate
+        return 0.0 if rate is None else 1.0 - rate
+
+    def generate(self, prompt: str, system_prompt: Optional[str], agent_id: str,
+                 session_id: Optional[str], turn_id: Optional[int],
+                 task_type: Optional[str], **kwargs) -> str:
+        """Call the client using its own signature."""
+        if self.kind == "gemini":
+            return self.client.generate(
+                prompt=prompt,
+                system_prompt=system_prompt,
+                agent_id=agent_id,
+                session_id=session_id,
+                turn_id=turn_id,
+                task_type=task_type,
+                **kwargs
+            )
+        return self.client.generate(
+            prompt, system_prompt,
+            agent_id=agent_id,
+            session_id=session_id,
+            turn_id=turn_id
+        )
+
+    def acquire(self) -> None:
+        with self._lock:
+            self.inflight += 1
+
+    def release(self) -> None:
+        with self._lock:
+            self.inflight = max(0, self.inflight - 1)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Stats used by policies and get_status()."""
+        stats = self.breaker.get_stats()
+        stats.update({
+            "kind": self.kind,
+            "inflight": self.inflight,
+            "capacity": self.capacity,
+            "expected_p95_ms": round(self.expected_latency_ms(0.95)),
+            "quality": dict(self.quality)
+        })
+        return stats
+
+
+class RoutingPolicy:
+    """Base class: order candidate backends for a request."""
+
+    name = "base"
+
+    def rank(self, backends: List[Backend], task_type: Optional[str], prefer_gemini: bool,
+             deadline_ms: Optional[float], min_quality: float) -> Tuple[List[Backend], str]:
+        """
+        Args:
+            backends: All configured backends
+            task_type: Request task type
+            prefer_gemini: Caller asked for Gemini
+            deadline_ms: Latency budget for the request (None = no deadline)
+            min_quality: Quality bar for this task type
+
+        Returns:
+            (backends in the order to try them, reason for the first choice)
+        """
+        raise NotImplementedError
+
+
+class StaticPolicy(RoutingPolicy):
+    """Original behavior: Gemini for critical task types, Ollama otherwise."""
+
+    name = "static"
+
+    def __init__(self, use_gemini_for: List[str]):
+        self.use_gemini_for = use_gemini_for
+
+    def rank(self, backends, task_type, prefer_gemini, deadline_ms, min_quality):
+        gemini = [b for b in backends if b.kind == "gemini" and b.healthy()]
+        ollama = [b for b in backends if b.kind == "ollama"]
+        if gemini and prefer_gemini:
+            return gemini + ollama, "static:prefer_gemini"
+        if gemini and task_type in self.use_gemini_for:
+            return gemini + ollama, f"static:task_type={task_type}"
+        if not gemini and any(b.kind == "gemini" for b in backends):
+            return ollama, "static:gemini_circuit_open"
+        return ollama, "static:default_local"
+
+
+class LatencyAwarePolicy(RoutingPolicy):
+    """
+    Fastest healthy backend that meets the quality bar (and deadline, if given).
+
+    Expected latency is the backend's rolling p95 (or p50 without a deadline)
+    scaled by its queue depth, plus an error-rate penalty so a flaky backend
+    has to be clearly faster to win. Backends that fail the quality bar are
+    only used as a fallback when nothing else is available.
+    """
+
+    name = "latency"
+
+    def __init__(self, error_penalty_ms: float = 10000.0):
+        self.error_penalty_ms = error_penalty_ms
+
+    def rank(self, backends, task_type, prefer_gemini, deadline_ms, min_quality):
+        healthy = [b for b in backends if b.healthy()]
+        # Ollama is the local last resort, even with an open circuit
+        pool = healthy or [b for b in backends if b.kind == "ollama"]
+        if not pool:
+            return [], "latency:no_backend"
+
+        q = 0.95 if deadline_ms else 0.5
+
+        def cost(b: Backend) -> float:
+            return b.expected_latency_ms(q) + b.error_rate() * self.error_penalty_ms
+
+        good = sorted((b for b in pool if b.quality_for(task_type) >= min_quality), key=cost)
+        weak = sorted((b for b in pool if b.quality_for(task_type) < min_quality),
+                      key=lambda b: -b.quality_for(task_type))
+
+        if prefer_gemini:
+            gemini = [b for b in good + weak if b.kind == "gemini"]
+            if gemini:
+                rest = [b for b in good + weak if b.kind != "gemini"]
+                return gemini + rest, "latency:prefer_gemini"
+
+        if not good:
+            return weak, f"latency:no_backend_meets_quality>={min_quality:g}"
+
+        if deadline_ms:
+            in_time = [b for b in good if b.expected_latency_ms(0.95) <= deadline_ms]
+            if in_time:
+                chosen = in_time[0]
+                ordered = [chosen] + [b for b in good if b is not chosen] + weak
+                return ordered, (
+                    f"latency:fastest_within_deadline p95~{chosen.expected_latency_ms(0.95):.0f}ms"
+                    f"<= {deadline_ms:.0f}ms"
+                )
+            return good + weak, f"latency:none_within_deadline {deadline_ms:.0f}ms, fastest"
+
+        chosen = good[0]
+        return good + weak, (
+            f"latency:fastest p50~{chosen.expected_latency_ms(0.5):.0f}ms"
+            f" err={chosen.error_rate():.0%} q={chosen.quality_for(task_type):.2f}"
+        )
+
+
+POLICIES = {
+    "static": StaticPolicy,
+    "latency": LatencyAwarePolicy
+}
+
+
+class Router:
+    """
+    Holds backends and a policy; HybridModelClient asks it for a route.
+
+    Example:
+        router = Router([gemini_backend, ollama_backend], LatencyAwarePolicy())
+        ordered, reason = router.route("qa_review", deadline_ms=8000)
+    """
+
+    def __init__(self, backends: List[Backend], policy: RoutingPolicy,
+                 min_quality: Optional[Dict[str, float]] = None, default_min_quality: float = 0.0):
+        """
+        Initialize Router.
+
+        Args:
+            backends: Routable backends
+            policy: RoutingPolicy that orders them per request
+            min_quality: Quality bar per task type
+            default_min_quality: Bar for task types not in min_quality
+        """
+        self.backends = backends
+        self.policy = policy
+        self.min_quality = dict(min_quality or {})
+        self.default_min_quality = default_min_quality
+
+    def get(self, name: str) -> Optional[Backend]:
+        return next((b for b in self.backends if b.name == name), None)
+
+    def route(self, task_type: Optional[str], prefer_gemini: bool = False,
+              deadline_ms: Optional[float] = None) -> Tuple[List[Backend], str]:
+        """Ordered backends to try and the reason for the first choice."""
+        bar = self.min_quality.get(task_type or "", self.default_min_quality)
+        return self.policy.rank(self.backends, task_type, prefer_gemini, deadline_ms, bar)
+
+
+def load_quality_from_telemetry(research_dir: str, max_rows: int = 5000) -> Optional[float]:
+    """
+    Local summary quality from recent hallucination_matrix verdicts.
+
+    Gemini QA judges the summaries produced by the local models, so the
+    average verdict score is a quality estimate for the Ollama backends.
+
+    Args:
+        research_dir: StructuredLogger base_dir (e.g., data/research)
+        max_rows: Use at most this many of the newest rows
+
+    Returns:
+        Mean verdict score in 0..1, or None if no telemetry is available
+    """
+    if not PANDAS_AVAILABLE:
+        return None
+    files = sorted(
+        (Path(research_dir) / "hallucination_matrix").glob("*/*/*/*.parquet"),
+        reverse=True
+    )
+    scores: List[float] = []
+    for path in files:
+        try:
+            verdicts = pd.read_parquet(path, columns=["verdict"])["verdict"]
+        except Exception as e:
+            logger.debug(f"Skipping unreadable telemetry file {path}: {e}")
+            continue
+        scores.extend(VERDICT_SCORES[v] for v in verdicts.astype(str).str.lower() if v in VERDICT_SCORES)
+        if len(scores) >= max_rows:
+            break
+    if not scores:
+        return None
+    return sum(scores[:max_rows]) / len(scores[:max_rows])
+
+
+def policy_from_env(use_gemini_for: List[str]) -> RoutingPolicy:
+    """HYBRID_ROUTING_POLICY: static (default) or latency."""
+    name = os.getenv("HYBRID_ROUTING_POLICY", "static").lower()
+    if name not in POLICIES:
+        raise ValueError(f"Unknown HYBRID_ROUTING_POLICY '{name}' (choose from {sorted(POLICIES)})")
+    if name == "static":
+        return StaticPolicy(use_gemini_for)
+    return LatencyAwarePolicy()
@@ -628,7 +628,9 @@ def main():
         research_logger = StructuredLogger(
             base_dir=str(research_data_dir),
             rkl_version="1.0",
-            batch_size=50
+            batch_size=50,
+            # Opt-in: rolling files keep rows in an unreadable .tmp until close()
+            rolling_files=os.getenv("RKL_LOG_ROLLING_FILES", "false").lower() in ("1", "true", "yes")
         )
         logger.info(f"Research telemetry enabled: {research_data_dir}")
     else:
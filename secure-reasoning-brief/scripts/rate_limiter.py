@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Token-bucket rate limiting for external model APIs (Gemini).
+
+A RateLimiter holds two buckets:
+
+- requests: refills at rpm / 60 per second
+- tokens:   refills at tpm / 60 per second (estimated prompt + output tokens)
+
+acquire() reserves from both buckets under a lock and then sleeps outside it,
+so concurrent callers are admitted in arrival order at exactly the configured
+rate instead of polling. Buckets may go into debt (a large request waits
+longer rather than never fitting), and reconcile() corrects a token estimate
+once the API reports real usage.
+
+Adaptive slowdown: throttled() (call it on HTTP 429 / ResourceExhausted)
+halves the effective rate and pauses all callers for the Retry-After delay;
+each success() recovers 5% of the rate until the configured limit is reached.
+
+Limiters are shared per (api, model) via shared_limiter(), so every
+GeminiClient in a process draws from the same quota.
+"""
+
+import threading
+import time
+from typing import Any, Dict, Hashable, Optional
+
+
+class TokenBucket:
+    """Continuous-refill token bucket that allows debt."""
+
+    def __init__(self, rate_per_sec: float, capacity: float):
+        self.rate = rate_per_sec
+        self.capacity = max(capacity, 1.0)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float, rate_factor: float) -> None:
+        elapsed = max(0.0, now - self.updated)
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate * rate_factor)
+        self.updated = now
+
+    def reserve(self, amount: float, now: float, rate_factor: float = 1.0) -> float:
+        """Take amount now; return seconds to wait until the debt is repaid."""
+        self._refill(now, rate_factor)
+        self.tokens -= amount
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens / (self.rate * rate_factor)
+
+    def adjust(self, amount: float) -> None:
+        """Give back (positive) or charge (negative) tokens after the fact."""
+        self.tokens = min(self.capacity, self.tokens + amount)
+
+
+class RateLimiter:
+    """
+    Requests-per-minute and tokens-per-minute limiter with adaptive slowdown.
+
+    Example:
+        limiter = RateLimiter(rpm=15, tpm=1_000_000)
+        limiter.acquire(tokens=estimated_tokens)
+        try:
+            response = call_api()
+            limiter.success()
+            limiter.reconcile(estimated_tokens, actual_tokens)
+        except RateLimitError as e:
+            limiter.throttled(retry_after=e.retry_after)
+    """
+
+    def __init__(
+        self,
+        rpm: Optional[float] = None,
+        tpm: Optional[float] = None,
+        burst: float = 1.0,
+        min_rate_factor: float = 1.0 / 16
+    ):
+        """
+        Initialize RateLimiter.
+
+        Args:
+            rpm: Requests per minute (None or 0 = unlimited)
+            tpm: Tokens per minute (None or 0 = unlimited)
+            burst: Requests allowed back-to-back before spacing kicks in.
+                1 spaces requests evenly, so no 60s window ever exceeds rpm.
+            min_rate_factor: Floor for adaptive slowdown (fraction of rpm/tpm)
+        """
+        self.rpm = rpm or None
+        self.tpm = tpm or None
+        self.min_rate_factor = min_rate_factor
+        self._requests = TokenBucket(self.rpm / 60.0, burst) if self.rpm else None
+        # Token bucket holds ~10s of quota; oversized requests go into debt
+        self._tokens = TokenBucket(self.tpm / 60.0, self.tpm / 6.0) if self.tpm else None
+        self._rate_factor = 1.0
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+        self._stats = {"acquired": 0, "waited_s": 0.0, "throttled": 0}
+
+    @property
+    def unlimited(self) -> bool:
+        return self._requests is None and self._tokens is None
+
+    def acquire(self, tokens: int = 0) -> float:
+        """
+        Block until a request of ~tokens may be sent.
+
+        Returns:
+            Seconds spent waiting
+        """
+        with self._lock:
+            now = time.monotonic()
+            wait = max(0.0, self._paused_until - now)
+            if self._requests:
+                wait = max(wait, self._requests.reserve(1, now, self._rate_factor))
+            if self._tokens and tokens:
+                wait = max(wait, self._tokens.reserve(tokens, now, self._rate_factor))
+            self._stats["acquired"] += 1
+            self._stats["waited_s"] += wait
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def reconcile(self, estimated_tokens: int, actual_tokens: Optional[int]) -> None:
+        """Correct the token bucket once real usage is known."""
+        if not self._tokens or actual_tokens is None:
+            return
+        with self._lock:
+            self._tokens.adjust(estimated_tokens - actual_tokens)
+
+    def _set_rate_factor(self, rate_factor: float) -> None:
+        """Change the adaptive rate (lock held); refill at the old rate first."""
+        now = time.monotonic()
+        for bucket in (self._requests, self._tokens):
+            if bucket:
+                bucket._refill(now, self._rate_factor)
+        self._rate_factor = rate_factor
+
+    def throttled(self, retry_after: Optional[float] = None) -> None:
+        """Server said slow down: halve the rate and pause all callers."""
+        with self._lock:
+            self._set_rate_factor(max(self.min_rate_factor, self._rate_factor * 0.5))
+            if retry_after is None:
+                rps = (self.rpm / 60.0 * self._rate_factor) if self.rpm else 0.5
+                retry_after = max(1.0, 1.0 / rps)
+            self._paused_until = max(self._paused_until, time.monotonic() + retry_after)
+            self._stats["throttled"] += 1
+
+    def success(self) -> None:
+        """Recover gradually after a throttle."""
+        if self._rate_factor < 1.0:
+            with self._lock:
+                self._set_rate_factor(min(1.0, self._rate_factor * 1.05))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Counters plus the current adaptive rate factor."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["rate_factor"] = round(self._rate_factor, 4)
+            stats["rpm"] = self.rpm
+            stats["tpm"] = self.tpm
+        return stats
+
+
+_SHARED: Dict[Hashable, RateLimiter] = {}
+_SHARED_LOCK = threading.Lock()
+
+
+def shared_limiter(key: Hashable, **kwargs) -> RateLimiter:
+    """Process-wide limiter for key (created with kwargs on first use)."""
+    with _SHARED_LOCK:
+        limiter = _SHARED.get(key)
+        if limiter is None:
+            limiter = _SHARED[key] = RateLimiter(**kwargs)
+        return limiter
@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the brief pipeline scripts (no Ollama, Gemini or network needed).
+
+Tests:
+- Gemini QA batch parsing and per-article retry
+- Ollama endpoint pool affinity (one article's calls stay on one server)
+- Ollama streaming retries (responses closed, retry count kept)
+- Summary store hits are tagged as cache rows in execution_context
+- Telemetry compaction: journal roll-forward/back after a crash, idempotent reruns
+
+Usage:
+    python -m pytest -q scripts/test_pipeline.py
+    python scripts/test_pipeline.py
+"""
+
+import hashlib
+import io
+import json
+import os
+import sys
+import tempfile
+from contextlib import redirect_stdout
+from pathlib import Path
+
+# Scripts import each other by module name
+script_dir = str(Path(__file__).parent)
+if script_dir not in sys.path:
+    sys.path.insert(0, script_dir)
+
+import compact_telemetry
+import fetch_and_summarize as pipeline
+from disk_cache import DiskCache
+from rkl_logging import StructuredLogger
+
+
+def _qa_id(article):
+    return hashlib.sha256(article["link"].encode("utf-8")).hexdigest()[:12]
+
+
+def test_qa_batch_retries_incomplete_items():
+    """Batch items missing a verdict or with non-numeric scores are retried per article."""
+    summaries = [
+        {"title": f"Article {n}", "link": f"https://example.org/{n}", "source": "s",
+         "technical_summary": "t", "lay_explanation": "l"}
+        for n in range(3)
+    ]
+    good = {"quality_verdict": "pass", "quality_confidence": 0.9, "relevance_score": 0.8,
+            "recommendation": "include"}
+    calls = []
+
+    class FakeGeminiClient:
+        def __init__(self, model_name=None, research_logger=None, **kwargs):
+            pass
+
+        def generate_many(self, requests, max_concurrency=None):
+            calls.append(requests)
+            if len(calls) == 1:
+                # One batch of three: a complete item, one without a verdict,
+                # one with a non-numeric confidence
+                items = [
+                    dict(good, artifact_id=_qa_id(summaries[0])),
+                    {"artifact_id": _qa_id(summaries[1]), "quality_confidence": 0.7},
+                    dict(good, artifact_id=_qa_id(summaries[2]), quality_confidence="high")
+                ]
+                return [(json.dumps(items), None)]
+            return [(json.dumps(good), None) for _ in requests]
+
+    saved_client = pipeline.GeminiClient
+    saved_available = pipeline.GEMINI_CLIENT_AVAILABLE
+    saved_env = {k: os.environ.get(k) for k in ("ENABLE_GEMINI_QA", "GEMINI_QA_BATCH_SIZE")}
+    pipeline.GeminiClient = FakeGeminiClient
+    pipeline.GEMINI_CLIENT_AVAILABLE = True
+    os.environ.update({"ENABLE_GEMINI_QA": "true", "GEMINI_QA_BATCH_SIZE": "3"})
+    try:
+        pipeline.run_gemini_qa(summaries, "test-session")
+    finally:
+        pipeline.GeminiClient = saved_client
+        pipeline.GEMINI_CLIENT_AVAILABLE = saved_available
+        for key, value in saved_env.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+    assert len(calls) == 2, f"Expected a batch call then one retry call, got {len(calls)}"
+    retried = [request["turn_id"] for request in calls[1]]
+    assert retried == [2, 3], f"Only the incomplete articles should be retried, got turns {retried}"
+    for article in summaries:
+        assert article["gemini_analysis"]["quality_verdict"] == "pass"
+        assert article["gemini_analysis"]["quality_confidence"] == 0.9
+
+    print(f"✓ QA batch: 1 item accepted, {len(retried)} retried individually")
+
+
+def test_pool_affinity():
+    """Calls sharing an affinity key stay on one endpoint; a context is never sent elsewhere."""
+    # Nothing listens on these ports: the startup probe marks both down
+    pool = pipeline.OllamaEndpointPool(
+        ["http://127.0.0.1:1/api/generate", "http://127.0.0.1:2/api/generate"], "m"
+    )
+    for endpoint in pool.endpoints:
+        endpoint.healthy = True
+    pool.stream = False
+    hosts = []
+
+    class FakeResponse:
+        status_code = 200
+
+        def raise_for_status(self):
+            pass
+
+        def json(self):
+            return {"response": "ok", "context": [1, 2, 3]}
+
+        def close(self):
+            pass
+
+    def post(url, json=None, **kwargs):
+        hosts.append(url.split("/")[2])
+        return FakeResponse()
+
+    pool.session.post = post
+    first, second = pool.endpoints
+
+    pool.generate_with_stats("step 1", affinity="article-a")
+    first.outstanding = 5  # least-loaded balancing alone would now pick the other host
+    pool.generate_with_stats("step 2", affinity="article-a", context=[1, 2, 3])
+    pool.generate_with_stats("other article", affinity="article-b")
+    assert hosts == [first.host, first.host, second.host], hosts
+
+    # The pinned host goes down: a context call fails instead of being replayed elsewhere
+    first.healthy = False
+    first.checked_at = float("inf")
+    text, stats = pool.generate_with_stats("step 3", affinity="article-a", context=[1, 2, 3])
+    assert text == "" and "tied to" in stats["error"], stats
+    assert len(hosts) == 3, "Context call was sent to another endpoint"
+
+    # Without a context the article moves to the healthy host
+    pool.generate_with_stats("step 3", affinity="article-a")
+    assert hosts[-1] == second.host, hosts
+
+    print(f"✓ Pool affinity: {len(hosts)} calls routed as pinned")
+
+
+def test_stream_retries():
+    """Retried 5xx stream responses are closed; a later mid-stream error keeps the retry count."""
+    import requests
+
+    client = pipeline.OllamaClient("http://127.0.0.1:1/api/generate", "m")
+    client.stream = True
+    client.retry_backoff = client.retry_backoff_max = 0
+    closed = []
+
+    class FakeResponse:
+        def __init__(self, status_code, lines=()):
+            self.status_code = status_code
+            self.lines = lines
+
+        def raise_for_status(self):
+            if self.status_code >= 400:
+                raise requests.exceptions.HTTPError(f"{self.status_code}", response=self)
+
+        def iter_lines(self):
+            return iter(self.lines)
+
+        def close(self):
+            closed.append(self.status_code)
+
+    responses = [FakeResponse(503), FakeResponse(502),
+                 FakeResponse(200, [b'{"response": "partial"}', b'{"respo'])]
+    client.session.post = lambda *args, **kwargs: responses.pop(0)
+
+    text, stats = client.generate_with_stats("prompt")
+    assert text == "" and "Malformed stream chunk" in stats["error"], stats
+    assert stats["retry_count"] == 2, stats
+    assert closed == [503, 502, 200], f"Responses not closed: {closed}"
+
+    print(f"✓ Stream retries: {stats['retry_count']} retries, {len(closed)} responses closed")
+
+
+def test_summary_store_hit_telemetry():
+    """A summary store hit logs cache_hit=True rows tagged token_estimation="cache"."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        research_logger = StructuredLogger(base_dir=str(Path(tmpdir) / "research"), batch_size=100)
+        client = pipeline.OllamaClient("http://127.0.0.1:1/api/generate", "m",
+                                       research_logger=research_logger)
+        summarizer = pipeline.ArticleSummarizer(client, summary_store=DiskCache(str(Path(tmpdir) / "store")))
+
+        title, content, link = "Title", "Article body", "https://example.org/a"
+        artifact_id = pipeline.sha256_text(link)
+        summarizer._store_summary(summarizer.summary_key(artifact_id, title, content),
+                                  "Technical summary.", "Lay explanation.", ["AI safety"])
+
+        result = summarizer.summarize_article(title, content, link, session_id="s", turn_id=1)
+        assert result["_cache_hit"] and result["technical_summary"] == "Technical summary."
+
+        rows = research_logger._buffers["execution_context"]
+        assert len(rows) == 3, f"Expected one row per agent, got {len(rows)}"
+        for row in rows:
+            assert row["cache_hit"] is True and row["token_estimation"] == "cache", row
+        research_logger.close()
+
+    print("✓ Summary store hit: 3 cache rows logged")
+
+
+def _write_batches(day_dir, artifact, batches):
+    """Write one small Parquet batch file per list of rows into a partition."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    day_dir.mkdir(parents=True, exist_ok=True)
+    names = []
+    for n, rows in enumerate(batches):
+        name = f"{artifact}_0915{n:02d}.parquet"
+        pq.write_table(pa.Table.from_pylist(rows), day_dir / name)
+        names.append(name)
+    return names
+
+
+def _compact_quietly(base_dir, **kwargs):
+    output = io.StringIO()
+    with redirect_stdout(output):
+        results = compact_telemetry.compact(base_dir, **kwargs)
+    return results, output.getvalue()
+
+
+def test_compaction_journal_recovery():
+    """A journal left by a crash is rolled forward when outputs exist, back when they don't."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    artifact = "reasoning_traces"
+    rows = [[{"session_id": "s2", "t": 1}, {"session_id": "s1", "t": 2}],
+            [{"session_id": "s1", "t": 1}]]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        base_dir = Path(tmpdir) / "research"
+
+        # Crash after the journal and the first rename, before inputs were deleted
+        forward_dir = base_dir / artifact / "2025" / "11" / "11"
+        inputs = _write_batches(forward_dir, artifact, rows)
+        outputs = [f"{artifact}{compact_telemetry.COMPACTED_MARKER}20251111000000_{n:03d}.parquet"
+                   for n in range(2)]
+        combined = pa.Table.from_pylist(rows[0] + rows[1])
+        pq.write_table(combined.slice(0, 2), forward_dir / outputs[0])
+        pq.write_table(combined.slice(2), forward_dir / f"{compact_telemetry.TEMP_PREFIX}{outputs[1]}.tmp")
+        compact_telemetry.write_journal(forward_dir, {"inputs": inputs, "outputs": outputs, "rows": 3})
+
+        # Crash with the journal written but an output lost
+        back_dir = base_dir / artifact / "2025" / "11" / "12"
+        back_inputs = _write_batches(back_dir, artifact, rows)
+        compact_telemetry.write_journal(back_dir, {"inputs": back_inputs, "outputs": outputs, "rows": 3})
+
+        results, output = _compact_quietly(base_dir)
+        assert "rolled forward" in output and "rolled back" in output, output
+
+        # Rolled forward: the swap completed and the outputs count as compacted
+        assert sorted(p.name for p in forward_dir.iterdir()) == outputs
+        assert sum(pq.read_metadata(forward_dir / name).num_rows for name in outputs) == 3
+
+        # Rolled back: the inputs survived and were compacted afresh in this run
+        assert [r["date"] for r in results] == ["2025-11-12"], results
+        remaining = sorted(p.name for p in back_dir.iterdir())
+        assert len(remaining) == 1 and compact_telemetry.COMPACTED_MARKER in remaining[0], remaining
+        table = pq.read_table(back_dir / remaining[0])
+        assert table.to_pylist() == sorted(rows[0] + rows[1], key=lambda r: (r["session_id"], r["t"]))
+
+    print("✓ Compaction recovery: journal rolled forward and back")
+
+
+def test_compaction_rerun_is_noop():
+    """A second run over compacted partitions changes nothing."""
+    artifact = "execution_context"
+    with tempfile.TemporaryDirectory() as tmpdir:
+        base_dir = Path(tmpdir) / "research"
+        day_dir = base_dir / artifact / "2025" / "11" / "11"
+        _write_batches(day_dir, artifact, [[{"session_id": "s1", "t": n}] for n in range(5)])
+
+        results, _ = _compact_quietly(base_dir)
+        assert len(results) == 1 and results[0]["input_files"] == 5, results
+        manifest_path = base_dir / "manifests" / "2025-11-11.json"
+        compacted = {p.name: p.stat().st_mtime_ns for p in day_dir.iterdir()}
+        manifest = manifest_path.read_text()
+
+        results, output = _compact_quietly(base_dir)
+        assert results == [] and "Nothing to compact" in output, output
+        assert {p.name: p.stat().st_mtime_ns for p in day_dir.iterdir()} == compacted
+        assert manifest_path.read_text() == manifest
+
+    print("✓ Compaction rerun: nothing to compact")
+
+
+def run_all_tests():
+    """Run all tests."""
+    tests = [
+        ("QA Batch Retry", test_qa_batch_retries_incomplete_items),
+        ("Pool Affinity", test_pool_affinity),
+        ("Stream Retries", test_stream_retries),
+        ("Summary Store Hit Telemetry", test_summary_store_hit_telemetry),
+        ("Compaction Journal Recovery", test_compaction_journal_recovery),
+        ("Compaction Rerun", test_compaction_rerun_is_noop),
+    ]
+
+    passed = 0
+    failed = 0
+    for name, test_func in tests:
+        print(f"Test: {name}")
+        print("-" * 60)
+        try:
+            test_func()
+            print("✓ PASSED\n")
+            passed += 1
+        except AssertionError as e:
+            print(f"✗ FAILED: {e}\n")
+            failed += 1
+        except Exception as e:
+            print(f"✗ ERROR: {e}\n")
+            failed += 1
+
+    print(f"Results: {passed} passed, {failed} failed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    sys.exit(0 if run_all_tests() else 1)